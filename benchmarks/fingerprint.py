@@ -0,0 +1,44 @@
+"""Fingerprint benchmark.
+
+Computes the text and the fast fingerprint of volume projects created by
+``make_volume_project_from_slices``, with the slices in a list of sections, as
+by default, and in a compact file sequence.
+"""
+
+import time
+from pathlib import Path
+
+import vg_nde_sdk as sdk
+
+SLICE_COUNT = 100_000
+
+
+def _make_project(compact: bool) -> sdk.ProjectDescription:
+    return sdk.make_volume_project_from_slices(
+        slice_size=sdk.Vector2i(2048, 2048),
+        slices=[Path(f"/data/stack/slice{i:06d}.raw") for i in range(SLICE_COUNT)],
+        slice_format=sdk.VolumeFileFormat.Raw,
+        volume_resolution=sdk.Vector3f(1, 1, 1),
+        file_data_type=sdk.VolumeDataType.UInt16,
+        compact=compact,
+    )
+
+
+def main():
+    """Run the benchmark and print the timings."""
+    writer = sdk.xvgi.XVGIWriter()
+    print(f"{SLICE_COUNT} slices")
+    print(f"{'slices':>10} {'text [s]':>10} {'fast [s]':>10}")
+    for compact in (False, True):
+        project = _make_project(compact)
+        timings = []
+        for fast in (False, True):
+            start = time.perf_counter()
+            writer.fingerprint(project, fast=fast)
+            timings.append(time.perf_counter() - start)
+        storage = "sequence" if compact else "list"
+        print(f"{storage:>10} {timings[0]:>10.3f} {timings[1]:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Path storage benchmark.
+
+Compares memory use and write time of slice file names held as a list of
+``Path`` objects with the compact forms created by ``compact_paths``.
+"""
+
+import os
+import random
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, Sequence
+
+import vg_nde_sdk as sdk
+from vg_nde_sdk.sections import compact_paths
+
+SLICE_COUNT = 500_000
+
+
+def _numbered_names() -> List[str]:
+    return [
+        f"/data/scans/part_0042/slices/slice_{i:06d}.tif" for i in range(SLICE_COUNT)
+    ]
+
+
+def _unordered_names() -> List[str]:
+    names = _numbered_names()
+    random.Random(0).shuffle(names)  # noqa: S311
+    return names
+
+
+def _measure(name: str, make_names: Callable, store: Callable) -> None:
+    names = make_names()
+    tracemalloc.start()
+    file_names: Sequence[Path] = store(names)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del names
+
+    project = sdk.make_volume_project_from_slices(
+        sdk.Vector2i(1024, 1024),
+        [],
+        sdk.VolumeFileFormat.Tiff,
+        sdk.Vector3f(0.1, 0.1, 0.1),
+        sdk.VolumeDataType.UInt16,
+        compact=True,
+    )
+    volume = project.volumes.volumes[0]
+    volume.VolumeProjections = sdk.VolumeFileSequence(
+        volume.VolumeProjections.template, file_names  # type: ignore
+    )
+    writer = sdk.xvgi.XVGIWriter()
+    with open(os.devnull, "wb") as output:
+        start = time.perf_counter()
+        writer.dump_bytes(project, output)
+        elapsed = time.perf_counter() - start
+
+    print(f"{name:>20} {memory / 2**20:>12.2f} {elapsed:>10.3f}")
+
+
+def main():
+    """Run the benchmark and print the results."""
+    print(f"{SLICE_COUNT} slices")
+    print(f"{'storage':>20} {'memory [MB]':>12} {'write [s]':>10}")
+    _measure("paths", _numbered_names, lambda names: [Path(n) for n in names])
+    _measure("numbered", _numbered_names, compact_paths)
+    _measure("directory", _unordered_names, compact_paths)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Project variant benchmark.
+
+Compares time and memory of building per-part variants of a reconstruction
+project with ``copy.deepcopy`` and with ``ProjectDescription.evolve``.
+"""
+
+import copy
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List
+
+from vg_nde_sdk.projects import ProjectDescription
+from vg_nde_sdk.sections import (
+    ReconstructionProjectionFileSection,
+    ReconstructionSection,
+    ReconstructionSectionHolder,
+)
+
+PROJECTION_COUNT = 10_000
+VARIANT_COUNT = 20
+
+
+def _deepcopy_variant(template: ProjectDescription, name: str) -> ProjectDescription:
+    variant = copy.deepcopy(template)
+    variant.reconstructions.reconstructions[0].ObjectNameInScene = name
+    return variant
+
+
+def _evolve_variant(template: ProjectDescription, name: str) -> ProjectDescription:
+    return template.evolve("reconstructions.reconstructions.0.ObjectNameInScene", name)
+
+
+def _measure(
+    name: str,
+    make_variant: Callable[[ProjectDescription, str], ProjectDescription],
+    template: ProjectDescription,
+) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    variants: List[ProjectDescription] = [
+        make_variant(template, f"part{i}") for i in range(VARIANT_COUNT)
+    ]
+    duration = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del variants
+
+    print(f"{name:>10} {duration:>10.3f} {memory / 2**20:>12.2f}")
+
+
+def main():
+    """Run the benchmark and print the results."""
+    projections = [
+        ReconstructionProjectionFileSection(
+            ReconstructionProjectionInfoFileName=Path(f"/data/proj{i:05d}.tif"),
+            ReconstructionProjectionInfoValue=i * 0.036,
+        )
+        for i in range(PROJECTION_COUNT)
+    ]
+    template = ProjectDescription(
+        reconstructions=ReconstructionSectionHolder(
+            [ReconstructionSection(ProjectionFiles=projections)]
+        )
+    )
+
+    print(f"{VARIANT_COUNT} variants of {PROJECTION_COUNT} projections")
+    print(f"{'method':>10} {'time [s]':>10} {'memory [MB]':>12}")
+    _measure("deepcopy", _deepcopy_variant, template)
+    _measure("evolve", _evolve_variant, template)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Projection table benchmark.
+
+Compares memory use and write time of a reconstruction project holding its
+projections as ``ReconstructionProjectionFileSection`` objects with the same
+project holding them in a columnar ``ProjectionTable``.
+"""
+
+import os
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Sequence
+
+import vg_nde_sdk as sdk
+from vg_nde_sdk.sections import (
+    ProjectionTable,
+    ReconstructionProjectionFileSection,
+    ReconstructionSection,
+)
+
+PROJECTION_COUNT = 20_000
+
+
+def _as_sections(
+    file_names: Sequence[str], angles: Sequence[float]
+) -> Sequence[ReconstructionProjectionFileSection]:
+    return [
+        ReconstructionProjectionFileSection(
+            ReconstructionProjectionInfoFileName=Path(f),
+            ReconstructionProjectionInfoValue=a,
+        )
+        # compatibility with Python 3.9
+        for f, a in zip(file_names, angles)  # noqa: B905
+    ]
+
+
+def _as_table(file_names: Sequence[str], angles: Sequence[float]) -> ProjectionTable:
+    return ProjectionTable(file_names, angles)
+
+
+def _measure(name: str, make_projections: Callable) -> None:
+    tracemalloc.start()
+    file_names = [f"/data/projections/p{i:05d}.raw" for i in range(PROJECTION_COUNT)]
+    angles = [i * 360 / PROJECTION_COUNT for i in range(PROJECTION_COUNT)]
+    projections = make_projections(file_names, angles)
+    del angles
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    project = sdk.ProjectDescription(
+        reconstructions=sdk.sections.ReconstructionSectionHolder(
+            [ReconstructionSection(ProjectionFiles=projections)]
+        )
+    )
+    writer = sdk.xvgi.XVGIWriter()
+    with open(os.devnull, "wt", encoding="utf-8") as output:
+        start = time.perf_counter()
+        writer.dump(project, output)
+        elapsed = time.perf_counter() - start
+
+    print(f"{name:>10} {memory / 2**20:>12.2f} {elapsed:>10.3f}")
+
+
+def main():
+    """Run the benchmark and print the results."""
+    print(f"{PROJECTION_COUNT} projections")
+    print(f"{'storage':>10} {'memory [MB]':>12} {'write [s]':>10}")
+    _measure("sections", _as_sections)
+    _measure("table", _as_table)
+
+
+if __name__ == "__main__":
+    main()
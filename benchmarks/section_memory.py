@@ -0,0 +1,46 @@
+"""Section memory benchmark.
+
+Compares the memory used by volume file sections with ``__slots__`` with the
+same sections holding their fields in an instance dict.
+"""
+
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+from pathlib import Path
+from typing import Callable, List
+
+from vg_nde_sdk.sections import VolumeFileSection
+
+SECTION_COUNT = 1_000_000
+
+_DictVolumeFileSection = make_dataclass(
+    "VolumeFileSection",
+    [
+        (f.name, f.type, field(default=f.default, default_factory=f.default_factory))
+        for f in fields(VolumeFileSection)
+    ],
+)
+
+
+def _measure(name: str, section_type: Callable, file_names: List[Path]) -> None:
+    tracemalloc.start()
+    sections = [section_type(FileName=f) for f in file_names]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sections
+
+    print(f"{name:>10} {memory / 2**20:>12.2f} {memory / SECTION_COUNT:>14.1f}")
+
+
+def main():
+    """Run the benchmark and print the results."""
+    # the file names are shared, only the sections themselves are measured
+    file_names = [Path(f"/data/slices/slice{i:07d}.raw") for i in range(SECTION_COUNT)]
+    print(f"{SECTION_COUNT} sections")
+    print(f"{'storage':>10} {'memory [MB]':>12} {'per section [B]':>14}")
+    _measure("dict", _DictVolumeFileSection, file_names)
+    _measure("slots", VolumeFileSection, file_names)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Streaming writer benchmark.
+
+Serializes volume projects with a growing number of file sections and reports
+the time spent per file section. With streaming serialization, the time per
+section stays constant, i.e. the total time grows linearly with the number of
+``VolumeFileSection`` objects.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import vg_nde_sdk as sdk
+
+SECTION_COUNTS = (1_000, 10_000, 100_000)
+
+
+def _make_project(section_count: int) -> sdk.ProjectDescription:
+    return sdk.make_volume_project_from_slices(
+        slice_size=sdk.Vector2i(2048, 2048),
+        slices=[Path(f"/data/stack/slice{i:06d}.raw") for i in range(section_count)],
+        slice_format=sdk.VolumeFileFormat.Raw,
+        volume_resolution=sdk.Vector3f(1, 1, 1),
+        file_data_type=sdk.VolumeDataType.UInt16,
+    )
+
+
+def main():
+    """Run the benchmark and print the timings."""
+    writer = sdk.xvgi.XVGIWriter()
+    print(f"{'sections':>10} {'total [s]':>10} {'per section [us]':>18}")
+    for section_count in SECTION_COUNTS:
+        project = _make_project(section_count)
+        with open(os.devnull, "wt", encoding="utf-8") as output:
+            start = time.perf_counter()
+            writer.dump(project, output)
+            elapsed = time.perf_counter() - start
+        per_section = elapsed / section_count * 1e6
+        print(f"{section_count:>10} {elapsed:>10.3f} {per_section:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
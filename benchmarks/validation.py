@@ -0,0 +1,56 @@
+"""Validation benchmark.
+
+Measures the validation of a volume of one million files, held as one section
+object per file and as a ``VolumeFileSequence``, next to writing the volume.
+"""
+
+import io
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable
+
+from vg_nde_sdk.projects import ProjectDescription, validate
+from vg_nde_sdk.sections import (
+    Vector3i,
+    Vectorf,
+    VolumeFileSection,
+    VolumeSection,
+    VolumeSectionHolder,
+)
+from vg_nde_sdk.serializers.xvgi import XVGIWriter
+
+FILE_COUNT = 1_000_000
+
+
+def _measure(name: str, function: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    function()
+    print(f"{name:>22} {time.perf_counter() - start:>10.3f}")
+
+
+def _project(files: object) -> ProjectDescription:
+    volume = VolumeSection(VolumeProjections=files)  # type: ignore
+    return ProjectDescription(volumes=VolumeSectionHolder([volume]))
+
+
+def main():
+    """Run the benchmark and print the results."""
+    template = VolumeFileSection(
+        FileName=Path(),
+        FileSize=Vector3i(2000, 2000, 1),
+        FilePositionList=Vectorf([0.5]),
+    )
+    file_names = [Path(f"/data/slices/slice{i:07d}.raw") for i in range(FILE_COUNT)]
+    sections = _project([replace(template, FileName=f) for f in file_names])
+    sequence = _project(VolumeFileSection.bulk(file_names, template))
+
+    print(f"{FILE_COUNT} files")
+    print(f"{'':>22} {'time [s]':>10}")
+    _measure("validate sections", lambda: validate(sections))
+    _measure("validate sequence", lambda: validate(sequence))
+    _measure("write sections", lambda: XVGIWriter().dump(sections, io.StringIO()))
+
+
+if __name__ == "__main__":
+    main()
@@ -102,8 +102,7 @@ def main():
     )
 
     writer = xvgi.XVGIWriter()
-    with open(targetXVGIFilepath, "wt+", encoding="utf-8") as output:
-        writer.dump(project, output)
+    writer.write_path(project, targetXVGIFilepath)
     print(f"Successfully wrote {targetXVGIFilepath}")
 
 
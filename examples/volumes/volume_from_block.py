@@ -29,8 +29,7 @@ def main():
     )
 
     writer = sdk.xvgi.XVGIWriter()
-    with open(targetXVGIFilepath, "wt+", encoding="utf-8") as output:
-        writer.dump(project_desc, output)
+    writer.write_path(project_desc, targetXVGIFilepath)
     print(f"Successfully wrote {targetXVGIFilepath}")
 
 
@@ -0,0 +1,136 @@
+"""Tests for project descriptions."""
+
+from pathlib import Path
+
+import pytest
+
+import vg_nde_sdk as sdk
+from vg_nde_sdk.projects import ProjectDescription
+from vg_nde_sdk.sections import (
+    ReconstructionProjectionFileSection,
+    ReconstructionSection,
+    ReconstructionSectionHolder,
+    Vector3f,
+    VolumeSection,
+    VolumeSectionHolder,
+)
+
+
+def test_evolve():
+    # GIVEN a project with a reconstruction of many projections and a volume
+    projections = [
+        ReconstructionProjectionFileSection(Path(f"/data/proj{i}.tif"), i * 0.5)
+        for i in range(1000)
+    ]
+    project = ProjectDescription(
+        volumes=VolumeSectionHolder([VolumeSection()]),
+        reconstructions=ReconstructionSectionHolder(
+            [ReconstructionSection(ProjectionFiles=projections)]
+        ),
+    )
+
+    # WHEN I evolve variants with a different name and scan position
+    path = "reconstructions.reconstructions.0"
+    named = project.evolve(f"{path}.ObjectNameInScene", "part")
+    moved = named.evolve(f"{path}.VolumeTranslation.2", 2.0)
+
+    # THEN the variants hold the new values
+    reconstruction = moved.reconstructions.reconstructions[0]
+    assert reconstruction.ObjectNameInScene == "part"
+    assert reconstruction.VolumeTranslation == Vector3f(0, 0, 2.0)
+
+    # AND the original project is unchanged
+    original = project.reconstructions.reconstructions[0]
+    assert original.ObjectNameInScene == ""
+    assert original.VolumeTranslation == Vector3f(0, 0, 0)
+
+    # AND everything off the path is shared
+    assert reconstruction.ProjectionFiles is projections
+    assert moved.volumes is project.volumes
+    assert moved.version is project.version
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_evolve_helper_projects(compact: bool):
+    # GIVEN projects created by the helpers, with or without compact sequences
+    reconstruction_project = sdk.make_reconstruction_project_from_projections(
+        distance_source_object=100,
+        distance_object_detector=200,
+        projection_file_number_of_pixels=sdk.Vector2i(10, 10),
+        projection_file_physical_size=sdk.Vector2f(1, 1),
+        result_number_of_voxels=sdk.Vector3i(10, 10, 10),
+        reconstruction_base_filename="result",
+        projections=[Path(f"/data/p{i}.raw") for i in range(4)],
+        compact=compact,
+    )
+    volume_project = sdk.make_volume_project_from_slices(
+        slice_size=sdk.Vector2i(10, 10),
+        slices=[Path(f"/data/s{i}.raw") for i in range(4)],
+        slice_format=sdk.VolumeFileFormat.Raw,
+        volume_resolution=sdk.Vector3f(1, 1, 1),
+        file_data_type=sdk.VolumeDataType.UInt16,
+        compact=compact,
+    )
+
+    # WHEN I evolve single projections and slices
+    angle = reconstruction_project.evolve(
+        "reconstructions.reconstructions.0.ProjectionFiles.1"
+        ".ReconstructionProjectionInfoValue",
+        45.0,
+    )
+    option = reconstruction_project.evolve(
+        "reconstructions.reconstructions.0.ProjectionFiles.2"
+        ".ReconstructionProjectionInfoOption",
+        True,
+    )
+    renamed = volume_project.evolve(
+        "volumes.volumes.0.VolumeProjections.1.FileName", Path("/other/s1.raw")
+    )
+    swapped = volume_project.evolve(
+        "volumes.volumes.0.VolumeProjections.1.FileEndian", sdk.VolumeEndian.Big
+    )
+
+    # THEN the variants hold the new values, in the same kind of sequence
+    # as long as it can store them
+    projections = angle.reconstructions.reconstructions[0].ProjectionFiles
+    options = option.reconstructions.reconstructions[0].ProjectionFiles
+    slices = renamed.volumes.volumes[0].VolumeProjections
+    assert [p.ReconstructionProjectionInfoValue for p in projections] == [
+        0.0,
+        45.0,
+        180.0,
+        270.0,
+    ]
+    assert [p.ReconstructionProjectionInfoOption for p in options] == [
+        False,
+        False,
+        True,
+        False,
+    ]
+    assert [s.FileName for s in slices] == [
+        Path("/data/s0.raw"),
+        Path("/other/s1.raw"),
+        Path("/data/s2.raw"),
+        Path("/data/s3.raw"),
+    ]
+    if compact:
+        assert type(projections) is sdk.sections.ProjectionTable
+        assert type(slices) is sdk.VolumeFileSequence
+    else:
+        assert type(projections) is list
+        assert type(slices) is list
+
+    # AND a slice differing in more than the name turns the sequence into a list
+    swapped_slices = swapped.volumes.volumes[0].VolumeProjections
+    assert type(swapped_slices) is list
+    assert [s.FileEndian for s in swapped_slices][:2] == [
+        sdk.VolumeEndian.Little,
+        sdk.VolumeEndian.Big,
+    ]
+
+    # AND the originals are unchanged
+    original = reconstruction_project.reconstructions.reconstructions[0]
+    assert original.ProjectionFiles[1].ReconstructionProjectionInfoValue == 90.0
+    assert not original.ProjectionFiles[2].ReconstructionProjectionInfoOption
+    original_slices = list(volume_project.volumes.volumes[0].VolumeProjections)
+    assert original_slices[1].FileName == Path("/data/s1.raw")
@@ -0,0 +1,142 @@
+"""Tests for project validation."""
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from vg_nde_sdk.projects import ProjectDescription, get_path, validate
+from vg_nde_sdk.sections import (
+    ReconstructionROISection,
+    ReconstructionSection,
+    ReconstructionSectionHolder,
+    Vector3i,
+    Vectorf,
+    VolumeFileSection,
+    VolumeSection,
+    VolumeSectionHolder,
+    freeze,
+)
+
+_VALID_FILE = VolumeFileSection(
+    FileName=Path("/data/slice.raw"),
+    FileSize=Vector3i(10, 10, 2),
+    FilePositionList=Vectorf([0.0, 0.5]),
+)
+
+
+def _volume_project(
+    *files: VolumeFileSection, **settings: object
+) -> ProjectDescription:
+    volume = VolumeSection(VolumeProjections=list(files), **settings)  # type: ignore
+    return ProjectDescription(volumes=VolumeSectionHolder([volume]))
+
+
+def test_valid_project():
+    # GIVEN a volume and a reconstruction meeting all requirements
+    project = replace(
+        _volume_project(_VALID_FILE, _VALID_FILE),
+        reconstructions=ReconstructionSectionHolder(
+            [
+                ReconstructionSection(
+                    AxisAlignedRois=[
+                        ReconstructionROISection(Vector3i(0, 0, 0), Vector3i(5, 5, 5))
+                    ]
+                )
+            ]
+        ),
+    )
+
+    # WHEN I validate it
+    # THEN there are no violations
+    assert validate(project) == []
+
+
+def test_all_violations_reported():
+    # GIVEN a volume violating several requirements
+    files = [
+        _VALID_FILE,
+        replace(_VALID_FILE, FileSize=Vector3i(0, 0, 0)),
+        replace(_VALID_FILE, FilePositionList=Vectorf([0.0])),
+        replace(_VALID_FILE, FilePositionList=Vectorf()),
+    ]
+    project = _volume_project(
+        *files,
+        VolumeRegionOfInterestMin=Vector3i(5, 0, 0),
+        VolumeRegionOfInterestMax=Vector3i(1, 9, 9),
+    )
+
+    # WHEN I validate it
+    violations = validate(project)
+
+    # THEN every violation is reported at the path of its value
+    files_path = "volumes.volumes.0.VolumeProjections"
+    assert {v.path for v in violations} == {
+        "volumes.volumes.0.VolumeRegionOfInterestMin",
+        f"{files_path}.1.FileSize",
+        f"{files_path}.1.FilePositionList",
+        f"{files_path}.2.FilePositionList",
+        files_path,
+    }
+    for violation in violations:
+        assert get_path(project, violation.path) is not None
+
+
+def test_frozen_project_validated():
+    # GIVEN a frozen volume with files with and without position lists
+    files = [_VALID_FILE, replace(_VALID_FILE, FilePositionList=Vectorf())]
+    project = _volume_project(*files)
+    frozen = freeze(project)
+
+    # WHEN I validate it
+    violations = validate(frozen)
+
+    # THEN the violations are the same as for the original
+    assert violations == validate(project)
+    assert [v.path for v in violations] == ["volumes.volumes.0.VolumeProjections"]
+
+
+def test_file_sequence_validated_by_template():
+    # GIVEN a large file sequence with an invalid template
+    template = replace(_VALID_FILE, FileSize=Vector3i(10, 0, 2))
+    files = VolumeFileSection.bulk(
+        [Path(f"/data/slice{i}.raw") for i in range(100_000)], template
+    )
+    project = ProjectDescription(
+        volumes=VolumeSectionHolder([VolumeSection(VolumeProjections=files)])
+    )
+
+    # WHEN I validate it
+    violations = validate(project)
+
+    # THEN the template is reported once
+    assert [v.path for v in violations] == [
+        "volumes.volumes.0.VolumeProjections.template.FileSize"
+    ]
+
+
+@pytest.mark.parametrize(
+    "minimum, maximum, valid",
+    [
+        (Vector3i(0, 0, 0), Vector3i(-1, -1, -1), True),
+        (Vector3i(1, 2, 3), Vector3i(1, 2, 3), True),
+        (Vector3i(1, 2, 3), Vector3i(1, 1, 3), False),
+        (Vector3i(0, 0, 0), Vector3i(-1, 0, 0), False),
+    ],
+)
+def test_region_of_interest(minimum: Vector3i, maximum: Vector3i, valid: bool):
+    # GIVEN a reconstruction with a region of interest
+    project = ProjectDescription(
+        reconstructions=ReconstructionSectionHolder(
+            [
+                ReconstructionSection(
+                    ReconstructionRegionOfInterestMin=minimum,
+                    ReconstructionRegionOfInterestMax=maximum,
+                )
+            ]
+        )
+    )
+
+    # WHEN I validate it
+    # THEN only an upper bound below the lower bound is reported
+    assert (validate(project) == []) == valid
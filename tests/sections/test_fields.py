@@ -0,0 +1,52 @@
+"""Tests for section field access."""
+
+import copy
+import pickle  # noqa: S403
+from dataclasses import fields, replace
+from pathlib import Path
+
+import pytest
+
+from vg_nde_sdk.sections import (
+    MeshSection,
+    ReconstructionProjectionFileSection,
+    ReconstructionROISection,
+    ScanInfoSection,
+    Vector3i,
+    VolumeFileSection,
+)
+from vg_nde_sdk.sections.fields import field_values
+
+
+@pytest.mark.parametrize(
+    "section",
+    [
+        VolumeFileSection(FileName=Path("/a.raw"), FileSize=Vector3i(1, 2, 3)),
+        MeshSection(FileName=Path("/a.stl")),
+        ReconstructionROISection(ReconstructionRegionOfInterestListCustomName="a"),
+        ReconstructionProjectionFileSection(
+            ReconstructionProjectionInfoFileName=Path("/a.raw")
+        ),
+    ],
+)
+def test_slotted_sections(section: object):
+    # GIVEN a section of a type usually created in large numbers
+    # WHEN I look at its storage
+    # THEN it has slots instead of an instance dict
+    assert not hasattr(section, "__dict__")
+
+    # AND it still behaves like a dataclass
+    values = field_values(section)
+    assert list(values) == [f.name for f in fields(section)]  # type: ignore
+    assert replace(section) == section  # type: ignore
+    assert copy.deepcopy(section) == section
+    assert pickle.loads(pickle.dumps(section)) == section  # noqa: S301
+
+
+def test_field_values_of_dict_sections():
+    # GIVEN a section with an instance dict
+    section = ScanInfoSection(TubeVoltage="50")
+
+    # WHEN I get its field values
+    # THEN they are the same as its attributes
+    assert field_values(section) == vars(section)
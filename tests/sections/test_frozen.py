@@ -0,0 +1,121 @@
+"""Tests for frozen sections."""
+
+import io
+import pickle  # noqa: S403
+from dataclasses import FrozenInstanceError, replace
+from pathlib import Path
+
+import pytest
+
+import vg_nde_sdk as sdk
+from vg_nde_sdk.sections import (
+    FrozenMapping,
+    ProjectionTable,
+    ReconstructionSection,
+    ReconstructionSectionHolder,
+    freeze,
+    frozen_type,
+)
+from vg_nde_sdk.serializers.xvgi import XVGIWriter
+
+
+def _volume(metadata: dict) -> sdk.VolumeSection:
+    volume = sdk.VolumeSection(
+        VolumeProjections=[sdk.VolumeFileSection(FileName=Path("a.raw"))]
+    )
+    volume.VolumeMetaInfo.ComponentInfo.Metadata = metadata
+    return volume
+
+
+def test_freeze():
+    # GIVEN a volume section with metadata
+    volume = _volume({"Part": "1"})
+
+    # WHEN I freeze it
+    frozen = freeze(volume)
+
+    # THEN it is an immutable, hashable instance of the section class
+    assert isinstance(frozen, sdk.VolumeSection)
+    assert type(frozen) is frozen_type(sdk.VolumeSection)
+    assert type(frozen).__name__ == "VolumeSection"
+    assert frozen == volume
+    assert frozen.VolumeMetaInfo.ComponentInfo.Metadata == {"Part": "1"}
+    assert isinstance(frozen.VolumeMetaInfo.ComponentInfo.Metadata, FrozenMapping)
+    assert isinstance(frozen.VolumeProjections, tuple)
+    with pytest.raises(FrozenInstanceError):
+        frozen.VolumeProjections = ()  # type: ignore
+    with pytest.raises(FrozenInstanceError):
+        frozen.VolumeMetaInfo.ComponentInfo.Description = "changed"
+
+    # AND freezing it again returns it as it is
+    assert freeze(frozen) is frozen
+
+    # AND the original remains mutable
+    volume.VolumeMetaInfo.ComponentInfo.Metadata["Part"] = "2"  # type: ignore
+    assert frozen.VolumeMetaInfo.ComponentInfo.Metadata == {"Part": "1"}
+
+
+def test_freeze_deduplicates():
+    # GIVEN equal and different sections, frozen separately
+    first = freeze(_volume({"Part": "1"}))
+    second = freeze(_volume({"Part": "1"}))
+    other = freeze(_volume({"Part": "2"}))
+
+    # WHEN I use them as dict keys
+    distinct = dict.fromkeys([first, second, other])
+
+    # THEN equal sections share one key
+    assert list(distinct) == [first, other]
+    assert hash(first) == hash(second)
+
+    # AND copies made by replace or pickle are frozen and equal
+    assert replace(first) == first
+    assert hash(replace(first)) == hash(first)
+    assert pickle.loads(pickle.dumps(first)) == first  # noqa: S301
+
+
+def test_freeze_project_writes_same_file():
+    # GIVEN a project with compact sequences of files and projections
+    template = sdk.VolumeFileSection(FileName=Path(), FileSize=sdk.Vector3i(4, 4, 1))
+    files = sdk.VolumeFileSequence.from_pattern(template, "s%02d.raw", range(3))
+    projections = ProjectionTable(["p0.tif", "p1.tif"], [0.0, 180.0], [True, False])
+    project = sdk.ProjectDescription(
+        volumes=sdk.VolumeSectionHolder([sdk.VolumeSection(VolumeProjections=files)]),
+        reconstructions=ReconstructionSectionHolder(
+            [ReconstructionSection(ProjectionFiles=projections)]
+        ),
+    )
+
+    # WHEN I freeze it
+    frozen = freeze(project)
+
+    # THEN the sequences keep their compact form
+    volume = frozen.volumes.volumes[0]
+    reconstruction = frozen.reconstructions.reconstructions[0]
+    assert isinstance(volume.VolumeProjections, sdk.VolumeFileSequence)
+    assert isinstance(reconstruction.ProjectionFiles, ProjectionTable)
+    assert hash(frozen) == hash(freeze(project))
+
+    # AND it is written the same as the original
+    original, copy = io.StringIO(), io.StringIO()
+    XVGIWriter().dump(project, original)
+    XVGIWriter().dump(frozen, copy)
+    assert copy.getvalue() == original.getvalue()
+
+
+def test_freeze_numpy():
+    numpy = pytest.importorskip("numpy")
+
+    # GIVEN a file section with positions in a writable numpy array
+    positions = numpy.array([0.5, 1.5])
+    section = sdk.VolumeFileSection(
+        FileName=Path("a.raw"), FilePositionList=positions  # type: ignore
+    )
+
+    # WHEN I freeze it and change the array
+    frozen = freeze(section)
+    positions[0] = 2.5
+
+    # THEN the frozen section holds a copy of the positions
+    assert frozen.FilePositionList == [0.5, 1.5]
+    hash(frozen)
@@ -0,0 +1,102 @@
+"""Tests for compact file name collections."""
+
+from pathlib import Path, PurePath, PurePosixPath, PureWindowsPath
+from typing import List
+
+import pytest
+
+import vg_nde_sdk as sdk
+from vg_nde_sdk.sections import DirectoryFileNames, NumberedFileNames, compact_paths
+from vg_nde_sdk.serializers.xvgi.sections.paths import encode_file_names
+
+
+@pytest.mark.parametrize(
+    "paths, expected_type",
+    [
+        ([f"/data/s{i:04d}.raw" for i in range(10)], NumberedFileNames),
+        ([f"data%/s{i}%.raw" for i in range(5, 50, 5)], NumberedFileNames),
+        ([f"s{i}.raw" for i in range(3, 0, -1)], NumberedFileNames),
+        (["/data/a.raw", "/data/b.raw", "/data/c.raw"], DirectoryFileNames),
+        (["/data/a.raw", "/data/b.raw", "/data//c.raw"], list),
+        (["./data/s1.raw", "./data/s2.raw"], list),
+        (["/data/s1.raw", "/data/s02.raw"], DirectoryFileNames),
+        (["/data/s1.raw", "/data/s2.raw", "/data/s4.raw"], DirectoryFileNames),
+        (["/data/a.raw", "/other/b.raw", "c.raw"], list),
+        (["/data/a/", "/data/b/."], list),
+        (["/data/a.raw", "/"], list),
+    ],
+)
+def test_compact_paths(paths: List[str], expected_type: type):
+    # GIVEN file names
+    # WHEN I store them compactly
+    compact = compact_paths(paths)
+
+    # THEN they are stored in the expected form, but still the same paths,
+    # which are written as given
+    assert type(compact) is expected_type
+    assert [str(p) for p in compact] == paths
+    assert [str(p) for p in compact[1:]] == paths[1:]
+    assert str(compact[-1]) == paths[-1]
+    assert list(encode_file_names(compact)) == paths
+
+
+@pytest.mark.parametrize(
+    "paths, expected_type, expected",
+    [
+        (
+            [PureWindowsPath(f"C:\\data\\p{i}.raw") for i in range(3)],
+            DirectoryFileNames,
+            ["C:/data/p0.raw", "C:/data/p1.raw", "C:/data/p2.raw"],
+        ),
+        (
+            [PureWindowsPath(f"\\\\server\\share\\s{i}.raw") for i in range(2)],
+            DirectoryFileNames,
+            ["//server/share/s0.raw", "//server/share/s1.raw"],
+        ),
+        (
+            [PureWindowsPath("C:/data/a.raw"), PurePosixPath("C:/data/b.raw")],
+            list,
+            ["C:/data/a.raw", "C:/data/b.raw"],
+        ),
+    ],
+)
+def test_compact_paths_keep_flavor(
+    paths: List[PurePath], expected_type: type, expected: List[str]
+):
+    # GIVEN parsed paths of a foreign or of mixed flavors
+    # WHEN I store them compactly
+    compact = compact_paths(paths)
+
+    # THEN they keep their flavor, and are written the same as the paths
+    assert type(compact) is expected_type
+    assert list(compact) == paths
+    assert list(encode_file_names(compact)) == expected
+
+
+def test_serialize_compact_paths():
+    # GIVEN projects with plain and compact slice paths
+    slices = [Path(f"/foo/bar/slice{i:04d}.raw") for i in range(20)]
+    shuffled = slices[::2] + slices[1::2]
+
+    def make_project(paths: List[Path]) -> sdk.ProjectDescription:
+        project = sdk.make_volume_project_from_slices(
+            slice_size=sdk.Vector2i(100, 100),
+            slices=paths,
+            slice_format=sdk.VolumeFileFormat.Raw,
+            volume_resolution=sdk.Vector3f(0.1, 0.1, 0.1),
+            file_data_type=sdk.VolumeDataType.UInt16,
+            compact=True,
+        )
+        return project
+
+    writer = sdk.xvgi.XVGIWriter()
+    for paths in (slices, shuffled):
+        project = make_project(paths)
+        expected_project = make_project(paths)
+        expected_project.volumes.volumes[0].VolumeProjections = list(
+            project.volumes.volumes[0].VolumeProjections
+        )
+
+        # WHEN I serialize them
+        # THEN the output is the same
+        assert writer.dumps(project) == writer.dumps(expected_project)
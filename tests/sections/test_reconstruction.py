@@ -0,0 +1,79 @@
+"""Tests for reconstruction sections."""
+
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
+import pytest
+
+import vg_nde_sdk as sdk
+
+
+def test_projection_table_sequence():
+    # GIVEN a projection table
+    table = sdk.sections.ProjectionTable(
+        [Path("p0.raw"), Path("p1.raw"), Path("p2.raw")],
+        [0.0, 1.5, 3.0],
+        [False, True, False],
+    )
+
+    # WHEN I access the projections
+    # THEN they behave like a sequence of projection file sections
+    assert len(table) == 3
+    assert table[1] == sdk.sections.ReconstructionProjectionFileSection(
+        ReconstructionProjectionInfoFileName=Path("p1.raw"),
+        ReconstructionProjectionInfoValue=1.5,
+        ReconstructionProjectionInfoOption=True,
+    )
+    assert table[-1].ReconstructionProjectionInfoValue == 3.0
+    assert list(table[1:]) == list(table)[1:]
+    assert table == sdk.sections.ProjectionTable.from_sections(list(table))
+
+
+def test_projection_table_length_mismatch():
+    # GIVEN more file names than angles
+    # WHEN I construct a table
+    # THEN it is rejected
+    with pytest.raises(ValueError):
+        sdk.sections.ProjectionTable([Path("p0.raw"), Path("p1.raw")], [0.0])
+
+
+def test_projection_table_items_are_read_only():
+    # GIVEN a projection table
+    table = sdk.sections.ProjectionTable([Path("p0.raw")], [0.0])
+
+    # WHEN I change one of its projections
+    # THEN the change is rejected instead of being lost
+    with pytest.raises(FrozenInstanceError):
+        table[0].ReconstructionProjectionInfoOption = True
+    with pytest.raises(FrozenInstanceError):
+        next(iter(table)).ReconstructionProjectionInfoValue = 1.0
+    assert table.options == 0
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_make_reconstruction_project(compact: bool):
+    # GIVEN projection paths
+    paths = [Path(f"/data/p{i}.raw") for i in range(4)]
+
+    # WHEN I create a reconstruction project from them
+    project = sdk.make_reconstruction_project_from_projections(
+        distance_source_object=100,
+        distance_object_detector=200,
+        projection_file_number_of_pixels=sdk.Vector2i(10, 10),
+        projection_file_physical_size=sdk.Vector2f(1, 1),
+        result_number_of_voxels=sdk.Vector3i(10, 10, 10),
+        reconstruction_base_filename="result",
+        projections=paths,
+        compact=compact,
+    )
+
+    # THEN the projections are a list of sections, or a table if compact
+    projections = project.reconstructions.reconstructions[0].ProjectionFiles
+    assert type(projections) is (sdk.sections.ProjectionTable if compact else list)
+    assert [p.ReconstructionProjectionInfoFileName for p in projections] == paths
+    assert [p.ReconstructionProjectionInfoValue for p in projections] == [
+        0.0,
+        90.0,
+        180.0,
+        270.0,
+    ]
@@ -1,6 +1,7 @@
 """Tests for primitive types."""
 
 import copy
+import pickle  # noqa: S403
 
 import pytest
 
@@ -11,6 +12,7 @@ import vg_nde_sdk as sdk
     "t",
     [
         sdk.Vectorf([1, 2, 3, 4]),
+        sdk.CompactVectorf([1, 2, 3, 4]),
         sdk.Vector3f(1, 2, 3),
         sdk.Vector3i(1, 2, 3),
         sdk.Vector2f(1, 2),
@@ -31,6 +33,7 @@ def test_copy(t: object):
     "t",
     [
         sdk.Vectorf([1, 2, 3, 4]),
+        sdk.CompactVectorf([1, 2, 3, 4]),
         sdk.Vector3f(1, 2, 3),
         sdk.Vector3i(1, 2, 3),
         sdk.Vector2f(1, 2),
@@ -45,3 +48,67 @@ def test_deepcopy(t: object):
     # THEN I expect the objects to be distinct but contain the same data
     assert c is not t
     assert c == t
+
+
+def test_compact_vector_equals_vector():
+    # GIVEN a compact vector and a vector holding the same values
+    compact = sdk.CompactVectorf([1, 2.5, 3])
+    vector = sdk.Vectorf([1, 2.5, 3])
+
+    # THEN I expect them to be equal and to hash equally
+    assert compact == vector
+    assert hash(compact) == hash(vector)
+    assert list(compact) == list(vector)
+
+
+def test_compact_vector_deepcopy_is_independent():
+    numpy = pytest.importorskip("numpy")
+
+    # GIVEN a compact vector sharing the memory of a numpy array
+    values = numpy.arange(5, dtype=numpy.float64)
+    compact = sdk.CompactVectorf.from_numpy(values)
+
+    # WHEN I copy and deepcopy it and then change the array
+    shallow = copy.copy(compact)
+    deep = copy.deepcopy(compact)
+    values[0] = 42
+
+    # THEN only the deep copy keeps the original values
+    assert compact[0] == 42
+    assert shallow[0] == 42
+    assert deep[0] == 0
+
+
+def test_compact_vector_from_numpy_converts_type():
+    numpy = pytest.importorskip("numpy")
+
+    # GIVEN a numpy array of another dtype
+    values = numpy.arange(3, dtype=numpy.int32)
+
+    # WHEN I create a compact vector from it
+    compact = sdk.CompactVectorf.from_numpy(values)
+
+    # THEN the values have been converted to floats
+    assert compact == sdk.Vectorf([0.0, 1.0, 2.0])
+    assert compact.to_numpy().dtype == numpy.float64
+
+
+@pytest.mark.parametrize(
+    "t",
+    [
+        sdk.Vectorf([1, 2, 3, 4]),
+        sdk.CompactVectorf([1, 2, 3, 4]),
+        sdk.Vector3f(1, 2, 3),
+        sdk.Vector3i(1, 2, 3),
+        sdk.Vector2f(1, 2),
+        sdk.Vector2i(1, 2),
+    ],
+)
+def test_pickle(t: object):
+    # GIVEN an object
+    # WHEN I pickle and unpickle it
+    c = pickle.loads(pickle.dumps(t))  # noqa: S301
+
+    # THEN I expect an equal object of the same type
+    assert type(c) is type(t)
+    assert c == t
@@ -0,0 +1,91 @@
+"""Tests for volume sections."""
+
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
+import pytest
+
+import vg_nde_sdk as sdk
+
+
+def test_volume_file_sequence():
+    # GIVEN a lazy sequence of volume files
+    template = sdk.VolumeFileSection(FileName=Path(), FileSize=sdk.Vector3i(10, 10, 1))
+    files = sdk.VolumeFileSequence.from_pattern(template, "s%02d.raw", range(2, 6))
+
+    # WHEN I access the files
+    # THEN they are created from the template
+    assert len(files) == 4
+    assert files[0] == sdk.VolumeFileSection(
+        FileName=Path("s02.raw"), FileSize=sdk.Vector3i(10, 10, 1)
+    )
+    assert files[-1].FileName == Path("s05.raw")
+    assert list(files[1:3]) == list(files)[1:3]
+
+
+def test_volume_file_sequence_items_are_read_only():
+    # GIVEN a lazy sequence of volume files
+    template = sdk.VolumeFileSection(FileName=Path())
+    files = sdk.VolumeFileSequence.from_pattern(template, "s%02d.raw", range(2))
+
+    # WHEN I change one of its files
+    # THEN the change is rejected instead of being lost
+    with pytest.raises(FrozenInstanceError):
+        files[0].FileName = Path("changed.raw")
+    with pytest.raises(FrozenInstanceError):
+        next(iter(files)).FileHeaderSkip = 10
+    assert files[0].FileName == Path("s00.raw")
+    assert template.FileHeaderSkip == 0
+
+
+def test_volume_file_section_bulk():
+    # GIVEN files differing only in their names
+    template = sdk.VolumeFileSection(
+        FileName=Path(), FileDataType=sdk.VolumeDataType.Float
+    )
+    paths = [Path("a.raw"), Path("b.raw")]
+
+    # WHEN I describe them in bulk
+    files = sdk.VolumeFileSection.bulk(paths, template=template)
+
+    # THEN they equal individually described files
+    assert files == [
+        sdk.VolumeFileSection(FileName=p, FileDataType=sdk.VolumeDataType.Float)
+        for p in paths
+    ]
+    assert files.template is template
+
+
+def test_make_volume_project_from_slices():
+    # GIVEN slice paths
+    paths = [Path(f"/data/s{i}.raw") for i in range(4)]
+
+    def make_project(compact: bool) -> sdk.ProjectDescription:
+        return sdk.make_volume_project_from_slices(
+            slice_size=sdk.Vector2i(10, 20),
+            slices=paths,
+            slice_format=sdk.VolumeFileFormat.Raw,
+            volume_resolution=sdk.Vector3f(1, 1, 1),
+            file_data_type=sdk.VolumeDataType.UInt16,
+            compact=compact,
+        )
+
+    # WHEN I create volume projects from them, with and without compact
+    project = make_project(compact=False)
+    compact_project = make_project(compact=True)
+
+    # THEN the slices are a list of sections, or a sequence if compact
+    slices = project.volumes.volumes[0].VolumeProjections
+    compact_slices = compact_project.volumes.volumes[0].VolumeProjections
+    assert type(slices) is list
+    assert type(compact_slices) is sdk.VolumeFileSequence
+    assert [s.FileName for s in slices] == paths
+    assert list(compact_slices) == slices
+
+    # AND both are written the same
+    writer = sdk.xvgi.XVGIWriter()
+    assert writer.dumps(compact_project) == writer.dumps(project)
+
+    # AND the list can be changed
+    slices.append(sdk.VolumeFileSection(FileName=Path("/data/s4.raw")))
+    assert len(project.volumes.volumes[0].VolumeProjections) == 5
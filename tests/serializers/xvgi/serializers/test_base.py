@@ -2,15 +2,25 @@
 
 import os
 from configparser import ConfigParser
+from dataclasses import dataclass, field
 from os import PathLike
 from pathlib import Path, PurePosixPath, PureWindowsPath
-from typing import Mapping, Union
+from typing import Callable, Mapping, Union
 
 import pytest
 
-from vg_nde_sdk import Vector2f, Vector2i, Vector3f, Vector3i, Vectorf
+from vg_nde_sdk import (
+    CompactVectorf,
+    Vector2f,
+    Vector2i,
+    Vector3f,
+    Vector3i,
+    Vectorf,
+    VolumeFileSection,
+)
 from vg_nde_sdk.sections.reconstruction_enums import ReconstructionGeometricSetup
-from vg_nde_sdk.serializers.xvgi import SectionSerializerBase
+from vg_nde_sdk.serializers.xvgi import SectionSerializerBase, register_formatter
+from vg_nde_sdk.serializers.xvgi.sections import base
 
 escape_map = [
     (";", "\\;"),
@@ -151,12 +161,17 @@ def test_enum_serialization() -> None:
         (Vector3f(1, 2, 3), "1.0000000  2.0000000  3.0000000"),
         (Vector2f(1, 2), "1.0000000  2.0000000"),
         (Vectorf([1, 2, 3, 4]), "1.0000000  2.0000000  3.0000000  4.0000000"),
+        (
+            CompactVectorf([1, 2, 3, 4]),
+            "1.0000000  2.0000000  3.0000000  4.0000000",
+        ),
         (Vector3i(1, 2, 3), "1  2  3"),
         (Vector2i(1, 2), "1  2"),
     ],
 )
 def test_vector_serialization(
-    vector: Union[Vectorf, Vector2f, Vector3f, Vector2i, Vector3i], expected: str
+    vector: Union[Vectorf, CompactVectorf, Vector2f, Vector3f, Vector2i, Vector3i],
+    expected: str,
 ) -> None:
     # GIVEN a data to be serialized & serializer
     serializer = SectionSerializerBase()
@@ -220,3 +235,142 @@ def test_metadata() -> None:
 
     for k, v in metadata.items():
         assert parser[section_name][k] == v
+
+
+@dataclass
+class _Section:
+    Name: str = "a name"
+    Ratio: float = 0.5
+    Size: Vector3i = Vector3i(1, 2, 3)
+    Setup: ReconstructionGeometricSetup = ReconstructionGeometricSetup.RotateFrustum
+    Location: Path = Path("/foo/bar")
+    Metadata: Mapping[str, str] = field(default_factory=lambda: {"tag": "value"})
+
+
+def test_object_serialization_matches_mapping_serialization() -> None:
+    # GIVEN a section object & serializer & field renaming table
+    serializer = SectionSerializerBase()
+    section = _Section()
+    key_renaming = {"Ratio": "Some ratio", "Size": "100% size"}
+
+    # WHEN I serialize the object and its attribute mapping
+    from_object = serializer.serialize_object(
+        "test", section, key_renaming, section.Metadata, exclude=("Metadata",)
+    )
+    data = dict(vars(section))
+    metadata = data.pop("Metadata")
+    from_mapping = serializer.serialize_with_renaming_meta(
+        "test", data, key_renaming, metadata
+    )
+
+    # THEN both serializations are identical
+    assert from_object == from_mapping
+
+
+def test_object_serialization_reuses_plan() -> None:
+    # GIVEN a serializer that has serialized a section type once
+    serializer = SectionSerializerBase()
+    first = serializer.serialize_object("test", VolumeFileSection(Path("/a.raw")))
+
+    # WHEN I serialize another section of the same type
+    second = serializer.serialize_object("test", VolumeFileSection(Path("/b.raw")))
+
+    # THEN the values have been serialized with the same layout
+    assert first.replace("/a.raw", "/b.raw") == second
+
+
+@pytest.mark.parametrize(
+    "make_value, expected",
+    [
+        (lambda np: np.float32(0.5), "0.5"),
+        (lambda np: np.float64(0.1), "0.1"),
+        (lambda np: np.float32(0.1), "0.1"),
+        (lambda np: np.float16(0.1), "0.1"),
+        (lambda np: np.float32(1e20), "1e+20"),
+        (lambda np: np.array(0.1, dtype=np.float32), "0.1"),
+        (lambda np: np.int64(7), "7"),
+        (lambda np: np.bool_(True), "True"),
+        (lambda np: np.array(2.5), "2.5"),
+        (
+            lambda np: np.array([1, 2, 3], dtype=np.float32),
+            "1.0000000  2.0000000  3.0000000",
+        ),
+        (lambda np: np.array([1, 2, 3], dtype=np.int64), "1  2  3"),
+        (lambda np: np.array([1, 2], dtype=np.uint16), "1  2"),
+        (lambda np: np.zeros(100, dtype=bool), str([False] * 100)),
+    ],
+)
+def test_numpy_serialization(make_value: Callable, expected: str) -> None:
+    numpy = pytest.importorskip("numpy")
+
+    # GIVEN a numpy value to be serialized & serializer
+    serializer = SectionSerializerBase()
+    data: Mapping[str, object] = {"key": make_value(numpy)}
+
+    # WHEN I serialize it
+    serialized = serializer.serialize("test", data)
+
+    # THEN the value has been written like the according python value or vector
+    parser = ConfigParser()
+    parser.read_string(serialized)
+
+    assert parser["test"]["key"] == expected
+
+
+def test_numpy_array_dimensions() -> None:
+    numpy = pytest.importorskip("numpy")
+
+    # GIVEN a 2-D numpy array & serializer
+    serializer = SectionSerializerBase()
+    data: Mapping[str, object] = {"key": numpy.zeros((3, 3))}
+
+    # WHEN I serialize it
+    # THEN it is rejected instead of written over several lines
+    with pytest.raises(ValueError, match=r"shape \(3, 3\)"):
+        serializer.serialize("test", data)
+
+
+def test_numpy_formatters_registered_late(monkeypatch: pytest.MonkeyPatch) -> None:
+    numpy = pytest.importorskip("numpy")
+
+    # GIVEN numpy formatters not registered yet, a formatter resolved before
+    # and an array type derived from numpy outside of it
+    monkeypatch.setattr(base, "_numpy_registered", False)
+    monkeypatch.setitem(base._formatters, numpy.float32, lambda v: "stale")
+
+    class Angles(numpy.ndarray):  # type: ignore
+        pass
+
+    serializer = SectionSerializerBase()
+    angles = numpy.zeros(100, dtype=numpy.float32).view(Angles)
+
+    # WHEN I serialize values of both types
+    serialized = serializer.serialize(
+        "test", {"angles": angles, "angle": numpy.float32(0.1)}
+    )
+
+    # THEN both have been written by the numpy formatters
+    parser = ConfigParser()
+    parser.read_string(serialized)
+
+    assert parser["test"]["angles"] == "  ".join(["0.0000000"] * 100)
+    assert parser["test"]["angle"] == "0.1"
+
+
+class _Millimeters(float):
+    pass
+
+
+def test_register_formatter() -> None:
+    # GIVEN a formatter for a custom type & serializer
+    register_formatter(_Millimeters, lambda v: f"{float(v)} mm")
+    serializer = SectionSerializerBase()
+
+    # WHEN I serialize a value of that type
+    serialized = serializer.serialize("test", {"key": _Millimeters(2)})
+
+    # THEN it has been written by the formatter
+    parser = ConfigParser()
+    parser.read_string(serialized)
+
+    assert parser["test"]["key"] == "2.0 mm"
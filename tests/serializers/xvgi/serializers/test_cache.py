@@ -0,0 +1,93 @@
+"""Section cache tests."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from vg_nde_sdk import ScanInfoSection
+from vg_nde_sdk.serializers.xvgi import (
+    ScanInfoSectionSerializer,
+    SectionCache,
+    SectionSerializerBase,
+)
+
+
+@dataclass
+class _Section:
+    Value: object = None
+
+
+def test_cached_serialization_matches_uncached():
+    # GIVEN a serializer with a cache
+    cache = SectionCache()
+    serializer = ScanInfoSectionSerializer(cache=cache)
+    section = ScanInfoSection(TubeVoltage="50", Metadata={"tag": "content"})
+    expected = "".join(
+        ScanInfoSectionSerializer().iter_serialize_object("Scan0", section)
+    )
+
+    # WHEN I serialize the same content under different names
+    first = "".join(serializer.iter_serialize_object("Scan0", section))
+    second = "".join(serializer.iter_serialize_object("Scan1", section))
+
+    # THEN the output matches the uncached serialization
+    assert first == expected
+    assert second == expected.replace("[Scan0]", "[Scan1]")
+
+    # AND the second lookup is a hit
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "values", [(1, 1.0, True), (0.0, -0.0), ("1", 1), ((1, 2), (1.0, 2.0))]
+)
+def test_cache_distinguishes_equal_values_formatted_differently(values: tuple):
+    # GIVEN a serializer and a cache
+    serializer = SectionSerializerBase()
+    cache = SectionCache()
+
+    # WHEN I serialize sections with values comparing equal
+    serialized = [
+        serializer.serialize_object("S", _Section(v), cache=cache) for v in values
+    ]
+
+    # THEN each is formatted on its own
+    assert serialized == [serializer.serialize_object("S", _Section(v)) for v in values]
+    assert cache.hits == 0
+
+
+def test_cache_distinguishes_large_numpy_arrays():
+    numpy = pytest.importorskip("numpy")
+
+    # GIVEN a serializer, a cache and large arrays differing in one element
+    serializer = SectionSerializerBase()
+    cache = SectionCache()
+    first = numpy.zeros(10000)
+    second = first.copy()
+    second[5000] = 1
+
+    # WHEN I serialize sections holding them
+    serialized = [
+        serializer.serialize_object("S", _Section(v), cache=cache)
+        for v in (first, second)
+    ]
+
+    # THEN each is formatted on its own
+    assert serialized[0] != serialized[1]
+    assert cache.hits == 0
+
+
+def test_cache_evicts_least_recently_used():
+    # GIVEN a full cache
+    cache = SectionCache(maxsize=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+
+    # WHEN I use the older entry and add another one
+    assert cache.get("a") == "A"
+    cache.put("c", "C")
+
+    # THEN the least recently used entry is gone
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,70 @@
+"""Bulk formatting tests."""
+
+import random
+from array import array
+from typing import Iterable, List
+
+import pytest
+
+from vg_nde_sdk import Vectorf
+from vg_nde_sdk.serializers.xvgi.sections.formatting import format_floats
+
+
+def _reference_format(values: Iterable[float]) -> str:
+    # element-wise formatting as done before bulk formatting was introduced
+    def map_infinite_float(nr: float) -> float:
+        if nr == float("inf"):
+            return 3.402823e38
+        if nr == float("-inf"):
+            return 1.175494e-38
+        return nr
+
+    return "  ".join(f"{map_infinite_float(f):.7f}" for f in values)
+
+
+def _sample_values() -> List[float]:
+    rng = random.Random(42)  # noqa: S311
+    values = [rng.uniform(-1e3, 1e3) for _ in range(1000)]
+    values += [rng.uniform(-1e-9, 1e-9) for _ in range(100)]
+    values += [rng.uniform(-1e30, 1e30) for _ in range(100)]
+    values += [0.0, -0.0, 0.5, 1.25e-8, 0.00000005, 2.5, 1e300, -1e300]
+    values += [float("inf"), float("-inf"), float("nan"), 3.4028235e38]
+    rng.shuffle(values)
+    return values
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [],
+        [1, 2, 3, 4],
+        [float("inf")],
+        [float("-inf"), 0, float("inf")],
+        _sample_values(),
+    ],
+)
+@pytest.mark.parametrize("container", [list, tuple, Vectorf, lambda v: array("d", v)])
+def test_format_floats_matches_reference(values: List[float], container: type):
+    # GIVEN float values in some container
+    data = container(values)
+
+    # WHEN I format them in bulk
+    formatted = format_floats(data)
+
+    # THEN the result is the same as with element-wise formatting
+    assert formatted == _reference_format(data)
+
+
+@pytest.mark.parametrize("dtype", ["float64", "float32", "int32"])
+def test_format_floats_numpy_matches_reference(dtype: str):
+    numpy = pytest.importorskip("numpy")
+
+    # GIVEN a numpy array
+    with numpy.errstate(over="ignore", invalid="ignore"):
+        data = numpy.array(_sample_values()).astype(dtype)
+
+    # WHEN I format it in bulk
+    formatted = format_floats(data)
+
+    # THEN the result is the same as with element-wise formatting
+    assert formatted == _reference_format(data)
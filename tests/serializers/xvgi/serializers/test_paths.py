@@ -0,0 +1,67 @@
+"""Path formatting tests."""
+
+import random
+from pathlib import PurePath, PurePosixPath, PureWindowsPath
+from typing import Type
+
+import pytest
+
+from vg_nde_sdk.serializers.xvgi import PathEncoder
+
+_PATHS = [
+    "/data/stack/slice0001.raw",
+    "data//stack/./slice0001.raw",
+    "./slice.raw",
+    "slice.raw",
+    "//server/share/slice.raw",
+    "/data/stack/",
+    "/data/stack/.",
+    "C:\\data\\stack\\slice0001.raw",
+    "C:slice.raw",
+    "C:\\slice.raw",
+    "\\\\server\\share",
+    "\\\\server\\share\\slice.raw",
+    "\\\\?\\C:\\data\\slice.raw",
+]
+
+
+@pytest.mark.parametrize("flavor", [PurePosixPath, PureWindowsPath])
+def test_encode_matches_pure_path(flavor: Type[PurePath]):
+    # GIVEN an encoder and paths of all sorts
+    encoder = PathEncoder(flavor)
+    rng = random.Random(42)  # noqa: S311
+    atoms = ["a", "..", ".", "C:", "/", "\\", "\\\\", "x y", "?", ":"]
+    generated = [
+        "".join(rng.choice(atoms) for _ in range(rng.randint(1, 6)))
+        for _ in range(10000)
+    ]
+
+    # WHEN I encode them, twice to use the cached directories
+    # THEN they are the same as their POSIX form
+    for path in _PATHS + generated + _PATHS:
+        assert encoder.encode(path) == flavor(path).as_posix()
+
+
+def test_encode_bytes_and_path_objects():
+    # GIVEN an encoder
+    encoder = PathEncoder(PurePosixPath)
+
+    # WHEN I encode bytes and path objects
+    # THEN they are formatted like strings
+    assert encoder.encode(b"/data//slice.raw") == "/data/slice.raw"
+    assert encoder.encode(PureWindowsPath("C:\\slice.raw")) == "C:/slice.raw"
+    assert list(encoder.encode_all(["a/b", "a/c"])) == ["a/b", "a/c"]
+
+
+@pytest.mark.parametrize(
+    "pattern", ["/data/s%03d.raw", "s%d.raw", "/da%%ta/s%d%%.raw", "/data%d/s.raw"]
+)
+def test_encode_numbered(pattern: str):
+    # GIVEN an encoder
+    encoder = PathEncoder()
+
+    # WHEN I encode numbered paths
+    # THEN they are the same as their POSIX form
+    indices = range(8, 12)
+    expected = [PurePath(pattern % i).as_posix() for i in indices]
+    assert list(encoder.encode_numbered(pattern, indices)) == expected
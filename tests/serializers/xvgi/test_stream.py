@@ -0,0 +1,148 @@
+"""XVGI stream writer tests."""
+
+import io
+from dataclasses import replace
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import vg_nde_sdk as sdk
+from vg_nde_sdk.projects import ProjectDescription, ValidationError
+from vg_nde_sdk.sections import (
+    ReconstructionProjectionFileSection,
+    ReconstructionROISection,
+    ReconstructionSection,
+    ReconstructionSectionHolder,
+)
+from vg_nde_sdk.serializers.xvgi import XVGIStreamWriter, XVGIWriter
+
+
+class _RecordingFile(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.writes: List[int] = []
+
+    def write(self, data: bytes) -> int:  # type: ignore
+        self.writes.append(len(data))
+        return super().write(data)
+
+
+def _volume_files(count: int) -> List[sdk.VolumeFileSection]:
+    return [
+        sdk.VolumeFileSection(FileName=Path(f"/foo/slice{i:04d}.raw"))
+        for i in range(count)
+    ]
+
+
+def _projections(count: int) -> List[ReconstructionProjectionFileSection]:
+    return [
+        ReconstructionProjectionFileSection(
+            ReconstructionProjectionInfoFileName=Path(f"/foo/projection{i:04d}.raw"),
+            ReconstructionProjectionInfoValue=i * 0.5,
+        )
+        for i in range(count)
+    ]
+
+
+def test_stream_matches_writer():
+    # GIVEN volumes and a reconstruction with ROIs
+    volume = sdk.VolumeSection(VolumeResolution=sdk.Vector3f(0.1, 0.1, 0.1))
+    reconstruction = ReconstructionSection(AxisAlignedRois=[ReconstructionROISection()])
+    files = _volume_files(10)
+    projections = _projections(10)
+
+    # WHEN I stream them section by section
+    output = io.BytesIO()
+    with XVGIStreamWriter(output, max_sections=4) as stream:
+        stream.begin_volume(replace(volume, VolumeProjections=files[:3]))
+        for volume_file in files[3:]:
+            stream.add_volume_file(volume_file)
+        stream.begin_volume(volume)
+        stream.begin_reconstruction(reconstruction)
+        for projection in projections:
+            stream.add_projection(projection)
+
+    # THEN the file is the same as when writing the whole project at once
+    project = ProjectDescription(
+        volumes=sdk.VolumeSectionHolder(
+            [replace(volume, VolumeProjections=files), volume]
+        ),
+        reconstructions=ReconstructionSectionHolder(
+            [replace(reconstruction, ProjectionFiles=projections)]
+        ),
+    )
+    assert output.getvalue().decode("utf-8") == XVGIWriter().dumps(project)
+
+
+def test_stream_writes_while_adding():
+    # GIVEN a stream writer holding few sections
+    output = _RecordingFile()
+    stream = XVGIStreamWriter(output, max_sections=10)
+
+    # WHEN I add many files
+    stream.begin_volume(sdk.VolumeSection())
+    for volume_file in _volume_files(100):
+        stream.add_volume_file(volume_file)
+
+    # THEN they have been written in batches before closing
+    assert len(output.writes) == 10
+    stream.close()
+    assert b"ComponentInfoSection" in output.getvalue()
+
+    # AND nothing can be added anymore
+    with pytest.raises(ValueError):
+        stream.begin_volume(sdk.VolumeSection())
+
+
+def test_stream_continues_project(tmpdir: Path):
+    # GIVEN a project with a volume
+    project = ProjectDescription(volumes=sdk.VolumeSectionHolder([sdk.VolumeSection()]))
+    path = Path(tmpdir, "project.xvgi")
+
+    # WHEN I stream another volume after it
+    with XVGIStreamWriter(path, project_description=project) as stream:
+        # files can only be added to a begun volume
+        with pytest.raises(ValueError):
+            stream.add_volume_file(_volume_files(1)[0])
+        stream.begin_volume(sdk.VolumeSection())
+
+    # THEN the streamed volume continues the numbering
+    project.volumes.volumes = [sdk.VolumeSection(), sdk.VolumeSection()]
+    assert path.read_text(encoding="utf-8") == XVGIWriter().dumps(project)
+
+
+def test_stream_validates_sections():
+    # GIVEN a stream writer validating its sections, with a volume begun
+    output = io.BytesIO()
+    files = [replace(f, FileSize=sdk.Vector3i(4, 4, 1)) for f in _volume_files(2)]
+    stream = XVGIStreamWriter(output, writer=XVGIWriter(validate=True))
+    stream.begin_volume(replace(sdk.VolumeSection(), VolumeProjections=files[:1]))
+    stream.add_volume_file(files[1])
+
+    # WHEN I add a file without a size, a volume or a reconstruction with an
+    # empty region
+    # THEN they are rejected, and nothing of them is written
+    with pytest.raises(ValidationError, match="FileSize"):
+        stream.add_volume_file(_volume_files(1)[0])
+    with pytest.raises(ValidationError, match="VolumeRegionOfInterestMin"):
+        stream.begin_volume(
+            sdk.VolumeSection(VolumeRegionOfInterestMin=sdk.Vector3i(2, 2, 2))
+        )
+    with pytest.raises(ValidationError, match="AxisAlignedRois.0"):
+        stream.begin_reconstruction(
+            ReconstructionSection(
+                AxisAlignedRois=[
+                    ReconstructionROISection(
+                        ReconstructionRegionOfInterestListMinPosition=sdk.Vector3i(
+                            2, 2, 2
+                        )
+                    )
+                ]
+            )
+        )
+    stream.close()
+    project = ProjectDescription(
+        volumes=sdk.VolumeSectionHolder([sdk.VolumeSection(VolumeProjections=files)])
+    )
+    assert output.getvalue().decode("utf-8") == XVGIWriter().dumps(project)
@@ -1,13 +1,17 @@
 """XVGI reconstruction project tests."""
 
+from dataclasses import replace
 from pathlib import Path
+from typing import Any
 
 import pytest
 
-from vg_nde_sdk.projects import ProjectDescription
+from vg_nde_sdk.projects import ProjectDescription, replace_path
+from vg_nde_sdk.projecttools import make_reconstruction_project_from_projections
 from vg_nde_sdk.sections import (
     ComponentInfoSection,
     ManufacturerInfoSection,
+    ProjectionTable,
     ReconstructionAlgorithmicOptimizationMode,
     ReconstructionAlgorithmMode,
     ReconstructionBeamHardeningCorrectionMode,
@@ -50,6 +54,7 @@ from vg_nde_sdk.sections import (
     Vector3f,
     Vector3i,
     VolumeMetaInfoContainer,
+    freeze,
 )
 from vg_nde_sdk.serializers.xvgi import XVGIWriter
 
@@ -271,3 +276,160 @@ def test_serialize_reconstruction_project_to_file(
     serialized = output_file_name.read_text()
     assert len(serialized) > 0
     print(serialized)
+
+
+def test_serialize_projection_table(
+    reconstruction_project_description: ProjectDescription,
+):
+    # GIVEN a project with float projection angles
+    reconstruction = reconstruction_project_description.reconstructions.reconstructions[
+        0
+    ]
+    sections = [
+        replace(p, ReconstructionProjectionInfoValue=float(i) / 3)
+        for i, p in enumerate(reconstruction.ProjectionFiles)
+    ]
+    reconstruction.ProjectionFiles = sections
+    writer = XVGIWriter()
+    expected = writer.dumps(reconstruction_project_description)
+
+    # WHEN I store the same projections in a projection table
+    reconstruction.ProjectionFiles = ProjectionTable.from_sections(sections)
+    serialized = writer.dumps(reconstruction_project_description)
+
+    # THEN the output is the same
+    assert serialized == expected
+
+
+@pytest.mark.parametrize("numpy_type", [None, "float32", "int64"])
+def test_serialize_projection_table_angle_types(
+    reconstruction_project_description: ProjectDescription, numpy_type: str
+):
+    # GIVEN a project with integer angles, or numpy angles of another type
+    reconstruction = reconstruction_project_description.reconstructions.reconstructions[
+        0
+    ]
+    projections = list(reconstruction.ProjectionFiles)
+    angles: Any = [90 * i for i in range(len(projections))]
+    if numpy_type == "float32":
+        numpy = pytest.importorskip("numpy")
+        angles = numpy.arange(1, len(projections) + 1, dtype=numpy.float32) / 10
+    elif numpy_type:
+        numpy = pytest.importorskip("numpy")
+        angles = numpy.array(angles, dtype=numpy_type)
+    reconstruction.ProjectionFiles = [
+        replace(p, ReconstructionProjectionInfoValue=a)
+        for p, a in zip(projections, angles)  # noqa: B905
+    ]
+    writer = XVGIWriter()
+    expected = writer.dumps(reconstruction_project_description)
+
+    # WHEN I store the same angles in a projection table, or a frozen one
+    table = ProjectionTable(
+        [p.ReconstructionProjectionInfoFileName for p in projections],
+        angles,
+        [p.ReconstructionProjectionInfoOption for p in projections],
+    )
+    reconstruction.ProjectionFiles = table
+    serialized = writer.dumps(reconstruction_project_description)
+    reconstruction.ProjectionFiles = freeze(table)
+    serialized_frozen = writer.dumps(reconstruction_project_description)
+
+    # THEN the angles are written like the ones of the sections
+    assert serialized == expected
+    assert serialized_frozen == expected
+    assert ("ReconstructionProjectionInfoValue = 0.1\n" in serialized) == (
+        numpy_type == "float32"
+    )
+    assert ("ReconstructionProjectionInfoValue = 90\n" in serialized) == (
+        numpy_type != "float32"
+    )
+
+
+def test_prepared_reconstruction_project(
+    reconstruction_project_description: ProjectDescription,
+):
+    # GIVEN a project prepared with slots for the values changing per part
+    reconstruction = "reconstructions.reconstructions.0"
+    slots = {
+        "name": f"{reconstruction}.ObjectNameInScene",
+        "result": f"{reconstruction}.ReconstructionResultBaseFileName",
+        "serial": f"{reconstruction}.VolumeMetaInfo.ComponentInfo.Metadata.myNewTag",
+        "projection": f"{reconstruction}.ProjectionFiles.1"
+        ".ReconstructionProjectionInfoFileName",
+    }
+    writer = XVGIWriter()
+    prepared = writer.prepare(reconstruction_project_description, slots)
+
+    # WHEN I render a part
+    values = {
+        "name": "Part 17",
+        "result": "part_17",
+        "serial": "SN 0017",
+        "projection": Path("/parts/17/p001.raw"),
+    }
+    rendered = prepared.render(values)
+
+    # THEN it is the same as serializing the project with these values
+    project = reconstruction_project_description
+    for name, path in slots.items():
+        project = replace_path(project, path, values[name])
+    assert rendered == writer.dumps(project)
+
+
+def test_prepared_project_rejects_unwritten_slots(
+    reconstruction_project_description: ProjectDescription,
+):
+    # GIVEN two slots for the same value, so only the latter is written
+    path = "reconstructions.reconstructions.0.ObjectNameInScene"
+    slots = {"name": path, "other_name": path}
+
+    # WHEN I prepare the project
+    # THEN the slot is rejected
+    with pytest.raises(ValueError):
+        XVGIWriter().prepare(reconstruction_project_description, slots)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_prepared_helper_project(compact: bool):
+    # GIVEN a project created by the helper, with slots for single projections
+    project = make_reconstruction_project_from_projections(
+        distance_source_object=100,
+        distance_object_detector=200,
+        projection_file_number_of_pixels=Vector2i(10, 10),
+        projection_file_physical_size=Vector2f(1, 1),
+        result_number_of_voxels=Vector3i(10, 10, 10),
+        reconstruction_base_filename="result",
+        projections=[Path(f"/data/p{i}.raw") for i in range(4)],
+        compact=compact,
+    )
+    projection = "reconstructions.reconstructions.0.ProjectionFiles.1"
+    slots = {
+        "file": f"{projection}.ReconstructionProjectionInfoFileName",
+        "angle": f"{projection}.ReconstructionProjectionInfoValue",
+    }
+    writer = XVGIWriter()
+    prepared = writer.prepare(project, slots)
+
+    # WHEN I render it
+    values = {"file": Path("/parts/17/p1.raw"), "angle": 45.0}
+    rendered = prepared.render(values)
+
+    # THEN it is the same as serializing the project with these values
+    for name, path in slots.items():
+        project = replace_path(project, path, values[name])
+    assert rendered == writer.dumps(project)
+    assert "/parts/17/p1.raw" in rendered
+
+
+def test_prepared_project_rejects_vector_components(
+    reconstruction_project_description: ProjectDescription,
+):
+    # GIVEN a slot for a single component of a vector
+    path = "reconstructions.reconstructions.0.ReconstructionRegionOfInterestMax.0"
+    slots = {"width": path}
+
+    # WHEN I prepare the project
+    # THEN the slot is rejected, naming the vector
+    with pytest.raises(ValueError, match="ReconstructionRegionOfInterestMax"):
+        XVGIWriter().prepare(reconstruction_project_description, slots)
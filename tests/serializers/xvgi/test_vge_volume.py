@@ -1,21 +1,31 @@
 """XVGI volume project tests."""
 
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
+from typing import Callable
 
 import pytest
 
-from vg_nde_sdk.projects import ProjectDescription
+from vg_nde_sdk.projects import ProjectDescription, replace_path
+from vg_nde_sdk.projecttools import make_volume_project_from_slices
 from vg_nde_sdk.sections import (
     ComponentInfoSection,
     ManufacturerInfoSection,
     ScanInfoSection,
+    Vector2i,
+    Vector3f,
     Vectorf,
+    VolumeDataType,
+    VolumeFileFormat,
     VolumeFileSection,
+    VolumeFileSequence,
     VolumeMetaInfoContainer,
     VolumeSection,
     VolumeSectionHolder,
 )
 from vg_nde_sdk.serializers.xvgi import XVGIWriter
+from vg_nde_sdk.serializers.xvgi.sections import VolumeSectionSerializer
 
 
 @pytest.fixture()
@@ -111,3 +121,106 @@ def test_serialize_volume_project_to_file(
     assert output_file_name.exists()
     serialized = output_file_name.read_text()
     assert len(serialized) > 0
+
+
+def test_iter_chunks_volume_project(volume_project_description: ProjectDescription):
+    # GIVEN a volume and a serializer
+    writer = XVGIWriter()
+
+    # WHEN I serialize the project chunk by chunk
+    chunks = list(writer.iter_chunks(volume_project_description))
+
+    # THEN every chunk holds exactly one section
+    assert all(chunk.startswith("[") for chunk in chunks)
+    assert all(chunk.count("\n[") == 0 for chunk in chunks)
+
+    # AND the chunks add up to the complete serialization
+    assert "".join(chunks) == writer.dumps(volume_project_description)
+
+
+def test_serialize_lazy_volume_projections(
+    volume_project_description: ProjectDescription,
+):
+    # GIVEN a volume with files only differing in their names
+    volume = volume_project_description.volumes.volumes[0]
+    template = VolumeFileSection(FileName=Path())
+    sections = [
+        replace(template, FileName=Path(f"/foo/bar/slice{i:03d}.raw")) for i in range(5)
+    ]
+    volume.VolumeProjections = sections
+    writer = XVGIWriter()
+    expected = writer.dumps(volume_project_description)
+
+    # WHEN I describe the files lazily
+    lazy_projections = [
+        VolumeFileSequence.from_pattern(template, "/foo/bar/slice%03d.raw", range(5)),
+        (s for s in sections),
+    ]
+
+    # THEN the output is the same
+    for projections in lazy_projections:
+        volume.VolumeProjections = projections
+        assert writer.dumps(volume_project_description) == expected
+
+
+@pytest.mark.parametrize("executor_cls", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_serialize_volumes_concurrently(
+    volume_project_description: ProjectDescription,
+    executor_cls: Callable[[int], Executor],
+):
+    # GIVEN a project with many volumes
+    volume = volume_project_description.volumes.volumes[0]
+    volume_project_description.volumes.volumes = [
+        replace(volume, ObjectNameInScene=f"Volume {i}") for i in range(20)
+    ]
+    expected = XVGIWriter().dumps(volume_project_description)
+
+    # WHEN I serialize the volumes concurrently
+    with executor_cls(2) as executor:
+        writer = XVGIWriter(executor=executor)
+        chunks = list(writer.iter_chunks(volume_project_description))
+
+    # THEN the output is the same, still one section per chunk
+    assert "".join(chunks) == expected
+    assert all(chunk.count("\n[") == 0 for chunk in chunks)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_prepared_volume_project(compact: bool):
+    # GIVEN a project created by the helper, with a slot for a single slice
+    project = make_volume_project_from_slices(
+        slice_size=Vector2i(10, 10),
+        slices=[Path(f"/data/s{i}.raw") for i in range(4)],
+        slice_format=VolumeFileFormat.Raw,
+        volume_resolution=Vector3f(1, 1, 1),
+        file_data_type=VolumeDataType.UInt16,
+        compact=compact,
+    )
+    path = "volumes.volumes.0.VolumeProjections.2.FileName"
+    writer = XVGIWriter()
+    prepared = writer.prepare(project, {"slice": path})
+
+    # WHEN I render it
+    rendered = prepared.render({"slice": Path("/other/s2.raw")})
+
+    # THEN it is the same as serializing the project with the value
+    project = replace_path(project, path, Path("/other/s2.raw"))
+    assert rendered == writer.dumps(project)
+    assert "/other/s2.raw" in rendered
+
+
+def test_serialize_volume_mapping():
+    # GIVEN a partial volume mapping with an additional key
+    serializer = VolumeSectionSerializer()
+    data = {
+        "VolumeName": "volume",
+        "VolumeProjections": [VolumeFileSection(FileName=Path("/foo/s0.raw"))],
+    }
+
+    # WHEN I serialize it
+    serialized = serializer.serialize("VolumeSection0", data)
+
+    # THEN only the given keys are written, followed by the held sections
+    assert serialized.startswith("[VolumeSection0]\n\tVolumeName = volume\n\n")
+    assert "[VolumeSection0\\_FileSection0]" in serialized
+    assert "[VolumeSection0\\_ComponentInfoSection]" in serialized
@@ -0,0 +1,341 @@
+"""XVGI writer tests."""
+
+import asyncio
+import copy
+import io
+import json
+from dataclasses import replace
+from pathlib import Path
+from typing import Iterator, List, Mapping, cast
+
+import pytest
+
+import vg_nde_sdk as sdk
+from vg_nde_sdk.projects import ProjectDescription, ValidationError
+from vg_nde_sdk.serializers.xvgi import ChromeTrace, SectionStats, XVGIWriter
+from vg_nde_sdk.serializers.xvgi.sections import (
+    SectionSerializerBase,
+    VolumeSectionSerializer,
+)
+
+
+@pytest.fixture()
+def slice_project_description() -> ProjectDescription:
+    return sdk.make_volume_project_from_slices(
+        slice_size=sdk.Vector2i(100, 100),
+        slices=[Path(f"/foo/bar/slice{i:04d}.raw") for i in range(200)],
+        slice_format=sdk.VolumeFileFormat.Raw,
+        volume_resolution=sdk.Vector3f(0.1, 0.1, 0.1),
+        file_data_type=sdk.VolumeDataType.UInt16,
+    )
+
+
+@pytest.mark.parametrize("buffer_size", [1, 1000, 1 << 20])
+def test_dump_bytes(slice_project_description: ProjectDescription, buffer_size: int):
+    # GIVEN a project with non-ASCII content and a writer
+    volume = slice_project_description.volumes.volumes[0]
+    volume.ObjectNameInScene = "Volumen über alles"
+    writer = XVGIWriter()
+
+    # WHEN I write it into a binary file
+    output = io.BytesIO()
+    writer.dump_bytes(slice_project_description, output, buffer_size)
+
+    # THEN the file holds the UTF-8 encoded serialization
+    assert output.getvalue() == writer.dumps(slice_project_description).encode()
+
+
+def test_write_path(slice_project_description: ProjectDescription, tmpdir: Path):
+    # GIVEN a project and a writer
+    writer = XVGIWriter()
+    path = Path(tmpdir, "project.xvgi")
+
+    # WHEN I write it to a path
+    writer.write_path(slice_project_description, path)
+
+    # THEN the file holds the serialization
+    expected = writer.dumps(slice_project_description)
+    assert path.read_text(encoding="utf-8") == expected
+
+
+@pytest.mark.asyncio
+async def test_aiter_chunks(slice_project_description: ProjectDescription):
+    # GIVEN a project and a writer
+    writer = XVGIWriter()
+
+    # WHEN I iterate the chunks asynchronously
+    chunks = [c async for c in writer.aiter_chunks(slice_project_description, 16)]
+
+    # THEN they are the same as the synchronous ones
+    assert chunks == list(writer.iter_chunks(slice_project_description))
+
+
+@pytest.mark.asyncio
+async def test_adump_concurrently(
+    slice_project_description: ProjectDescription, tmpdir: Path
+):
+    # GIVEN a project and a writer
+    writer = XVGIWriter()
+    paths = [Path(tmpdir, f"project{i}.xvgi") for i in range(4)]
+
+    # WHEN I write several files concurrently
+    await asyncio.gather(
+        *(writer.adump(slice_project_description, p, batch_size=8) for p in paths)
+    )
+
+    # THEN every file holds the complete serialization
+    expected = writer.dumps(slice_project_description)
+    for p in paths:
+        assert p.read_text(encoding="utf-8") == expected
+
+
+def test_append(slice_project_description: ProjectDescription, tmpdir: Path):
+    # GIVEN a file holding two volumes
+    volume = slice_project_description.volumes.volumes[0]
+    volumes = [replace(volume, ObjectNameInScene=f"Volume {i}") for i in range(3)]
+    mesh = sdk.MeshSection(FileName=Path("/foo/bar/mesh.stl"))
+    slice_project_description.volumes.volumes = volumes[:2]
+    path = Path(tmpdir, "project.xvgi")
+    writer = XVGIWriter()
+    writer.write_path(slice_project_description, path)
+    original = path.read_bytes()
+
+    # WHEN I append another volume and a mesh
+    writer.append(path, [volumes[2], mesh])
+
+    # THEN the existing content is unchanged
+    appended = path.read_bytes()
+    assert appended.startswith(original)
+
+    # AND the file is the same as if all had been written at once
+    slice_project_description.volumes.volumes = volumes
+    slice_project_description.meshes.meshes = [mesh]
+    assert appended.decode("utf-8") == writer.dumps(slice_project_description)
+
+
+def test_write_if_changed(slice_project_description: ProjectDescription, tmpdir: Path):
+    # GIVEN a written project
+    path = Path(tmpdir, "project.xvgi")
+    writer = XVGIWriter()
+    created = writer.write_if_changed(slice_project_description, path)
+    assert created.written
+    mtime = path.stat().st_mtime_ns
+
+    # WHEN I write it again unchanged
+    unchanged = writer.write_if_changed(slice_project_description, path)
+
+    # THEN the file is not touched
+    assert not unchanged.written
+    assert (unchanged.changed, unchanged.added, unchanged.removed) == ((), (), ())
+    assert path.stat().st_mtime_ns == mtime
+
+    # WHEN I change a parameter and drop slices
+    volume = slice_project_description.volumes.volumes[0]
+    volume.VolumeSourceRange = sdk.Vector2f(0, 1000)
+    volume.VolumeProjections = list(volume.VolumeProjections)[:-2]
+    changes = writer.write_if_changed(slice_project_description, path)
+
+    # THEN the differing sections are reported and the file is rewritten
+    assert changes.written
+    assert changes.changed == ("VolumeSection0",)
+    assert changes.added == ()
+    assert changes.removed == (
+        "VolumeSection0\\_FileSection198",
+        "VolumeSection0\\_FileSection199",
+    )
+    assert path.read_text(encoding="utf-8") == writer.dumps(slice_project_description)
+
+
+def test_section_stats(slice_project_description: ProjectDescription):
+    # GIVEN a writer with a statistics collector
+    stats = SectionStats()
+    writer = XVGIWriter(observer=stats)
+
+    # WHEN I write a project
+    output = io.BytesIO()
+    writer.dump_bytes(slice_project_description, output, buffer_size=1000)
+
+    # THEN every section is counted by its type
+    assert stats.sections["FileSection"].count == 200
+    assert stats.sections["FileSection"].field_count == 200 * 7
+    assert stats.sections["VolumeSection"].count == 1
+    assert sum(t.size for t in stats.sections.values()) == len(output.getvalue())
+
+    # AND so is the output
+    assert stats.output.size == len(output.getvalue())
+    assert stats.output.count > 1
+    assert "FileSection" in stats.report()
+
+
+def test_chrome_trace(slice_project_description: ProjectDescription, tmpdir: Path):
+    # GIVEN a writer recording a trace
+    trace = ChromeTrace()
+    writer = XVGIWriter(observer=trace)
+
+    # WHEN I write a project and export the trace
+    writer.dump(slice_project_description, io.StringIO())
+    path = Path(tmpdir, "trace.json")
+    trace.write_path(path)
+
+    # THEN it holds a complete event for each section and write
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    sections = [e for e in events if e["cat"] != "output"]
+    assert len(sections) == len(list(writer.iter_chunks(slice_project_description)))
+    assert sections[1]["name"] == "VolumeSection0"
+    assert {e["ph"] for e in events} == {"X"}
+    assert all(e["dur"] >= 0 for e in events)
+
+
+def test_observed_file_writes(
+    slice_project_description: ProjectDescription, tmpdir: Path
+):
+    # GIVEN a writer with a statistics collector
+    stats = SectionStats()
+    writer = XVGIWriter(observer=stats)
+    path = Path(tmpdir, "project.xvgi")
+
+    # WHEN I write a file only if changed, and append to it
+    writer.write_if_changed(slice_project_description, path)
+    written = path.stat().st_size
+    writer.append(path, [sdk.MeshSection(FileName=Path("/foo/bar/mesh.stl"))])
+
+    # THEN all writes to the file are counted
+    assert stats.output.count == 2
+    assert stats.output.size == path.stat().st_size > written
+    assert stats.sections["MeshSection"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_observed_adump(
+    slice_project_description: ProjectDescription, tmpdir: Path
+):
+    # GIVEN a writer with a statistics collector
+    stats = SectionStats()
+    writer = XVGIWriter(observer=stats)
+    path = Path(tmpdir, "project.xvgi")
+
+    # WHEN I write a file asynchronously
+    await writer.adump(slice_project_description, path, batch_size=16)
+
+    # THEN all writes to the file are counted
+    assert stats.output.size == path.stat().st_size
+    assert stats.output.count > 1
+
+
+class _CustomVersionSerializer(SectionSerializerBase):
+    def serialize(self, name: str, data: Mapping[str, object]) -> str:
+        return super().serialize("Custom", data)
+
+
+class _CustomVolumeSerializer(VolumeSectionSerializer):
+    def iter_serialize(
+        self, section_name: str, section_data: Mapping[str, object]
+    ) -> Iterator[str]:
+        yield f"[{section_name}]\n\tCustom = 1\n\n"
+
+
+def test_custom_serializers(slice_project_description: ProjectDescription):
+    # GIVEN a writer with a custom serializer for the version section, and
+    # one for the volumes overriding only the mapping methods
+    writer = XVGIWriter(
+        section_serializers={"VersionSection": _CustomVersionSerializer}
+    )
+    volume_serializer = _CustomVolumeSerializer()
+    volume = slice_project_description.volumes.volumes[0]
+
+    # WHEN I write a project and a volume with them
+    serialized = writer.dumps(slice_project_description)
+    volume_chunks = list(volume_serializer.iter_serialize_object("Volume", volume))
+
+    # THEN the overridden methods are used
+    assert serialized.startswith("[Custom]\n")
+    assert "[VersionSection]" not in serialized
+    assert volume_chunks == ["[Volume]\n\tCustom = 1\n\n"]
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_fingerprint(slice_project_description: ProjectDescription, fast: bool):
+    # GIVEN a project and an equal copy of it
+    writer = XVGIWriter()
+    copied = copy.deepcopy(slice_project_description)
+
+    # WHEN I fingerprint them
+    fingerprint = writer.fingerprint(slice_project_description, fast)
+
+    # THEN the fingerprints are the same
+    assert fingerprint == writer.fingerprint(copied, fast)
+    assert fingerprint != writer.fingerprint(copied, not fast)
+
+    # WHEN I change a single value
+    volume = copied.volumes.volumes[0]
+    volume.VolumeResolution = sdk.Vector3f(0.1, 0.1, 0.2)
+
+    # THEN the fingerprint changes
+    assert writer.fingerprint(copied, fast) != fingerprint
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"FileName": Path("/foo/bar/other.raw")},
+        {"FileEndian": sdk.VolumeEndian.Big},
+        # equal to the positions of the other files, but written differently
+        {"FilePositionList": sdk.Vectorf([-0.0])},
+    ],
+)
+def test_fast_fingerprint_of_single_file(
+    slice_project_description: ProjectDescription, changes: dict
+):
+    # GIVEN a project with volume files copied from one template
+    writer = XVGIWriter()
+    files = slice_project_description.volumes.volumes[0].VolumeProjections
+    files = cast(List[sdk.VolumeFileSection], files)
+    for index, file in enumerate(files):
+        files[index] = replace(file, FilePositionList=sdk.Vectorf([0.0]))
+    fingerprint = writer.fingerprint(slice_project_description, fast=True)
+    text = writer.dumps(slice_project_description)
+
+    # WHEN I change a single file
+    files[7] = replace(files[7], **changes)
+
+    # THEN the output and the fast fingerprint change
+    assert writer.dumps(slice_project_description) != text
+    assert writer.fingerprint(slice_project_description, fast=True) != fingerprint
+
+
+def test_fast_fingerprint_of_generators(
+    slice_project_description: ProjectDescription,
+):
+    # GIVEN a project holding its volume files in a generator
+    writer = XVGIWriter()
+    volume = slice_project_description.volumes.volumes[0]
+    files = list(volume.VolumeProjections)
+    volume.VolumeProjections = (f for f in files)
+
+    # WHEN I fingerprint it fast
+    fingerprint = writer.fingerprint(slice_project_description, fast=True)
+
+    # THEN the fingerprint of the text is used
+    volume.VolumeProjections = files
+    assert fingerprint == writer.fingerprint(slice_project_description)
+
+
+def test_validate(slice_project_description: ProjectDescription, tmpdir: Path):
+    # GIVEN a project with a volume file without a size, and a validating writer
+    volume = slice_project_description.volumes.volumes[0]
+    files = list(volume.VolumeProjections)
+    files[3] = replace(files[3], FileSize=sdk.Vector3i(0, 0, 0))
+    volume.VolumeProjections = files
+    writer = XVGIWriter(validate=True)
+    path = Path(tmpdir, "project.xvgi")
+
+    # WHEN I write it
+    # THEN the violation is raised
+    with pytest.raises(ValidationError) as error:
+        writer.write_path(slice_project_description, path)
+    assert [v.path for v in error.value.violations] == [
+        "volumes.volumes.0.VolumeProjections.3.FileSize"
+    ]
+
+    # AND nothing is written
+    assert not path.exists()
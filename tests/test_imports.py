@@ -0,0 +1,71 @@
+"""Tests for the lazily imported package modules."""
+
+import re
+import subprocess  # noqa: S404
+import sys
+from typing import Set
+
+import pytest
+
+
+def _imported_modules(code: str) -> Set[str]:
+    """Package modules imported by code run in a fresh interpreter."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # lines look like "import time:   self |  cumulative | <indent>module"
+    return {
+        match.group(1)
+        for match in re.finditer(
+            r"^import time:.*\|\s*(vg_nde_sdk\S*)$", result.stderr, re.M
+        )
+    }
+
+
+def test_import_package():
+    # GIVEN a fresh interpreter
+    # WHEN I import the package
+    modules = _imported_modules("import vg_nde_sdk")
+
+    # THEN none of its submodules are imported yet
+    assert modules == {"vg_nde_sdk", "vg_nde_sdk._lazy"}
+
+
+def test_import_volume_writer():
+    # GIVEN a fresh interpreter
+    # WHEN I import what is needed to write volume projects
+    modules = _imported_modules(
+        "from vg_nde_sdk.sections import VolumeSection\n"
+        "from vg_nde_sdk.serializers.xvgi import XVGIWriter\n"
+    )
+
+    # THEN the writer is there
+    assert "vg_nde_sdk.serializers.xvgi.writer" in modules
+
+    # AND neither the reconstruction sections nor their serializers are imported,
+    # only the holder kept by every project
+    assert {module for module in modules if "reconstruction" in module} == {
+        "vg_nde_sdk.sections.reconstruction_holder"
+    }
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["vg_nde_sdk", "vg_nde_sdk.sections", "vg_nde_sdk.serializers.xvgi"],
+)
+def test_lazy_names(module: str):
+    # GIVEN a lazily loading package
+    package = __import__(module, fromlist=["__all__"])
+
+    # WHEN I access all of its public names
+    # THEN each of them resolves
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+    # AND unknown names still raise
+    with pytest.raises(AttributeError):
+        package.NoSuchName
@@ -1,35 +1,84 @@
 """Project generation SDK."""
 
-from .projects import ProjectDescription
-from .projecttools import (
-    make_mesh_project,
-    make_reconstruction_project_from_projections,
-    make_volume_project_from_block,
-    make_volume_project_from_slices,
-)
-from .sections import (
-    ComponentInfoSection,
-    ManufacturerInfoSection,
-    MeshFormat,
-    MeshSection,
-    MeshSectionHolder,
-    MeshUnit,
-    ScanInfoSection,
-    Vector2f,
-    Vector2i,
-    Vector3f,
-    Vector3i,
-    Vectorf,
-    VolumeAxesSwapMode,
-    VolumeDataMappingMode,
-    VolumeDataType,
-    VolumeEndian,
-    VolumeFileFormat,
-    VolumeFileSection,
-    VolumeSection,
-    VolumeSectionHolder,
-    VolumeSliceInterpolationMode,
-)
-from .serializers import xvgi
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .projects import ProjectDescription
+    from .projecttools import (
+        make_mesh_project,
+        make_reconstruction_project_from_projections,
+        make_volume_project_from_block,
+        make_volume_project_from_slices,
+    )
+    from .sections import (
+        CompactVectorf,
+        ComponentInfoSection,
+        ManufacturerInfoSection,
+        MeshFormat,
+        MeshSection,
+        MeshSectionHolder,
+        MeshUnit,
+        ScanInfoSection,
+        Vector2f,
+        Vector2i,
+        Vector3f,
+        Vector3i,
+        Vectorf,
+        VolumeAxesSwapMode,
+        VolumeDataMappingMode,
+        VolumeDataType,
+        VolumeEndian,
+        VolumeFileFormat,
+        VolumeFileSection,
+        VolumeFileSequence,
+        VolumeSection,
+        VolumeSectionHolder,
+        VolumeSliceInterpolationMode,
+    )
+    from .serializers import xvgi
 
 __version__ = "2025.5.27"
+
+# submodules are imported on first access of one of their names, so that
+# importing the package or a single section stays cheap
+__getattr__, __dir__, __all__ = lazy_attributes(
+    __name__,
+    {
+        ".projects": ["ProjectDescription"],
+        ".projecttools": [
+            "make_mesh_project",
+            "make_reconstruction_project_from_projections",
+            "make_volume_project_from_block",
+            "make_volume_project_from_slices",
+        ],
+        ".sections": [
+            "CompactVectorf",
+            "ComponentInfoSection",
+            "ManufacturerInfoSection",
+            "MeshFormat",
+            "MeshSection",
+            "MeshSectionHolder",
+            "MeshUnit",
+            "ScanInfoSection",
+            "Vector2f",
+            "Vector2i",
+            "Vector3f",
+            "Vector3i",
+            "Vectorf",
+            "VolumeAxesSwapMode",
+            "VolumeDataMappingMode",
+            "VolumeDataType",
+            "VolumeEndian",
+            "VolumeFileFormat",
+            "VolumeFileSection",
+            "VolumeFileSequence",
+            "VolumeSection",
+            "VolumeSectionHolder",
+            "VolumeSliceInterpolationMode",
+        ],
+        ".serializers": ["xvgi"],
+    },
+    submodules=["projects", "projecttools", "sections", "serializers"],
+)
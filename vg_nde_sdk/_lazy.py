@@ -0,0 +1,53 @@
+"""Lazy loading of package attributes."""
+
+import sys
+from importlib.util import resolve_name
+from types import ModuleType
+from typing import Callable, List, Mapping, Sequence, Tuple
+
+
+def _import(name: str, package: str) -> ModuleType:
+    """Import a module by its name relative to package."""
+    # unlike importlib.import_module, the import statement machinery shows up
+    # in the -X importtime output
+    absolute = resolve_name(name, package)
+    __import__(absolute)
+    return sys.modules[absolute]
+
+
+def lazy_attributes(
+    package: str,
+    attributes: Mapping[str, Sequence[str]],
+    submodules: Sequence[str] = (),
+) -> Tuple[Callable[[str], object], Callable[[], List[str]], List[str]]:
+    """Module ``__getattr__``, ``__dir__`` and ``__all__`` of a lazy package."""
+    # attributes maps relative module names to the names they provide; a
+    # module is only imported when one of its names is first accessed, the
+    # value is then stored in the package so later accesses skip this lookup
+    origins = {name: module for module, names in attributes.items() for name in names}
+    lazy_submodules = frozenset(submodules)
+
+    def __getattr__(name: str) -> object:
+        if name in lazy_submodules:
+            value: object = _import(f".{name}", package)
+        else:
+            try:
+                module = origins[name]
+            except KeyError:
+                raise AttributeError(
+                    f"module {package!r} has no attribute {name!r}"
+                ) from None
+            try:
+                value = getattr(_import(module, package), name)
+            except AttributeError:
+                # subpackages, which their parent does not import itself
+                value = _import(f"{module}.{name}", package)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    public = sorted(origins)
+
+    def __dir__() -> List[str]:
+        return sorted({*vars(sys.modules[package]), *public, *lazy_submodules})
+
+    return __getattr__, __dir__, public
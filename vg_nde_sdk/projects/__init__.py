@@ -1,3 +1,22 @@
 """Project types."""
 
-from .project import ProjectDescription
+from typing import TYPE_CHECKING
+
+from vg_nde_sdk._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .evolve import get_path, replace_path
+    from .project import ProjectDescription
+    from .validation import ValidationError, Violation, validate
+
+# the validation rules import all section types, so they are only loaded
+# when a project is validated
+__getattr__, __dir__, __all__ = lazy_attributes(
+    __name__,
+    {
+        ".evolve": ["get_path", "replace_path"],
+        ".project": ["ProjectDescription"],
+        ".validation": ["ValidationError", "Violation", "validate"],
+    },
+    submodules=["evolve", "project", "validation"],
+)
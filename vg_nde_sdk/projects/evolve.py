@@ -0,0 +1,72 @@
+"""Structural replacement of values in project descriptions."""
+
+import copy
+from dataclasses import is_dataclass, replace
+from typing import Any, List, Mapping, Sequence, Tuple, TypeVar, cast
+
+T = TypeVar("T")
+
+
+def _replace_child(obj: object, key: str, value: object) -> object:
+    """Copy of obj with the child named key replaced by value."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return replace(obj, **{key: value})
+    if isinstance(obj, Mapping):
+        return {**obj, key: value}
+    if isinstance(obj, list):
+        items = list(obj)
+        items[int(key)] = value
+        return items
+    if isinstance(obj, tuple):
+        items = list(obj)
+        items[int(key)] = value
+        # fixed-size vectors take their components as separate arguments
+        new_args = cast(Tuple[object, ...], cast(Any, obj).__getnewargs__())
+        if len(new_args) != 1:
+            return type(obj)(*items)
+        return type(obj)(items)
+    if isinstance(obj, Sequence) and key.lstrip("-").isdigit():
+        # compact sequences such as projection tables replace their items
+        # themselves, other sequences become lists
+        if hasattr(obj, "replace"):
+            return cast(Any, obj).replace(int(key), value)
+        items = list(obj)
+        items[int(key)] = value
+        return items
+
+    # other objects, e.g. columnar tables, by their attributes
+    obj = copy.copy(obj)
+    setattr(obj, key, value)
+    return obj
+
+
+def _get_child(obj: object, key: str) -> object:
+    """Child of obj named key."""
+    if isinstance(obj, Mapping):
+        return obj[key]
+    if isinstance(obj, Sequence) and key.lstrip("-").isdigit():
+        return obj[int(key)]
+    return getattr(obj, key)
+
+
+def get_path(obj: object, path: str) -> object:
+    """Value at a dotted path such as ``"volumes.volumes.0.ObjectNameInScene"``."""
+    for key in path.split("."):
+        obj = _get_child(obj, key)
+    return obj
+
+
+def replace_path(obj: T, path: str, value: object) -> T:
+    """Copy of obj with the value at a dotted path replaced, sharing the rest."""
+    # only the objects along the path are copied
+    keys = path.split(".")
+    parents: List[object] = []
+    child: object = obj
+    for key in keys:
+        parents.append(child)
+        child = _get_child(child, key)
+
+    # compatibility with Python 3.9
+    for parent, key in zip(reversed(parents), reversed(keys)):  # noqa: B905
+        value = _replace_child(parent, key, value)
+    return cast(T, value)
@@ -9,6 +9,8 @@ from vg_nde_sdk.sections import (
     VolumeSectionHolder,
 )
 
+from .evolve import replace_path
+
 
 @dataclass
 class ProjectDescription:
@@ -20,3 +22,11 @@ class ProjectDescription:
     reconstructions: ReconstructionSectionHolder = field(
         default_factory=ReconstructionSectionHolder
     )
+
+    def evolve(self, path: str, value: object) -> "ProjectDescription":
+        """Copy with the value at a dotted path replaced, sharing everything else."""
+        # only the sections and holders along the path are copied, e.g.
+        # "volumes.volumes.0.ObjectNameInScene" copies the project, the volume
+        # holder, its list of volumes and the first volume; the files of the
+        # volume and all other sections are shared with this project
+        return replace_path(self, path, value)
@@ -0,0 +1,354 @@
+"""Validation of project descriptions."""
+
+import collections.abc
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+import vg_nde_sdk.sections as sections
+from vg_nde_sdk.sections import (
+    ReconstructionROISection,
+    ReconstructionSection,
+    Vector3i,
+    VolumeFileSection,
+    VolumeFileSequence,
+    VolumeSection,
+)
+
+_FULL_VOLUME = (Vector3i(0, 0, 0), Vector3i(-1, -1, -1))
+""" Region of interest bounds denoting the full volume """
+
+
+@dataclass(frozen=True)
+class Violation:
+    """Value not meeting the requirements of its section."""
+
+    path: str
+    """ Dotted path of the value, as accepted by ``get_path`` """
+
+    message: str
+    """ Requirement the value does not meet """
+
+    def __str__(self) -> str:
+        """Path and message."""
+        return f"{self.path}: {self.message}"
+
+
+class ValidationError(ValueError):
+    """Raised for projects with violations."""
+
+    def __init__(self, violations: Sequence[Violation]):
+        """Construct from all violations of a project."""
+        self.violations = violations
+        """ All violations found """
+
+        lines = [str(v) for v in violations[:10]]
+        if len(violations) > 10:
+            lines.append(f"... and {len(violations) - 10} more")
+        super().__init__(
+            f"Project has {len(violations)} violation(s):\n" + "\n".join(lines)
+        )
+
+
+class _Columns(Dict[str, List[Any]]):
+    """Field values of a sequence of sections, fetched per field on demand."""
+
+    def __init__(self, sections: Sequence[object]):
+        super().__init__()
+        self.sections = sections
+
+    def __missing__(self, name: str) -> List[Any]:
+        column = self[name] = list(map(attrgetter(name), self.sections))
+        return column
+
+
+@dataclass(frozen=True)
+class _Rule:
+    """Requirement on one or more fields of a section."""
+
+    names: Tuple[str, ...]
+    """ Checked fields, the first one is reported as violating the rule """
+
+    check: Callable[..., Optional[str]]
+    """ Message for field values violating the rule, one argument per field """
+
+
+_rules: Dict[type, List[_Rule]] = {}
+""" Rules by section type """
+
+_collection_rules: Dict[type, List[Callable[[_Columns], Optional[str]]]] = {}
+""" Rules on all sections of a type held together, by section type """
+
+
+def _rule(section_type: type, *names: str) -> Callable[[Callable], Callable]:
+    """Register a rule on the named fields of a section type."""
+
+    def register(check: Callable) -> Callable:
+        _rules.setdefault(section_type, []).append(_Rule(names, check))
+        return check
+
+    return register
+
+
+def _collection_rule(section_type: type) -> Callable[[Callable], Callable]:
+    """Register a rule on all sections of a type held in one sequence."""
+
+    def register(check: Callable) -> Callable:
+        _collection_rules.setdefault(section_type, []).append(check)
+        return check
+
+    return register
+
+
+@_rule(VolumeFileSection, "FileSize")
+def _check_file_size(size: Vector3i) -> Optional[str]:
+    if min(size) > 0:
+        return None
+    return f"must be positive along all axes, got {tuple(size)}"
+
+
+@_rule(VolumeFileSection, "FilePositionList", "FileSize")
+def _check_position_count(positions: Sequence[float], size: Vector3i) -> Optional[str]:
+    if len(positions) in (0, size[2]):
+        return None
+    return f"has {len(positions)} positions for a z-size of {size[2]}"
+
+
+@_collection_rule(VolumeFileSection)
+def _check_position_lists(columns: _Columns) -> Optional[str]:
+    position_lists = columns["FilePositionList"]
+    # files mostly share their position lists, only distinct ones are looked at
+    try:
+        distinct: Iterable[Sequence[float]] = dict.fromkeys(position_lists)
+    except TypeError:
+        distinct = position_lists
+    if len({len(positions) > 0 for positions in distinct}) < 2:
+        return None
+    with_positions = sum(1 for positions in position_lists if len(positions))
+    return (
+        f"{with_positions} of {len(position_lists)} files have a FilePositionList, "
+        "either all or none must have one"
+    )
+
+
+@_rule(VolumeSection, "VolumeRegionOfInterestMin", "VolumeRegionOfInterestMax")
+@_rule(
+    ReconstructionSection,
+    "ReconstructionRegionOfInterestMin",
+    "ReconstructionRegionOfInterestMax",
+)
+@_rule(
+    ReconstructionROISection,
+    "ReconstructionRegionOfInterestListMinPosition",
+    "ReconstructionRegionOfInterestListMaxPosition",
+)
+def _check_region(minimum: Vector3i, maximum: Vector3i) -> Optional[str]:
+    if (minimum, maximum) == _FULL_VOLUME:
+        return None
+    # compatibility with Python 3.9
+    if all(a <= b for a, b in zip(minimum, maximum)):  # noqa: B905
+        return None
+    return f"exceeds the maximum {tuple(maximum)} along some axis"
+
+
+@dataclass(frozen=True)
+class _ValidationPlan:
+    """Precompiled validation of one section type."""
+
+    rules: Tuple[_Rule, ...]
+    """ Rules on the fields of the section """
+
+    children: Tuple[str, ...]
+    """ Fields holding a single section with rules """
+
+    sequences: Tuple[str, ...]
+    """ Fields holding a sequence of sections with rules """
+
+    def __bool__(self) -> bool:
+        """Whether there is anything to validate."""
+        return bool(self.rules or self.children or self.sequences)
+
+
+@lru_cache(maxsize=None)
+def _section_namespace() -> Dict[str, object]:
+    """Names for resolving forward references of section fields."""
+    return {name: getattr(sections, name) for name in sections.__all__}
+
+
+def _section_types(hint: object) -> Iterator[Tuple[type, bool]]:
+    """Section types in a type hint, and whether they are held in a sequence."""
+    origin = get_origin(hint)
+    if origin is Union:
+        for arg in get_args(hint):
+            yield from _section_types(arg)
+    elif origin in (collections.abc.Sequence, collections.abc.Iterable):
+        (item,) = get_args(hint)
+        if is_dataclass(item):
+            yield cast(type, item), True
+    elif is_dataclass(hint):
+        yield cast(type, hint), False
+
+
+@lru_cache(maxsize=None)
+def _collection_checks(
+    section_type: type,
+) -> Tuple[Callable[[_Columns], Optional[str]], ...]:
+    """Rules on all sections of a type held together, including its bases."""
+    # e.g. frozen sections are subclasses of the section classes
+    return tuple(
+        check
+        for base in reversed(section_type.__mro__)
+        for check in _collection_rules.get(base, ())
+    )
+
+
+@lru_cache(maxsize=None)
+def _compile_plan(section_type: type) -> _ValidationPlan:
+    """Compile the validation plan for a section type."""
+    # fields are only visited if they can hold sections with rules, e.g. the
+    # projections of a reconstruction are never looked at
+    hints = get_type_hints(section_type, localns=_section_namespace())
+    children: List[str] = []
+    sequences: List[str] = []
+    for f in fields(section_type):  # type: ignore
+        for child_type, in_sequence in _section_types(hints[f.name]):
+            if in_sequence and (
+                _compile_plan(child_type) or _collection_checks(child_type)
+            ):
+                sequences.append(f.name)
+                break
+            if not in_sequence and _compile_plan(child_type):
+                children.append(f.name)
+                break
+
+    rules = tuple(
+        rule for base in reversed(section_type.__mro__) for rule in _rules.get(base, ())
+    )
+    return _ValidationPlan(rules, tuple(children), tuple(sequences))
+
+
+def _validate_section(section: object, path: str, violations: List[Violation]) -> None:
+    """Collect the violations of a section and the sections it holds."""
+    section_type: type = type(section)
+    plan = _compile_plan(section_type)
+    for rule in plan.rules:
+        message = rule.check(*(getattr(section, name) for name in rule.names))
+        if message is not None:
+            violations.append(Violation(f"{path}{rule.names[0]}", message))
+    _validate_held(section, plan, path, violations)
+
+
+def _validate_held(
+    section: object, plan: _ValidationPlan, path: str, violations: List[Violation]
+) -> None:
+    """Collect the violations of the sections held by a section."""
+    for name in plan.children:
+        child = getattr(section, name)
+        if is_dataclass(child):
+            _validate_section(child, f"{path}{name}.", violations)
+
+    for name in plan.sequences:
+        _validate_sequence(getattr(section, name), f"{path}{name}.", violations)
+
+
+def _row_ids(row: Tuple[Any, ...]) -> Tuple[int, ...]:
+    return tuple(map(id, row))
+
+
+def _check_columns(
+    columns: _Columns, rule: _Rule, path: str, violations: List[Violation]
+) -> None:
+    """Apply a rule to the field values of all sections at once."""
+    # sections usually share few distinct values, e.g. copies of one template,
+    # each of which is checked once; the per-section work of collecting them
+    # is done by map and zip in C, without keeping an object per section
+    values = [columns[name] for name in rule.names]
+
+    def iter_rows() -> Iterator[Tuple[Any, ...]]:
+        # compatibility with Python 3.9
+        return zip(*values)  # noqa: B905
+
+    row_key: Callable[[Tuple[Any, ...]], Hashable]
+    try:
+        if len(values) == 1:
+            # without a tuple per section
+            distinct = {(value,): None for value in dict.fromkeys(values[0])}
+        else:
+            distinct = dict.fromkeys(iter_rows())
+        row_key = tuple
+    except TypeError:
+        # unhashable values such as numpy arrays are told apart by identity
+        # compatibility with Python 3.9
+        rows = zip(map(_row_ids, iter_rows()), iter_rows())  # noqa: B905
+        distinct = dict(rows)  # type: ignore
+        row_key = _row_ids
+
+    failed: Dict[Hashable, str] = {}
+    for key, row in distinct.items():
+        message = rule.check(*(key if row is None else row))
+        if message is not None:
+            failed[key] = message
+    if not failed:
+        return
+
+    name = rule.names[0]
+    for index, row in enumerate(iter_rows()):
+        message = failed.get(row_key(row))
+        if message is not None:
+            violations.append(Violation(f"{path}{index}.{name}", message))
+
+
+def _validate_sequence(items: object, path: str, violations: List[Violation]) -> None:
+    """Collect the violations of a sequence of sections."""
+    if isinstance(items, VolumeFileSequence):
+        # all files share the settings of the template
+        _validate_section(items.template, f"{path}template.", violations)
+        return
+    if not isinstance(items, collections.abc.Sequence) or not items:
+        # e.g. generators, which would be consumed here
+        return
+
+    item_types = set(map(type, items))
+    if len(item_types) > 1:
+        for index, item in enumerate(items):
+            _validate_section(item, f"{path}{index}.", violations)
+        return
+
+    # sections of one type are checked rule by rule, column by column
+    (item_type,) = item_types
+    plan = _compile_plan(item_type)
+    columns = _Columns(items)
+    for rule in plan.rules:
+        _check_columns(columns, rule, path, violations)
+    if plan.children or plan.sequences:
+        for index, item in enumerate(items):
+            _validate_held(item, plan, f"{path}{index}.", violations)
+
+    for check in _collection_checks(item_type):
+        message = check(columns)
+        if message is not None:
+            violations.append(Violation(path.rstrip("."), message))
+
+
+def validate(project: object) -> List[Violation]:
+    """Find all values of a project not meeting the requirements of a section."""
+    violations: List[Violation] = []
+    _validate_section(project, "", violations)
+    return violations
@@ -1,10 +1,12 @@
 """Reconstruction project description."""
 
+from array import array
 from pathlib import Path
 from typing import Optional, Sequence
 
 from vg_nde_sdk.projects import ProjectDescription
 from vg_nde_sdk.sections import (
+    ProjectionTable,
     ReconstructionCalibrationMode,
     ReconstructionClampType,
     ReconstructionPreprocessingMode,
@@ -18,6 +20,7 @@ from vg_nde_sdk.sections import (
     Vector2f,
     Vector2i,
     Vector3i,
+    compact_paths,
 )
 
 
@@ -44,12 +47,28 @@ def make_reconstruction_project_from_projections(
     clamp_low_mode: bool = False,
     clamp_low_type: ReconstructionClampType = ReconstructionClampType.AbsoluteClamping,
     clamp_low_value: float = 0,
+    compact: bool = False,
 ) -> ProjectDescription:
     """Create a reconstruction project out of projections."""
+    # the projections are a list of sections, or with compact a read-only
+    # ProjectionTable storing their paths compactly
     angle_step = (reconstruction_angular_section - reconstruction_angular_offset) / len(
         projections
     )
-    angles = (x * angle_step for x in range(len(projections)))
+    angles = array("d", (x * angle_step for x in range(len(projections))))
+    projection_files: Sequence[ReconstructionProjectionFileSection]
+    if compact:
+        projection_files = ProjectionTable(compact_paths(projections), angles)
+    else:
+        projection_files = [
+            ReconstructionProjectionFileSection(
+                ReconstructionProjectionInfoFileName=f,
+                ReconstructionProjectionInfoValue=angle,
+                ReconstructionProjectionInfoOption=False,
+            )
+            # compatibility with Python 3.9
+            for angle, f in zip(angles, projections)  # noqa: B905
+        ]
 
     return ProjectDescription(
         reconstructions=ReconstructionSectionHolder(
@@ -73,15 +92,7 @@ def make_reconstruction_project_from_projections(
                     ReconstructionProjectionSorting=projection_file_sorting,
                     ReconstructionAngularOffset=reconstruction_angular_offset,
                     ReconstructionAngularSection=reconstruction_angular_section,
-                    ProjectionFiles=[
-                        ReconstructionProjectionFileSection(
-                            ReconstructionProjectionInfoFileName=f,
-                            ReconstructionProjectionInfoValue=angle,
-                            ReconstructionProjectionInfoOption=False,
-                        )
-                        # compatibility with Python 3.9
-                        for angle, f in zip(angles, projections)  # noqa: B905
-                    ],
+                    ProjectionFiles=projection_files,
                     ReconstructionClampLowMode=clamp_low_mode,
                     ReconstructionClampLowType=clamp_low_type,
                     ReconstructionClampLowValue=clamp_low_value,
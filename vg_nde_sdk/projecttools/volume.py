@@ -1,5 +1,6 @@
 """Volume project description."""
 
+from dataclasses import replace
 from pathlib import Path
 from typing import Sequence
 
@@ -14,6 +15,7 @@ from vg_nde_sdk.sections import (
     VolumeFileSection,
     VolumeSection,
     VolumeSectionHolder,
+    compact_paths,
 )
 
 
@@ -24,18 +26,23 @@ def make_volume_project_from_slices(
     volume_resolution: Vector3f,
     file_data_type: VolumeDataType,
     file_data_endian: VolumeEndian = VolumeEndian.Little,
+    compact: bool = False,
 ) -> ProjectDescription:
     """Generate minimal volume project description for a slice stack."""
-    slice_sections = [
-        VolumeFileSection(
-            FileName=s,
-            FileFileFormat=slice_format,
-            FileEndian=file_data_endian,
-            FileSize=Vector3i(slice_size[0], slice_size[1], 1),
-            FileDataType=file_data_type,
-        )
-        for s in slices
-    ]
+    # the slices are a list of sections, or with compact a read-only
+    # VolumeFileSequence sharing one section and storing their paths compactly
+    template = VolumeFileSection(
+        FileName=Path(),
+        FileFileFormat=slice_format,
+        FileEndian=file_data_endian,
+        FileSize=Vector3i(slice_size[0], slice_size[1], 1),
+        FileDataType=file_data_type,
+    )
+    slice_sections: Sequence[VolumeFileSection]
+    if compact:
+        slice_sections = VolumeFileSection.bulk(compact_paths(slices), template)
+    else:
+        slice_sections = [replace(template, FileName=s) for s in slices]
 
     project = ProjectDescription(
         volumes=VolumeSectionHolder(
@@ -1,82 +1,251 @@
 """Available description sections."""
 
-from typing import Mapping, NewType, Union
+from typing import TYPE_CHECKING, Mapping, NewType, Union
 
-from .component import ComponentInfoSection
-from .manufacturer import ManufacturerInfoSection
-from .mesh import MeshSection
-from .mesh_enums import (
-    MeshFormat,
-    MeshUnit,
-)
-from .mesh_holder import MeshSectionHolder
-from .reconstruction import (
-    ReconstructionProjectionFileSection,
-    ReconstructionROISection,
-    ReconstructionSection,
-)
-from .reconstruction_enums import (
-    ReconstructionAlgorithmicOptimizationMode,
-    ReconstructionAlgorithmMode,
-    ReconstructionBeamHardeningCorrectionMode,
-    ReconstructionBeamHardeningCorrectionPresetMode,
-    ReconstructionCalculationMode,
-    ReconstructionCalibrationFilterMode,
-    ReconstructionCalibrationMode,
-    ReconstructionClampType,
-    ReconstructionFieldOfViewExtensionMode,
-    ReconstructionFilterMode,
-    ReconstructionGeneralSystemGeometryMode,
-    ReconstructionGeometricSetup,
-    ReconstructionImportMode,
-    ReconstructionInterpolationMode,
-    ReconstructionMetalArtifactReductionMode,
-    ReconstructionMetalArtifactReductionThresholdMode,
-    ReconstructionMisalignmentCorrectionMode,
-    ReconstructionMisalignmentOptimizationMode,
-    ReconstructionMisalignmentSkipMode,
-    ReconstructionMultipleROIPositioningMode,
-    ReconstructionPreprocessingMode,
-    ReconstructionProjectionDataType,
-    ReconstructionProjectionFileEndian,
-    ReconstructionProjectionFileFormat,
-    ReconstructionProjectionOrientation,
-    ReconstructionProjectionSmoothingMode,
-    ReconstructionProjectionSorting,
-    ReconstructionRadiationIntensityCompensationMode,
-    ReconstructionResultDataType,
-    ReconstructionResultImportMode,
-    ReconstructionRingArtifactReductionMode,
-    ReconstructionRotationDirection,
-    ReconstructionSpeckleRemovalMode,
-)
-from .reconstruction_holder import ReconstructionSectionHolder
-from .scan import ScanInfoSection
-from .types import Vector2f, Vector2i, Vector3f, Vector3i, Vectorf
-from .version import VersionSection
-from .volume import VolumeFileSection, VolumeMetaInfoContainer, VolumeSection
-from .volume_enums import (
-    VolumeAxesSwapMode,
-    VolumeDataMappingMode,
-    VolumeDataType,
-    VolumeEndian,
-    VolumeFileFormat,
-    VolumeSliceInterpolationMode,
+from vg_nde_sdk._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .component import ComponentInfoSection
+    from .frozen import FrozenMapping, freeze, frozen_type
+    from .manufacturer import ManufacturerInfoSection
+    from .mesh import MeshSection
+    from .mesh_enums import (
+        MeshFormat,
+        MeshUnit,
+    )
+    from .mesh_holder import MeshSectionHolder
+    from .paths import DirectoryFileNames, NumberedFileNames, compact_paths
+    from .reconstruction import (
+        ProjectionTable,
+        ReconstructionProjectionFileSection,
+        ReconstructionROISection,
+        ReconstructionSection,
+    )
+    from .reconstruction_enums import (
+        ReconstructionAlgorithmicOptimizationMode,
+        ReconstructionAlgorithmMode,
+        ReconstructionBeamHardeningCorrectionMode,
+        ReconstructionBeamHardeningCorrectionPresetMode,
+        ReconstructionCalculationMode,
+        ReconstructionCalibrationFilterMode,
+        ReconstructionCalibrationMode,
+        ReconstructionClampType,
+        ReconstructionFieldOfViewExtensionMode,
+        ReconstructionFilterMode,
+        ReconstructionGeneralSystemGeometryMode,
+        ReconstructionGeometricSetup,
+        ReconstructionImportMode,
+        ReconstructionInterpolationMode,
+        ReconstructionMetalArtifactReductionMode,
+        ReconstructionMetalArtifactReductionThresholdMode,
+        ReconstructionMisalignmentCorrectionMode,
+        ReconstructionMisalignmentOptimizationMode,
+        ReconstructionMisalignmentSkipMode,
+        ReconstructionMultipleROIPositioningMode,
+        ReconstructionPreprocessingMode,
+        ReconstructionProjectionDataType,
+        ReconstructionProjectionFileEndian,
+        ReconstructionProjectionFileFormat,
+        ReconstructionProjectionOrientation,
+        ReconstructionProjectionSmoothingMode,
+        ReconstructionProjectionSorting,
+        ReconstructionRadiationIntensityCompensationMode,
+        ReconstructionResultDataType,
+        ReconstructionResultImportMode,
+        ReconstructionRingArtifactReductionMode,
+        ReconstructionRotationDirection,
+        ReconstructionSpeckleRemovalMode,
+    )
+    from .reconstruction_holder import ReconstructionSectionHolder
+    from .scan import ScanInfoSection
+    from .types import CompactVectorf, Vector2f, Vector2i, Vector3f, Vector3i, Vectorf
+    from .version import VersionSection
+    from .volume import (
+        VolumeFileSection,
+        VolumeFileSequence,
+        VolumeMetaInfoContainer,
+        VolumeSection,
+    )
+    from .volume_enums import (
+        VolumeAxesSwapMode,
+        VolumeDataMappingMode,
+        VolumeDataType,
+        VolumeEndian,
+        VolumeFileFormat,
+        VolumeSliceInterpolationMode,
+    )
+    from .volume_holder import VolumeSectionHolder
+
+# section modules are imported on first access of one of their names
+_getattr, __dir__, __all__ = lazy_attributes(
+    __name__,
+    {
+        ".component": [
+            "ComponentInfoSection",
+        ],
+        ".frozen": [
+            "FrozenMapping",
+            "freeze",
+            "frozen_type",
+        ],
+        ".manufacturer": [
+            "ManufacturerInfoSection",
+        ],
+        ".mesh": [
+            "MeshSection",
+        ],
+        ".mesh_enums": [
+            "MeshFormat",
+            "MeshUnit",
+        ],
+        ".mesh_holder": [
+            "MeshSectionHolder",
+        ],
+        ".paths": [
+            "DirectoryFileNames",
+            "NumberedFileNames",
+            "compact_paths",
+        ],
+        ".reconstruction": [
+            "ProjectionTable",
+            "ReconstructionProjectionFileSection",
+            "ReconstructionROISection",
+            "ReconstructionSection",
+        ],
+        ".reconstruction_enums": [
+            "ReconstructionAlgorithmicOptimizationMode",
+            "ReconstructionAlgorithmMode",
+            "ReconstructionBeamHardeningCorrectionMode",
+            "ReconstructionBeamHardeningCorrectionPresetMode",
+            "ReconstructionCalculationMode",
+            "ReconstructionCalibrationFilterMode",
+            "ReconstructionCalibrationMode",
+            "ReconstructionClampType",
+            "ReconstructionFieldOfViewExtensionMode",
+            "ReconstructionFilterMode",
+            "ReconstructionGeneralSystemGeometryMode",
+            "ReconstructionGeometricSetup",
+            "ReconstructionImportMode",
+            "ReconstructionInterpolationMode",
+            "ReconstructionMetalArtifactReductionMode",
+            "ReconstructionMetalArtifactReductionThresholdMode",
+            "ReconstructionMisalignmentCorrectionMode",
+            "ReconstructionMisalignmentOptimizationMode",
+            "ReconstructionMisalignmentSkipMode",
+            "ReconstructionMultipleROIPositioningMode",
+            "ReconstructionPreprocessingMode",
+            "ReconstructionProjectionDataType",
+            "ReconstructionProjectionFileEndian",
+            "ReconstructionProjectionFileFormat",
+            "ReconstructionProjectionOrientation",
+            "ReconstructionProjectionSmoothingMode",
+            "ReconstructionProjectionSorting",
+            "ReconstructionRadiationIntensityCompensationMode",
+            "ReconstructionResultDataType",
+            "ReconstructionResultImportMode",
+            "ReconstructionRingArtifactReductionMode",
+            "ReconstructionRotationDirection",
+            "ReconstructionSpeckleRemovalMode",
+        ],
+        ".reconstruction_holder": [
+            "ReconstructionSectionHolder",
+        ],
+        ".scan": [
+            "ScanInfoSection",
+        ],
+        ".types": [
+            "CompactVectorf",
+            "Vector2f",
+            "Vector2i",
+            "Vector3f",
+            "Vector3i",
+            "Vectorf",
+        ],
+        ".version": [
+            "VersionSection",
+        ],
+        ".volume": [
+            "VolumeFileSection",
+            "VolumeFileSequence",
+            "VolumeMetaInfoContainer",
+            "VolumeSection",
+        ],
+        ".volume_enums": [
+            "VolumeAxesSwapMode",
+            "VolumeDataMappingMode",
+            "VolumeDataType",
+            "VolumeEndian",
+            "VolumeFileFormat",
+            "VolumeSliceInterpolationMode",
+        ],
+        ".volume_holder": [
+            "VolumeSectionHolder",
+        ],
+    },
+    submodules=[
+        "component",
+        "fields",
+        "frozen",
+        "manufacturer",
+        "mesh",
+        "mesh_enums",
+        "mesh_holder",
+        "paths",
+        "reconstruction",
+        "reconstruction_enums",
+        "reconstruction_holder",
+        "scan",
+        "types",
+        "version",
+        "volume",
+        "volume_enums",
+        "volume_holder",
+    ],
 )
-from .volume_holder import VolumeSectionHolder
+__all__.append("SectionType")
 
-SectionType = Union[
-    ComponentInfoSection,
-    ManufacturerInfoSection,
-    MeshSection,
-    MeshSectionHolder,
-    ReconstructionSectionHolder,
-    ReconstructionROISection,
-    ReconstructionProjectionFileSection,
-    ReconstructionSection,
-    ScanInfoSection,
-    VersionSection,
-    VolumeSectionHolder,
-    VolumeSection,
-    VolumeFileSection,
+_SECTION_TYPES = [
+    "ComponentInfoSection",
+    "ManufacturerInfoSection",
+    "MeshSection",
+    "MeshSectionHolder",
+    "ReconstructionSectionHolder",
+    "ReconstructionROISection",
+    "ReconstructionProjectionFileSection",
+    "ReconstructionSection",
+    "ScanInfoSection",
+    "VersionSection",
+    "VolumeSectionHolder",
+    "VolumeSection",
+    "VolumeFileSection",
 ]
+""" Names of the types making up SectionType """
+
+
+def __getattr__(name: str) -> object:
+    if name != "SectionType":
+        return _getattr(name)
+
+    # the union needs all section modules, it is only built when accessed
+    types = tuple(_getattr(type_name) for type_name in _SECTION_TYPES)
+    section_type = Union[types]  # type: ignore
+    globals()[name] = section_type
+    return section_type
+
+
+if TYPE_CHECKING:
+    SectionType = Union[
+        ComponentInfoSection,
+        ManufacturerInfoSection,
+        MeshSection,
+        MeshSectionHolder,
+        ReconstructionSectionHolder,
+        ReconstructionROISection,
+        ReconstructionProjectionFileSection,
+        ReconstructionSection,
+        ScanInfoSection,
+        VersionSection,
+        VolumeSectionHolder,
+        VolumeSection,
+        VolumeFileSection,
+    ]
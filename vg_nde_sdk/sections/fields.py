@@ -0,0 +1,43 @@
+"""Field access for section classes."""
+
+from dataclasses import fields, is_dataclass
+from typing import Dict, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+_field_names: Dict[type, Tuple[str, ...]] = {}
+""" Field names of the dataclasses seen so far, by type """
+
+
+def with_slots(cls: Type[T]) -> Type[T]:
+    """Recreate a dataclass with ``__slots__`` instead of an instance dict."""
+    # same as dataclass(slots=True), which is only available from Python 3.10
+    # on; stacked above @dataclass, type checkers still see a dataclass
+    names = tuple(f.name for f in fields(cls))  # type: ignore
+    namespace = dict(cls.__dict__)
+    for name in names:
+        # the class attributes holding the defaults would shadow the slots,
+        # the generated __init__ keeps its own references to them
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+
+    metaclass: type = type(cls)
+    slotted = metaclass(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+def field_values(section: object) -> Dict[str, object]:
+    """Values of all fields of a section, by field name."""
+    # works for sections with and without slots, other objects go by their
+    # instance dict
+    section_type = type(section)
+    try:
+        names = _field_names[section_type]
+    except KeyError:
+        if not is_dataclass(section_type):
+            return dict(vars(section))
+        names = _field_names[section_type] = tuple(f.name for f in fields(section_type))
+    return {name: getattr(section, name) for name in names}
@@ -0,0 +1,269 @@
+"""Immutable, hashable counterparts of the section classes."""
+
+import collections.abc
+from array import array
+from dataclasses import FrozenInstanceError, fields, is_dataclass
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .fields import field_values
+from .reconstruction import ProjectionTable
+from .types import CompactVectorf
+from .volume import VolumeFileSequence
+
+T = TypeVar("T")
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+_immutable_types: Set[type] = {type(None), bool, int, float, str}
+""" Types of the values kept as they are, extended by the types seen so far """
+
+
+class FrozenMapping(Mapping[K, V]):
+    """Read-only mapping with a hash computed on construction."""
+
+    __slots__ = ("_items", "_hash")
+
+    def __init__(self, items: Union[Mapping[K, V], Iterable[Tuple[K, V]]] = ()):
+        """Construct from a mapping or key, value pairs, copying them."""
+        self._items: Dict[K, V] = dict(items)
+        self._hash = hash(frozenset(self._items.items()))
+
+    def __getitem__(self, key: K) -> V:
+        """Value of key."""
+        return self._items[key]
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate the keys."""
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        """Number of keys."""
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare items with another mapping."""
+        if isinstance(other, FrozenMapping):
+            return self._hash == other._hash and self._items == other._items
+        if isinstance(other, Mapping):
+            return self._items == dict(other.items())
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash computed on construction."""
+        return self._hash
+
+    def __repr__(self) -> str:
+        """Representation, the same as of a dict with the same items."""
+        # sections holding a frozen mapping are written like the originals
+        return repr(self._items)
+
+
+class _Frozen:
+    """Base of the frozen counterparts, rejecting changes once hashed."""
+
+    # the hash is stored last during construction, until then the base class
+    # __init__ may assign its attributes as usual
+    __slots__ = ()
+
+    _hash: int
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Reject assignments after construction."""
+        if hasattr(self, "_hash"):
+            raise FrozenInstanceError(f"cannot assign to field {name!r}")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """Reject deletions."""
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __hash__(self) -> int:
+        """Hash computed on construction."""
+        return self._hash
+
+
+class _FrozenVolumeFileSequence(_Frozen, VolumeFileSequence):  # type: ignore
+    """Volume file sequence with a frozen template and a tuple of file names."""
+
+    __slots__ = ("_hash",)
+
+    def __init__(self, template: Any, file_names: Iterable[Any]):  # noqa: ANN401
+        """Construct from a template section and the file names."""
+        super().__init__(freeze(template), tuple(file_names))
+        object.__setattr__(self, "_hash", hash((self.template, self.file_names)))
+
+    def __reduce__(self):
+        """Pickle support."""
+        return _FrozenVolumeFileSequence, (self.template, self.file_names)
+
+
+def _read_only_angles(angles: Any) -> Any:  # noqa: ANN401
+    """Read-only copy of the angles of a projection table."""
+    # numpy arrays of smaller floats are copied as they are, integers into a
+    # tuple and other angles into a buffer of doubles, so they are written as
+    # before
+    if hasattr(angles, "dtype") and angles.dtype.kind == "f" and angles.itemsize != 8:
+        angles = angles.copy()
+        angles.flags.writeable = False
+        return angles
+    values = angles.tolist()
+    if values and all(type(angle) is int for angle in values):
+        return tuple(values)
+    return CompactVectorf(values)
+
+
+class _FrozenProjectionTable(_Frozen, ProjectionTable):  # type: ignore
+    """Projection table with a tuple of file names and read-only angles."""
+
+    __slots__ = ("_hash",)
+
+    def __init__(
+        self, file_names: Iterable[Any], angles: Any, options: int  # noqa: ANN401
+    ):
+        """Construct from the file names, angles and options of all projections."""
+        super().__init__(tuple(file_names), angles, options)
+        self.angles = _read_only_angles(self.angles)
+        object.__setattr__(
+            self,
+            "_hash",
+            hash((self.file_names, tuple(self.angle_values()), self.options)),
+        )
+
+    def __reduce__(self):
+        """Pickle support."""
+        return _FrozenProjectionTable, (self.file_names, self.angles, self.options)
+
+
+def _frozen_section(section_type: type, values: Mapping[str, object]) -> object:
+    """Construct the frozen counterpart of section_type from field values."""
+    return frozen_type(section_type)(**values)
+
+
+class _FrozenSection(_Frozen):
+    """Base of the frozen counterparts of section dataclasses."""
+
+    __slots__ = ()
+
+    _section_type: type
+    """ Section class the counterpart is derived from """
+
+    _field_names: Tuple[str, ...]
+    """ Field names of the section class """
+
+    def __init__(self, *args: Any, **kwargs: Any):  # noqa: ANN401
+        """Construct like the section class, freezing all field values."""
+        cast(Any, self._section_type).__init__(self, *args, **kwargs)
+        values = []
+        for name in self._field_names:
+            value = getattr(self, name)
+            frozen = freeze(value)
+            if frozen is not value:
+                object.__setattr__(self, name, frozen)
+            values.append(frozen)
+        # nested frozen sections return their stored hash, so hashing is
+        # linear in the size of the section
+        object.__setattr__(self, "_hash", hash((self._section_type, *values)))
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with frozen sections, and sections freezing into one."""
+        if other.__class__ is self._section_type:
+            try:
+                other = freeze(other)
+            except TypeError:
+                return False
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._hash == cast(_FrozenSection, other)._hash and all(
+            getattr(self, name) == getattr(other, name) for name in self._field_names
+        )
+
+    __hash__ = _Frozen.__hash__
+
+    def __reduce__(self):
+        """Pickle support."""
+        return _frozen_section, (self._section_type, field_values(self))
+
+
+@lru_cache(maxsize=None)
+def frozen_type(section_type: Type[T]) -> Type[T]:
+    """Frozen counterpart of a section class."""
+    # the counterpart is a subclass with the same name, so serializers and
+    # validation treat it like the section class itself; dataclasses that are
+    # frozen already are their own counterpart
+    if (
+        issubclass(section_type, _Frozen)
+        or cast(Any, section_type).__dataclass_params__.frozen
+    ):
+        return section_type
+
+    namespace = {
+        "__slots__": ("_hash",),
+        "__module__": section_type.__module__,
+        "__qualname__": section_type.__qualname__,
+        "__doc__": section_type.__doc__,
+        "_section_type": section_type,
+        "_field_names": tuple(f.name for f in fields(section_type)),  # type: ignore
+    }
+    return cast(
+        Type[T], type(section_type.__name__, (_FrozenSection, section_type), namespace)
+    )
+
+
+def _read_only_vector(values: Any) -> CompactVectorf:  # noqa: ANN401
+    """Float vector not sharing its buffer with a writable array."""
+    if isinstance(values, CompactVectorf) and isinstance(values._values.obj, array):
+        # the vector owns its read-only buffer
+        return values
+    # vectors backed by numpy arrays are copied, the array may be writable
+    return CompactVectorf(values.tolist())
+
+
+def freeze(value: T) -> T:
+    """Immutable, hashable copy of a section or a value held by a section."""
+    # sections become their frozen counterparts, mappings become frozen
+    # mappings and other collections tuples, all recursively; lazy sequences
+    # of file names are expanded, volume file sequences and projection tables
+    # keep their compact form
+    value_type = type(value)
+    if value_type in _immutable_types or isinstance(value, _Frozen):
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return cast(T, _frozen_section(type(value), field_values(value)))
+    if isinstance(value, VolumeFileSequence):
+        return cast(T, _FrozenVolumeFileSequence(value.template, value.file_names))
+    if isinstance(value, ProjectionTable):
+        return cast(
+            T, _FrozenProjectionTable(value.file_names, value.angles, value.options)
+        )
+    if isinstance(value, CompactVectorf) or getattr(value, "ndim", None) == 1:
+        return cast(T, _read_only_vector(value))
+    if isinstance(value, collections.abc.Mapping):
+        return cast(
+            T, FrozenMapping((key, freeze(item)) for key, item in value.items())
+        )
+    if isinstance(value, (str, bytes)) or (
+        isinstance(value, tuple) and type(value) is not tuple
+    ):
+        # e.g. the vector types, which are tuples of numbers
+        pass
+    elif isinstance(value, (collections.abc.Sequence, collections.abc.Iterator)):
+        return cast(T, tuple(map(freeze, value)))
+
+    if not isinstance(value, collections.abc.Hashable):
+        raise TypeError(f"Cannot freeze values of type {value_type.__name__}")
+    _immutable_types.add(value_type)
+    return value
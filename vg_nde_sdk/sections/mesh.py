@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from .component import ComponentInfoSection
+from .fields import with_slots
 from .mesh_enums import MeshFormat, MeshUnit
 from .types import Vector3f
 
@@ -15,6 +16,7 @@ class MeshMetaInfoContainer:
     ComponentInfo: ComponentInfoSection = field(default_factory=ComponentInfoSection)
 
 
+@with_slots
 @dataclass
 class MeshSection:
     """Descriptor class to completely define a mesh data set import."""
@@ -0,0 +1,222 @@
+"""Compact file name collections."""
+
+import os
+import re
+from os import PathLike
+from pathlib import Path, PurePath
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+_NUMBERED_NAME = re.compile(r"(.*?)(\d+)(\D*)")
+""" File name split at its last run of digits """
+
+_SEPARATORS = (os.sep, os.altsep) if os.altsep else (os.sep,)
+""" Characters separating path components """
+
+
+class NumberedFileNames(Sequence[Path]):
+    """File names generated from a printf-style pattern and an index range."""
+
+    __slots__ = ("pattern", "indices")
+
+    def __init__(self, pattern: str, indices: range):
+        """Construct from a pattern such as ``"slice_%05d.raw"`` and indices."""
+        self.pattern = pattern
+        """ File name pattern with a single integer slot """
+
+        self.indices = indices
+        """ Indices inserted into the pattern """
+
+    @overload
+    def __getitem__(self, index: int) -> Path: ...  # noqa: D105, E704
+
+    @overload
+    def __getitem__(self, index: slice) -> "NumberedFileNames": ...  # noqa: D105, E704
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Path, "NumberedFileNames"]:
+        """File name at index, or the file names of a slice."""
+        if isinstance(index, slice):
+            return NumberedFileNames(self.pattern, self.indices[index])
+        return Path(self.pattern % self.indices[index])
+
+    def __iter__(self) -> Iterator[Path]:
+        """Iterate the file names."""
+        pattern = self.pattern
+        return (Path(pattern % i) for i in self.indices)
+
+    def __len__(self) -> int:
+        """Number of file names."""
+        return len(self.indices)
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"NumberedFileNames({self.pattern!r}, {self.indices!r})"
+
+
+class DirectoryFileNames(Sequence[PurePath]):
+    """File names sharing one directory, storing the directory only once."""
+
+    __slots__ = ("directory", "names")
+
+    def __init__(self, directory: Union[PathLike, str], names: Sequence[str]):
+        """Construct from a directory and the plain names of files within it."""
+        # parsed paths keep their flavor, e.g. windows paths on linux
+        self.directory = (
+            directory if isinstance(directory, PurePath) else Path(directory)
+        )
+        """ Directory containing all files """
+
+        self.names = names
+        """ File names without any directory part """
+
+    @overload
+    def __getitem__(self, index: int) -> PurePath: ...  # noqa: D105, E704
+
+    @overload
+    def __getitem__(self, index: slice) -> "DirectoryFileNames": ...  # noqa: D105, E704
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[PurePath, "DirectoryFileNames"]:
+        """File name at index, or the file names of a slice."""
+        if isinstance(index, slice):
+            return DirectoryFileNames(self.directory, self.names[index])
+        return self.directory / self.names[index]
+
+    def __iter__(self) -> Iterator[PurePath]:
+        """Iterate the file names."""
+        directory = self.directory
+        return (directory / name for name in self.names)
+
+    def __len__(self) -> int:
+        """Number of file names."""
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"DirectoryFileNames({str(self.directory)!r}, <{len(self)} names>)"
+
+
+def _escape(text: str) -> str:
+    """Text written literally by a printf-style pattern."""
+    return text.replace("%", "%%")
+
+
+def _numbered_pattern(names: Sequence[str]) -> Optional[Tuple[str, range]]:
+    """Pattern and index range generating names, if there are any."""
+    prefix = suffix = ""
+    digits: List[str] = []
+    for name in names:
+        match = _NUMBERED_NAME.fullmatch(name)
+        if match is None:
+            return None
+        if not digits:
+            prefix, suffix = match.group(1), match.group(3)
+        elif match.group(1) != prefix or match.group(3) != suffix:
+            return None
+        digits.append(match.group(2))
+    if not digits:
+        return None
+
+    # unpadded numbers, or numbers padded to one common width
+    if all(d == str(int(d)) for d in digits):
+        slot = "%d"
+    elif len({len(d) for d in digits}) == 1:
+        slot = f"%0{len(digits[0])}d"
+    else:
+        return None
+
+    numbers = [int(d) for d in digits]
+    step = numbers[1] - numbers[0] if len(numbers) > 1 else 1
+    indices = range(numbers[0], numbers[-1] + step, step) if step else None
+    if indices is None or list(indices) != numbers:
+        return None
+
+    return _escape(prefix) + slot + _escape(suffix), indices
+
+
+def _split_path(
+    path: Union[PathLike, str], directories: Dict[str, Optional[Path]]
+) -> Optional[Tuple[PurePath, str]]:
+    """Directory and name of a path, if they are written the same as the path."""
+    if isinstance(path, PurePath):
+        # already parsed, the directory keeps the flavor of the path
+        return path.parent, path.name
+    if not isinstance(path, str):
+        return None
+
+    # strings are written as they are, paths in their POSIX form, so only
+    # strings already in the POSIX form of their directory are split
+    split = max(path.rfind(sep) for sep in _SEPARATORS) + 1
+    name = path[split:]
+    if name in ("", ".") or ":" in name:
+        return None
+    raw_directory = path[:split]
+    try:
+        directory = directories[raw_directory]
+    except KeyError:
+        # e.g. doubled separators, or the share of a windows UNC path
+        directory = Path(raw_directory)
+        if (directory / "_").as_posix() != raw_directory + "_":
+            directory = None
+        directories[raw_directory] = directory
+    if directory is None:
+        return None
+    return directory, name
+
+
+@overload
+def compact_paths(paths: Iterable[Path]) -> Sequence[Path]: ...  # noqa: D103, E704
+
+
+@overload
+def compact_paths(  # noqa: D103, E704
+    paths: Iterable[Union[PathLike, str]],
+) -> Sequence[Union[PurePath, PathLike, str]]: ...
+
+
+def compact_paths(
+    paths: Iterable[Union[PathLike, str]],
+) -> Sequence[Union[PurePath, PathLike, str]]:
+    """Store file names sharing a directory compactly, as far as possible."""
+    # consecutively numbered files, such as slice_0000.raw to slice_0999.raw,
+    # become a NumberedFileNames pattern, other files in one directory a
+    # DirectoryFileNames, files in different directories a list of the paths
+    # as given; only the names are kept, and each distinct directory is
+    # parsed once
+    directories: Dict[str, Optional[Path]] = {}
+    remaining = iter(paths)
+    directory: Optional[PurePath] = None
+    given: List[Union[PathLike, str]] = []
+    names: List[str] = []
+    for path in remaining:
+        split = _split_path(path, directories)
+        if split is not None and directory is None:
+            directory = split[0]
+        if split is None or split[0] != directory or not split[1]:
+            # e.g. different directories or path flavors, file system roots,
+            # or strings not written the same as their compact form
+            return [*given, path, *remaining]
+        given.append(path)
+        names.append(split[1])
+    if directory is None:
+        return []
+
+    # the names of other flavors, e.g. windows paths on linux, are joined to
+    # their directory, a pattern would create native paths
+    numbered = _numbered_pattern(names) if isinstance(directory, Path) else None
+    if numbered is not None:
+        pattern, indices = numbered
+        # the directory is escaped as well, it is part of the pattern
+        directory_pattern = _escape(str(directory / "_"))[:-1]
+        return NumberedFileNames(directory_pattern + pattern, indices)
+    return DirectoryFileNames(directory, names)
@@ -1,9 +1,24 @@
 """Reconstruction descriptor."""
 
+import copy
+from array import array
 from dataclasses import dataclass, field
+from os import PathLike
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
 
+from .fields import with_slots
 from .reconstruction_enums import (
     ReconstructionAlgorithmicOptimizationMode,
     ReconstructionAlgorithmMode,
@@ -38,10 +53,11 @@ from .reconstruction_enums import (
     ReconstructionRotationDirection,
     ReconstructionSpeckleRemovalMode,
 )
-from .types import Vector2f, Vector2i, Vector3f, Vector3i, Vectorf
+from .types import CompactVectorf, Vector2f, Vector2i, Vector3f, Vector3i, Vectorf
 from .volume import VolumeMetaInfoContainer
 
 
+@with_slots
 @dataclass
 class ReconstructionROISection:
     """Stores the extent of the aligned bounding box as two positions.
@@ -69,6 +85,7 @@ class ReconstructionROISection:
     """ The name for the region described by the bounding box. """
 
 
+@with_slots
 @dataclass
 class ReconstructionProjectionFileSection:
     """For defining one projection angle."""
@@ -83,6 +100,186 @@ class ReconstructionProjectionFileSection:
     """ Whether to ignore this angle or not. """
 
 
+def _read_only_projection_type() -> Type[ReconstructionProjectionFileSection]:
+    """Section type of the projections created by a table."""
+    # the frozen module builds on this one
+    from .frozen import frozen_type
+
+    return frozen_type(ReconstructionProjectionFileSection)
+
+
+def _angle_array(angles: Iterable[float]) -> array:
+    """Copy angles into an array of integers if they all are, else of doubles."""
+    if isinstance(angles, array):
+        return array(angles.typecode, angles)
+    values = list(angles)
+    integers = bool(values) and all(type(angle) is int for angle in values)
+    return array("q" if integers else "d", values)
+
+
+def _angle_values(angles: Any) -> List[Any]:  # noqa: ANN401
+    """List the angles as the values of the projection sections."""
+    # numpy floats of less than double precision are kept, as floats they
+    # would be written with spurious digits, e.g. 0.10000000149011612
+    dtype = getattr(angles, "dtype", None)
+    if dtype is not None and dtype.kind == "f" and dtype.itemsize != 8:
+        return list(angles)
+    return list(angles) if isinstance(angles, tuple) else angles.tolist()
+
+
+class ProjectionTable(Sequence[ReconstructionProjectionFileSection]):
+    """Columnar alternative to a list of ReconstructionProjectionFileSection.
+
+    Stores the file names, the angles as one array and the options as a
+    single integer bitmask instead of one section object per projection.
+    Bit *i* of ``options`` is the ``ReconstructionProjectionInfoOption`` of
+    projection *i*. Indexing and iterating yields section objects, so a table
+    can be used wherever a sequence of sections is expected. These sections
+    are created on access and read-only, assigning to their fields raises a
+    ``FrozenInstanceError`` instead of being lost.
+    """
+
+    __slots__ = ("file_names", "angles", "options")
+
+    def __init__(
+        self,
+        file_names: Sequence[Union[PathLike, str]],
+        angles: Union[Sequence[float], Any],
+        options: Union[int, Iterable[bool]] = 0,
+    ):
+        """Construct from the file names, angles and options of all projections."""
+        if len(file_names) != len(angles):
+            raise ValueError(
+                f"Got {len(file_names)} file names but {len(angles)} angles"
+            )
+
+        self.file_names = file_names
+        """ Projection file names """
+
+        # numpy arrays are kept as they are, integer angles stay integers
+        self.angles: Any = angles if hasattr(angles, "dtype") else _angle_array(angles)
+        """ Projection angles """
+
+        if not isinstance(options, int):
+            options = sum(1 << i for i, option in enumerate(options) if option)
+        self.options = options
+        """ Option bitmask """
+
+    @classmethod
+    def from_sections(
+        cls, sections: Iterable[ReconstructionProjectionFileSection]  # noqa: ANN102
+    ) -> "ProjectionTable":
+        """Construct from projection file sections."""
+        sections = list(sections)
+        return cls(
+            [s.ReconstructionProjectionInfoFileName for s in sections],
+            [s.ReconstructionProjectionInfoValue for s in sections],
+            [s.ReconstructionProjectionInfoOption for s in sections],
+        )
+
+    def iter_options(self) -> Iterator[bool]:
+        """Iterate the options of all projections."""
+        # one conversion of the bitmask instead of one shift per projection
+        bits = format(self.options, "b")[::-1].ljust(len(self), "0")
+        return (bit == "1" for bit in bits[: len(self)])
+
+    def angle_values(self) -> List[Any]:
+        """List the angles of all projections."""
+        return _angle_values(self.angles)
+
+    def iter_rows(self) -> Iterator[Tuple[Union[PathLike, str], float, bool]]:
+        """Iterate file name, angle and option of all projections."""
+        # compatibility with Python 3.9
+        return zip(  # noqa: B905
+            self.file_names, self.angle_values(), self.iter_options()
+        )
+
+    def __iter__(self) -> Iterator[ReconstructionProjectionFileSection]:
+        """Iterate the projections as read-only section objects."""
+        section_type = _read_only_projection_type()
+        for file_name, angle, option in self.iter_rows():
+            yield section_type(
+                ReconstructionProjectionInfoFileName=file_name,  # type: ignore
+                ReconstructionProjectionInfoValue=angle,
+                ReconstructionProjectionInfoOption=option,
+            )
+
+    def __len__(self) -> int:
+        """Number of projections."""
+        return len(self.file_names)
+
+    @overload
+    def __getitem__(  # noqa: D105, E704
+        self, index: int
+    ) -> ReconstructionProjectionFileSection: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ProjectionTable": ...  # noqa: D105, E704
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[ReconstructionProjectionFileSection, "ProjectionTable"]:
+        """Projection at index, or a table for slices."""
+        if isinstance(index, slice):
+            options = list(self.iter_options())[index]
+            return ProjectionTable(self.file_names[index], self.angles[index], options)
+
+        index = range(len(self))[index]
+        return _read_only_projection_type()(
+            ReconstructionProjectionInfoFileName=self.file_names[index],  # type: ignore
+            ReconstructionProjectionInfoValue=_angle_values(
+                self.angles[index : index + 1]
+            )[0],
+            ReconstructionProjectionInfoOption=bool(self.options >> index & 1),
+        )
+
+    def replace(
+        self, index: int, section: ReconstructionProjectionFileSection
+    ) -> Sequence[ReconstructionProjectionFileSection]:
+        """Copy with the projection at index replaced by section."""
+        # the table only stores angles of the type of its angles and options
+        # that are booleans, other values, e.g. placeholders or a float in a
+        # table of integers, turn the copy into a list
+        index = range(len(self))[index]
+        angle = section.ReconstructionProjectionInfoValue
+        option = section.ReconstructionProjectionInfoOption
+        stored = self[index].ReconstructionProjectionInfoValue
+        if type(angle) is not type(stored) or not isinstance(option, bool):
+            sections = list(self)
+            sections[index] = section
+            return sections
+
+        file_names = list(self.file_names)
+        file_names[index] = section.ReconstructionProjectionInfoFileName
+        # numpy arrays are copied as they are, read-only angles into an array
+        angles = (
+            copy.copy(self.angles)
+            if hasattr(self.angles, "dtype")
+            else _angle_array(self.angles)
+        )
+        angles[index] = angle
+        options = self.options & ~(1 << index) | option << index
+        return ProjectionTable(file_names, angles, options)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another table or sequence of sections."""
+        if isinstance(other, ProjectionTable):
+            return (
+                list(self.file_names) == list(other.file_names)
+                and list(self.angles) == list(other.angles)
+                and self.options == other.options
+            )
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"ProjectionTable(<{len(self)} projections>)"
+
+
 @dataclass
 class ReconstructionSection:
     """Class to completely define a scan setup and reconstruction process.
@@ -231,7 +428,7 @@ class ReconstructionSection:
     Optional definition.
     """
 
-    ReconstructionLineZPositionList: Vectorf = Vectorf()
+    ReconstructionLineZPositionList: Union[Vectorf, CompactVectorf] = Vectorf()
     """
     Used to set the slice z-positions in the reconstructed volume.
 
@@ -994,6 +1191,9 @@ class ReconstructionSection:
     """
     Set projection angular list.
 
+    Either a sequence of ``ReconstructionProjectionFileSection`` or, for large
+    numbers of projections, a ``ProjectionTable``.
+
     Setting the projection angles is completely orthogonal to all projection
     file name list functionality. Also projection sorting has no relevance here.
     All other projection related functionality is applicable however.
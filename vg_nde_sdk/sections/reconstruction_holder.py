@@ -1,13 +1,16 @@
 """Container holding the reconstructions."""
 
 from dataclasses import dataclass, field
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
-from .reconstruction import ReconstructionSection
+if TYPE_CHECKING:
+    # projects hold an empty reconstruction holder by default, which must not
+    # import the reconstruction sections
+    from .reconstruction import ReconstructionSection
 
 
 @dataclass
 class ReconstructionSectionHolder:
     """Reconstruction section holder."""
 
-    reconstructions: Sequence[ReconstructionSection] = field(default_factory=tuple)
+    reconstructions: Sequence["ReconstructionSection"] = field(default_factory=tuple)
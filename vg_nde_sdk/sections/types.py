@@ -4,10 +4,25 @@ We subclass the tuple in order to be able to both enforce strong types
 and to typecheck at runtime because different types serialize
 differently (number formatting, etc.).
 
+Long float lists can use ``CompactVectorf`` instead, which stores the values
+in a single buffer of doubles rather than as individual Python floats.
+
 """
 
 import copy
-from typing import Any, Dict, Optional, Sequence
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+    overload,
+)
 
 
 class Vectorf(tuple):
@@ -26,6 +41,104 @@ class Vectorf(tuple):
         return Vectorf(tuple((copy.deepcopy(x, memo) for x in self)))
 
 
+class CompactVectorf(Sequence[float]):
+    """Float vector backed by a read-only buffer of doubles."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, arg: Iterable[float] = ()):
+        """Construct from an iterable, copying the values into a new buffer."""
+        self._values = memoryview(array("d", arg)).toreadonly()
+
+    @classmethod
+    def from_numpy(cls, values: Any) -> "CompactVectorf":  # noqa: ANN102, ANN401
+        """Construct from a 1-D numpy array, sharing its memory if possible."""
+        import numpy
+
+        # only float64 arrays with contiguous memory can be used without a copy
+        values = numpy.ascontiguousarray(values, dtype=numpy.float64)
+        if values.ndim != 1:
+            raise ValueError(f"Expected a 1-D array, got {values.ndim} dimensions")
+
+        return cls._from_view(memoryview(values).toreadonly())
+
+    @classmethod
+    def _from_view(cls, view: memoryview) -> "CompactVectorf":  # noqa: ANN102
+        vector = cls.__new__(cls)
+        vector._values = view
+        return vector
+
+    def to_numpy(self) -> Any:  # noqa: ANN401
+        """Return a read-only numpy array sharing the memory of this vector."""
+        import numpy
+
+        return numpy.frombuffer(self._values, dtype=numpy.float64)
+
+    def tolist(self) -> List[float]:
+        """Return the values as a list of floats."""
+        return cast(List[float], self._values.tolist())
+
+    def __len__(self) -> int:
+        """Number of values."""
+        return len(self._values)
+
+    @overload
+    def __getitem__(self, index: int) -> float: ...  # noqa: D105, E704
+
+    @overload
+    def __getitem__(self, index: slice) -> "CompactVectorf": ...  # noqa: D105, E704
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[float, "CompactVectorf"]:
+        """Value at index, or a vector sharing the memory for slices."""
+        if isinstance(index, slice):
+            view = self._values[index]
+            if not view.c_contiguous:
+                # strided slices are copied, keeping all buffers contiguous
+                return CompactVectorf(view.tolist())
+            return self._from_view(view)
+        return self._values[index]
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate the values."""
+        return iter(self._values.tolist())
+
+    def __eq__(self, other: object) -> bool:
+        """Compare values with another float sequence."""
+        if isinstance(other, CompactVectorf):
+            return self._values == other._values
+        if isinstance(other, Sequence):
+            return self._values.tolist() == list(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash consistent with tuples holding the same values."""
+        return hash(tuple(self._values.tolist()))
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"CompactVectorf({self._values.tolist()!r})"
+
+    def __copy__(self):
+        """Copy implementation, sharing the read-only buffer."""
+        return self._from_view(self._values)
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]]):
+        """Deep copy implementation, copying the buffer in one go."""
+        copied = self._from_view(memoryview(self._to_array()).toreadonly())
+        if memo is not None:
+            memo[id(self)] = copied
+        return copied
+
+    def __reduce__(self):
+        """Pickle support."""
+        return CompactVectorf, (self._to_array(),)
+
+    def _to_array(self) -> array:
+        values = array("d")
+        values.frombytes(self._values.cast("B"))
+        return values
+
+
 class Vector3f(tuple):
     """3D float vector."""
 
@@ -41,6 +154,10 @@ class Vector3f(tuple):
         """Deep copy implementation."""
         return Vector3f(*(copy.deepcopy(x, memo) for x in self))
 
+    def __getnewargs__(self):
+        """Pickle support."""
+        return tuple(self)
+
 
 class Vector2f(tuple):
     """2D float vector."""
@@ -57,6 +174,10 @@ class Vector2f(tuple):
         """Deep copy implementation."""
         return Vector2f(*(copy.deepcopy(x, memo) for x in self))
 
+    def __getnewargs__(self):
+        """Pickle support."""
+        return tuple(self)
+
 
 class Vector3i(tuple):
     """3D int vector."""
@@ -73,6 +194,10 @@ class Vector3i(tuple):
         """Deep copy implementation."""
         return Vector3i(*(copy.deepcopy(x, memo) for x in self))
 
+    def __getnewargs__(self):
+        """Pickle support."""
+        return tuple(self)
+
 
 class Vector2i(tuple):
     """2D int vector."""
@@ -88,3 +213,7 @@ class Vector2i(tuple):
     def __deepcopy__(self, memo: Optional[Dict[int, Any]]):
         """Deep copy implementation."""
         return Vector2i(*(copy.deepcopy(x, memo) for x in self))
+
+    def __getnewargs__(self):
+        """Pickle support."""
+        return tuple(self)
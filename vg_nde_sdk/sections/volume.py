@@ -1,13 +1,16 @@
 """Volume descriptor."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import partial
 from pathlib import Path
-from typing import Sequence
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Union, overload
 
 from .component import ComponentInfoSection
+from .fields import field_values, with_slots
 from .manufacturer import ManufacturerInfoSection
+from .paths import NumberedFileNames
 from .scan import ScanInfoSection
-from .types import Vector2f, Vector3f, Vector3i, Vectorf
+from .types import CompactVectorf, Vector2f, Vector3f, Vector3i, Vectorf
 from .volume_enums import (
     VolumeAxesSwapMode,
     VolumeDataMappingMode,
@@ -18,6 +21,7 @@ from .volume_enums import (
 )
 
 
+@with_slots
 @dataclass
 class VolumeFileSection:
     """Descriptor class to define a single file of a volume data set import."""
@@ -78,7 +82,7 @@ class VolumeFileSection:
     Optional definition. The default value is 0.
     """
 
-    FilePositionList: Vectorf = Vectorf()
+    FilePositionList: Union[Vectorf, CompactVectorf] = Vectorf()
     """
     Defines physical positions of the file's slices.
 
@@ -95,9 +99,122 @@ class VolumeFileSection:
     you must do it for all files in the VolumeDescriptor, and each file must
     specify as many positions as its z-size indicates!
 
+    For long position lists, a ``CompactVectorf`` can be used to avoid storing
+    every position as a separate Python float.
+
     Optional definition.
     """
 
+    @classmethod
+    def bulk(
+        cls,  # noqa: ANN102
+        paths: Sequence[Path],
+        template: Optional["VolumeFileSection"] = None,
+    ) -> "VolumeFileSequence":
+        """Describe many files sharing all settings of template but the name."""
+        # the files of the returned sequence are read-only, to change single
+        # files use a list of sections instead
+        if template is None:
+            template = cls(FileName=Path())
+        return VolumeFileSequence(template, paths)
+
+
+class VolumeFileSequence(Sequence[VolumeFileSection]):
+    """Lazy sequence of volume files sharing all settings but the file name.
+
+    Only the file names and one template section are stored; the individual
+    ``VolumeFileSection`` objects are created on access. They are read-only,
+    assigning to their fields raises a ``FrozenInstanceError``, since the
+    change could not be stored in the sequence.
+    """
+
+    __slots__ = ("template", "file_names")
+
+    def __init__(
+        self,
+        template: VolumeFileSection,
+        file_names: Sequence[Path],
+    ):
+        """Construct from a template section and the file names."""
+        self.template = template
+        """ Section providing all settings except the file name """
+
+        self.file_names = file_names
+        """ File names of the volume files """
+
+    @classmethod
+    def from_pattern(
+        cls,  # noqa: ANN102
+        template: VolumeFileSection,
+        pattern: str,
+        indices: range,
+    ) -> "VolumeFileSequence":
+        """Construct from a file name pattern such as ``"slice_%05d.raw"``."""
+        return cls(template, NumberedFileNames(pattern, indices))
+
+    @overload
+    def __getitem__(self, index: int) -> VolumeFileSection: ...  # noqa: D105, E704
+
+    @overload
+    def __getitem__(self, index: slice) -> "VolumeFileSequence": ...  # noqa: D105, E704
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[VolumeFileSection, "VolumeFileSequence"]:
+        """Volume file at index, or a sequence for slices."""
+        if isinstance(index, slice):
+            return VolumeFileSequence(self.template, self.file_names[index])
+        return self._file_section_factory()(self.file_names[index])
+
+    def __iter__(self) -> Iterator[VolumeFileSection]:
+        """Iterate the volume files as read-only sections."""
+        return map(self._file_section_factory(), self.file_names)
+
+    def _file_section_factory(self) -> Callable[[Path], VolumeFileSection]:
+        """Create read-only sections from the template and a file name."""
+        # the frozen module builds on this one
+        from .frozen import frozen_type
+
+        values = field_values(self.template)
+        del values["FileName"]
+        return partial(frozen_type(VolumeFileSection), **values)  # type: ignore
+
+    def __len__(self) -> int:
+        """Number of volume files."""
+        return len(self.file_names)
+
+    def replace(
+        self, index: int, section: VolumeFileSection
+    ) -> Sequence[VolumeFileSection]:
+        """Copy with the volume file at index replaced by section."""
+        # a section differing from the template in more than the file name
+        # turns the copy into a list
+        index = range(len(self))[index]
+        if replace(section, FileName=self.template.FileName) != self.template:
+            sections = list(self)
+            sections[index] = section
+            return sections
+
+        file_names = list(self.file_names)
+        file_names[index] = section.FileName
+        return VolumeFileSequence(self.template, file_names)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another sequence of volume files."""
+        if isinstance(other, VolumeFileSequence):
+            return self.template == other.template and list(self.file_names) == list(
+                other.file_names
+            )
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"VolumeFileSequence({self.template!r}, <{len(self)} files>)"
+
 
 @dataclass
 class VolumeMetaInfoContainer:
@@ -543,10 +660,18 @@ class VolumeSection:
     an invalid box.
     """
 
-    VolumeProjections: Sequence[VolumeFileSection] = field(default_factory=tuple)
+    VolumeProjections: Union[
+        Sequence[VolumeFileSection], Iterable[VolumeFileSection]
+    ] = field(default_factory=tuple)
     """
     Set of file(s) the volume consists of.
 
+    Besides a list of ``VolumeFileSection``, a ``VolumeFileSequence`` can be
+    used to describe large slice stacks without one section object per file.
+    Its files are read-only; to change single files, use a list instead.
+    Any other iterable, e.g. a generator, is consumed while writing, so such a
+    project can only be written once.
+
     :Hint:
     Mandatory definition. At least one file must be specified to define a valid
     volume.
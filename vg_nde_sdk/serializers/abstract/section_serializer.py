@@ -1,7 +1,9 @@
 """Section serializer interface."""
 
 from abc import ABC, abstractmethod
-from typing import Mapping
+from typing import Iterator, Mapping
+
+from vg_nde_sdk.sections.fields import field_values
 
 
 class AbstractSectionSerializer(ABC):
@@ -15,3 +17,21 @@ class AbstractSectionSerializer(ABC):
     ) -> str:
         """Serialize the provided section."""
         pass  # pragma: no cover
+
+    def iter_serialize(
+        self,
+        section_name: str,
+        section_data: Mapping[str, object],
+    ) -> Iterator[str]:
+        """Serialize the provided section chunk-wise."""
+        # every chunk holds exactly one complete section block, so the
+        # concatenation of all chunks equals the result of serialize()
+        yield self.serialize(section_name, section_data)
+
+    def iter_serialize_object(
+        self,
+        section_name: str,
+        section: object,
+    ) -> Iterator[str]:
+        """Serialize the provided section object chunk-wise."""
+        yield from self.iter_serialize(section_name, field_values(section))
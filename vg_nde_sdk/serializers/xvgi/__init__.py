@@ -1,4 +1,78 @@
 """XVGI format serializer."""
 
-from .sections import *  # noqa
-from .writer import XVGIWriter  # noqa
+from typing import TYPE_CHECKING
+
+from vg_nde_sdk._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .instrumentation import (
+        ChromeTrace,
+        SectionEvent,
+        SectionStats,
+        SectionTotals,
+        WriterObserver,
+    )
+    from .prepared import PreparedProject
+    from .rewrite import SectionChanges
+    from .sections import (
+        ComponentInfoSectionSerializer,
+        ManufacturerInfoSectionSerializer,
+        MeshHolderSerializer,
+        MeshSectionSerializer,
+        PathEncoder,
+        ReconstructionHolderSerializer,
+        ReconstructionROISerializer,
+        ReconstructionSectionSerializer,
+        ScanInfoSectionSerializer,
+        SectionCache,
+        SectionSerializerBase,
+        VolumeHolderSerializer,
+        VolumeSectionSerializer,
+        register_formatter,
+    )
+    from .stream import XVGIStreamWriter
+    from .writer import XVGIWriter
+
+# e.g. the reconstruction serializers are only imported when a project with
+# reconstructions is written, or when one of their names is accessed
+__getattr__, __dir__, __all__ = lazy_attributes(
+    __name__,
+    {
+        ".instrumentation": [
+            "ChromeTrace",
+            "SectionEvent",
+            "SectionStats",
+            "SectionTotals",
+            "WriterObserver",
+        ],
+        ".prepared": ["PreparedProject"],
+        ".rewrite": ["SectionChanges"],
+        ".sections": [
+            "ComponentInfoSectionSerializer",
+            "ManufacturerInfoSectionSerializer",
+            "MeshHolderSerializer",
+            "MeshSectionSerializer",
+            "PathEncoder",
+            "ReconstructionHolderSerializer",
+            "ReconstructionROISerializer",
+            "ReconstructionSectionSerializer",
+            "ScanInfoSectionSerializer",
+            "SectionCache",
+            "SectionSerializerBase",
+            "VolumeHolderSerializer",
+            "VolumeSectionSerializer",
+            "register_formatter",
+        ],
+        ".stream": ["XVGIStreamWriter"],
+        ".writer": ["XVGIWriter"],
+    },
+    submodules=[
+        "fingerprint",
+        "instrumentation",
+        "prepared",
+        "rewrite",
+        "sections",
+        "stream",
+        "writer",
+    ],
+)
@@ -0,0 +1,124 @@
+"""Content digests of XVGI serializations."""
+
+import hashlib
+import pickle  # noqa: S403
+from array import array
+from dataclasses import fields, is_dataclass
+from operator import attrgetter
+from pathlib import PurePath
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, cast
+
+_DIGEST_SIZE = 32
+
+_SectionLayout = Tuple[bytes, Tuple[Callable[[object], object], ...]]
+""" Encoded section type name, and a getter per field """
+
+_section_layouts: Dict[type, _SectionLayout] = {}
+""" Layouts of the section types seen so far """
+
+
+class _HashWriter:
+    """File-like object feeding everything written into a hash."""
+
+    __slots__ = ("write",)
+
+    def __init__(self, update: Callable[[bytes], None]):
+        self.write = update
+
+
+def text_fingerprint(chunks: Iterable[str]) -> str:
+    """Digest of the UTF-8 encoded chunks, without retaining them."""
+    digest = hashlib.blake2b(digest_size=_DIGEST_SIZE, person=b"xvgi-text")
+    for chunk in chunks:
+        digest.update(chunk.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _section_layout(section_type: type) -> _SectionLayout:
+    """Layout of a section type."""
+    try:
+        return _section_layouts[section_type]
+    except KeyError:
+        pass
+    # frozen sections have the name of their section class, and are written
+    # the same
+    name = f"{section_type.__module__}.{section_type.__qualname__}\0"
+    getters = tuple(attrgetter(f.name) for f in fields(section_type))
+    layout = _section_layouts[section_type] = (name.encode("utf-8"), getters)
+    return layout
+
+
+def _is_section_sequence(value: object) -> bool:
+    """Whether value is a list or tuple of sections of one type."""
+    if type(value) not in (list, tuple) or not value:
+        return False
+    item_types = set(map(type, cast(Sequence[object], value)))
+    return len(item_types) == 1 and is_dataclass(item_types.pop())
+
+
+class _FieldHasher:
+    """Feeds the field values of sections into a hash."""
+
+    __slots__ = ("write",)
+
+    def __init__(self, update: Callable[[bytes], None]):
+        self.write = update
+
+    def value(self, value: object) -> None:
+        """Hash a section, a sequence of sections or any other value."""
+        if is_dataclass(value) and not isinstance(value, type):
+            name, getters = _section_layout(type(value))
+            self.write(b"S" + name)
+            for getter in getters:
+                self.value(getter(value))
+        elif _is_section_sequence(value):
+            self.columns(cast(Sequence[object], value))
+        else:
+            self.pickle(value)
+
+    def pickle(self, value: object) -> None:
+        """Hash a value by its pickle, which records its type and content."""
+        # without the memo, equal objects give the same bytes whether or not
+        # they are shared
+        self.write(b"P")
+        pickler = pickle.Pickler(_HashWriter(self.write), protocol=4)
+        pickler.fast = True  # type: ignore
+        pickler.dump(value)
+
+    def columns(self, sections: Sequence[object]) -> None:
+        """Hash sections of one type column by column."""
+        # sections mostly share their values, e.g. copies of one template,
+        # so every column is hashed as its distinct objects and one index
+        # per section; objects are told apart by identity, equal values may
+        # still be written differently, e.g. 0.0 and -0.0
+        name, getters = _section_layout(type(sections[0]))
+        self.write(b"C" + name + len(sections).to_bytes(8, "little"))
+        for getter in getters:
+            column = list(map(getter, sections))
+            objects = dict(zip(map(id, column), column))  # noqa: B905
+            indices = {key: index for index, key in enumerate(objects)}
+            self.distinct(list(objects.values()))
+            self.write(array("Q", map(indices.__getitem__, map(id, column))).tobytes())
+
+    def distinct(self, values: List[object]) -> None:
+        """Hash the distinct objects of a column."""
+        value_types = set(map(type, values))
+        if len(value_types) == 1 and issubclass(next(iter(value_types)), PurePath):
+            # e.g. the file names of a volume, which are usually all distinct;
+            # paths are given by their type and string
+            self.pickle((next(iter(value_types)), list(map(str, values))))
+        elif any(is_dataclass(t) or t in (list, tuple) for t in value_types):
+            # e.g. sequences of sections held by sections
+            self.write(b"D" + len(values).to_bytes(8, "little"))
+            for value in values:
+                self.value(value)
+        else:
+            self.pickle(values)
+
+
+def field_fingerprint(obj: object, salt: bytes) -> str:
+    """Digest of the field values of obj, without formatting them as text."""
+    digest = hashlib.blake2b(digest_size=_DIGEST_SIZE, person=b"xvgi-fields")
+    digest.update(salt)
+    _FieldHasher(digest.update).value(obj)
+    return digest.hexdigest()
@@ -0,0 +1,208 @@
+"""Timing and size instrumentation of the XVGI writer."""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, TextIO, Union
+
+
+@dataclass
+class SectionEvent:
+    """Serialization of one section block."""
+
+    name: str
+    """ Section name as written in the header, i.e. with escaped characters """
+
+    section_type: str
+    """ Kind of section, such as ``FileSection`` or ``ScanInfoSection`` """
+
+    field_count: int
+    """ Number of value lines """
+
+    size: int
+    """ Number of UTF-8 encoded bytes """
+
+    start: float
+    """ Start of the serialization, in seconds of ``time.perf_counter`` """
+
+    duration: float
+    """ Wall time of the serialization in seconds """
+
+
+class WriterObserver:
+    """Receives the sections serialized and the output written by a writer.
+
+    Both methods do nothing by default, subclasses override the ones they
+    need. They are called from the thread consuming the serialization.
+    """
+
+    def section_serialized(self, event: SectionEvent):
+        """Handle a serialized section."""
+
+    def output_written(self, size: int, start: float, duration: float):
+        """Handle size bytes written to the output, starting at start."""
+
+
+_section_types: Dict[str, str] = {}
+""" Section types by section names without their trailing index """
+
+
+def _section_type(name: str) -> str:
+    """Kind of a section from its escaped name, e.g. ``FileSection``."""
+    unnumbered = name.rstrip("0123456789")
+    try:
+        return _section_types[unnumbered]
+    except KeyError:
+        pass
+
+    # sub sections are appended to the names of their parents, some followed
+    # by an index
+    parts = [part for part in name.split("\\_") if not part.isdigit()]
+    section_type = parts[-1].rstrip("0123456789") if parts else name
+    _section_types[unnumbered] = section_type
+    return section_type
+
+
+def _encoded_size(chunk: str) -> int:
+    return len(chunk) if chunk.isascii() else len(chunk.encode("utf-8"))
+
+
+def observe_chunks(chunks: Iterator[str], observer: WriterObserver) -> Iterator[str]:
+    """Report every section block to the observer as it is serialized."""
+    clock = time.perf_counter
+    while True:
+        # the generator serializes the next section on demand, so the time
+        # taken by next() is the time spent serializing it
+        start = clock()
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            return
+        duration = clock() - start
+
+        name = chunk[1 : chunk.index("]\n")]
+        observer.section_serialized(
+            SectionEvent(
+                name,
+                _section_type(name),
+                chunk.count("\n\t"),
+                _encoded_size(chunk),
+                start,
+                duration,
+            )
+        )
+        yield chunk
+
+
+@dataclass
+class SectionTotals:
+    """Accumulated counters of sections of one kind, or of output writes."""
+
+    count: int = 0
+    """ Number of sections or writes """
+
+    field_count: int = 0
+    """ Number of value lines """
+
+    size: int = 0
+    """ Number of bytes """
+
+    duration: float = 0.0
+    """ Wall time in seconds """
+
+
+@dataclass
+class SectionStats(WriterObserver):
+    """Aggregates the sections serialized by type, and the output written."""
+
+    sections: Dict[str, SectionTotals] = field(default_factory=dict)
+    """ Totals by section type """
+
+    output: SectionTotals = field(default_factory=SectionTotals)
+    """ Totals of the output writes """
+
+    def section_serialized(self, event: SectionEvent):
+        """Add a serialized section to the totals of its type."""
+        totals = self.sections.get(event.section_type)
+        if totals is None:
+            totals = self.sections[event.section_type] = SectionTotals()
+        totals.count += 1
+        totals.field_count += event.field_count
+        totals.size += event.size
+        totals.duration += event.duration
+
+    def output_written(self, size: int, start: float, duration: float):
+        """Add a write to the output totals."""
+        self.output.count += 1
+        self.output.size += size
+        self.output.duration += duration
+
+    def report(self) -> str:
+        """Table of the totals, slowest section types first."""
+        rows = sorted(self.sections.items(), key=lambda item: -item[1].duration)
+        rows.append(("<output>", self.output))
+        width = max(len(name) for name, _ in rows)
+        lines = [
+            f"{'section':<{width}} {'count':>9} {'fields':>10} {'bytes':>12} {'s':>9}"
+        ]
+        for name, totals in rows:
+            lines.append(
+                f"{name:<{width}} {totals.count:>9} {totals.field_count:>10} "
+                f"{totals.size:>12} {totals.duration:>9.3f}"
+            )
+        return "\n".join(lines)
+
+
+class ChromeTrace(WriterObserver):
+    """Records sections and writes as Chrome trace events.
+
+    The trace can be loaded into ``chrome://tracing`` or Perfetto.
+    """
+
+    def __init__(self):
+        """Construct an empty trace."""
+        self.events: List[Dict[str, object]] = []
+        """ Recorded trace events """
+
+    def _add_event(
+        self, name: str, category: str, start: float, duration: float, **args: object
+    ) -> None:
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                # timestamps are in microseconds
+                "ts": start * 1e6,
+                "dur": duration * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+    def section_serialized(self, event: SectionEvent):
+        """Record a complete event for the section."""
+        self._add_event(
+            event.name,
+            event.section_type,
+            event.start,
+            event.duration,
+            field_count=event.field_count,
+            size=event.size,
+        )
+
+    def output_written(self, size: int, start: float, duration: float):
+        """Record a complete event for the write."""
+        self._add_event("write", "output", start, duration, size=size)
+
+    def dump(self, file: TextIO):
+        """Write the trace as JSON into a provided file."""
+        json.dump({"traceEvents": self.events}, file)
+
+    def write_path(self, path: Union[os.PathLike, str]):
+        """Write the trace as JSON into a file at path."""
+        with open(path, "wt", encoding="utf-8") as file:
+            self.dump(file)
@@ -0,0 +1,110 @@
+"""Prepared project templates."""
+
+import re
+import secrets
+from dataclasses import dataclass
+from os import PathLike
+from typing import Callable, FrozenSet, List, Mapping, Tuple, Union
+
+from vg_nde_sdk.projects import ProjectDescription, get_path, replace_path
+
+from .sections.base import format_value
+
+
+class _Slot:
+    """Placeholder written as a unique marker in place of a slot value."""
+
+    __slots__ = ("marker",)
+
+    def __init__(self, marker: str):
+        self.marker = marker
+
+    def __format__(self, format_spec: str) -> str:
+        return self.marker % "f"
+
+    def __str__(self) -> str:
+        return self.marker % "f"
+
+    def __repr__(self) -> str:
+        # values nested in containers are written by their repr
+        return self.marker % "r"
+
+
+@dataclass(frozen=True)
+class PreparedProject:
+    """Project serialized once, with named slots for the values that change.
+
+    Rendering only formats the slot values and joins them with the
+    precomputed text in between, independent of the size of the project.
+    """
+
+    texts: Tuple[str, ...]
+    """ Serialized text before, between and after the slot occurrences """
+
+    occurrences: Tuple[Tuple[str, bool], ...]
+    """ Slot name of every occurrence, and whether it is written by repr """
+
+    slot_names: FrozenSet[str]
+    """ Names of all slots """
+
+    def render(self, values: Mapping[str, object]) -> str:
+        """Serialize the project with the given slot values."""
+        if values.keys() != self.slot_names:
+            raise ValueError(
+                f"Expected values for the slots {sorted(self.slot_names)}, "
+                f"got {sorted(values)}"
+            )
+
+        parts = [self.texts[0]]
+        # compatibility with Python 3.9
+        for (name, by_repr), text in zip(  # noqa: B905
+            self.occurrences, self.texts[1:]
+        ):
+            value = values[name]
+            parts.append(repr(value) if by_repr else format_value(value))
+            parts.append(text)
+        return "".join(parts)
+
+    def write_path(self, values: Mapping[str, object], path: Union[PathLike, str]):
+        """Write the project with the given slot values into a UTF-8 file."""
+        with open(path, "wb") as file:
+            file.write(self.render(values).encode("utf-8"))
+
+
+def prepare_project(
+    serialize: Callable[[ProjectDescription], str],
+    project_description: ProjectDescription,
+    slots: Mapping[str, str],
+) -> PreparedProject:
+    """Serialize a project with placeholders at the dotted paths of the slots."""
+    # the nonce keeps markers apart from anything in the project itself
+    nonce = secrets.token_hex(8)
+    names = list(slots)
+    for index, path in enumerate(slots.values()):
+        # vectors convert their components on construction, so they can only
+        # be slots as a whole
+        parent_path, _, _ = path.rpartition(".")
+        parent = get_path(project_description, parent_path) if parent_path else None
+        if isinstance(parent, tuple) and type(parent) is not tuple:
+            raise ValueError(
+                f"Slot {names[index]!r} is a component of a vector, "
+                f"use a slot for the whole vector {parent_path!r} instead"
+            )
+        placeholder = _Slot(f"\0{nonce}%s{index}\0")
+        project_description = replace_path(project_description, path, placeholder)
+
+    pieces = re.split(f"\0{nonce}([fr])(\\d+)\0", serialize(project_description))
+
+    # re.split alternates text, kind and index
+    texts = pieces[::3]
+    occurrences: List[Tuple[str, bool]] = [
+        (names[int(index)], kind == "r")
+        # compatibility with Python 3.9
+        for kind, index in zip(pieces[1::3], pieces[2::3])  # noqa: B905
+    ]
+
+    unwritten = set(names) - {name for name, _ in occurrences}
+    if unwritten:
+        raise ValueError(f"Slots {sorted(unwritten)} are not written to the file")
+
+    return PreparedProject(tuple(texts), tuple(occurrences), frozenset(names))
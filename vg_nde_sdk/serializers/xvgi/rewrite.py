@@ -0,0 +1,128 @@
+"""Rewriting XVGI files only where their content changed."""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Iterable, List, Optional, Tuple, Union
+
+from .instrumentation import WriterObserver
+
+_SPOOL_SIZE = 64 << 20
+""" Size up to which a new serialization is kept in memory before comparing """
+
+
+def _section_hash(block: bytes) -> bytes:
+    return hashlib.blake2b(block, digest_size=16).digest()
+
+
+def _header_name(block: bytes) -> str:
+    header = block.split(b"\n", 1)[0]
+    return header.decode("utf-8").strip()[1:-1]
+
+
+def _hash_file_sections(path: Path) -> List[Tuple[str, bytes]]:
+    """Name and content hash of every section block in a file."""
+    sections = []
+    block: List[bytes] = []
+    with open(path, "rb") as file:
+        for line in file:
+            # blocks start at their header, value lines are indented
+            if line.startswith(b"[") and block:
+                content = b"".join(block)
+                sections.append((_header_name(content), _section_hash(content)))
+                block.clear()
+            block.append(line)
+    if block:
+        content = b"".join(block)
+        sections.append((_header_name(content), _section_hash(content)))
+    return sections
+
+
+@dataclass(frozen=True)
+class SectionChanges:
+    """Differences between an existing XVGI file and a new serialization."""
+
+    # sections are named as in their headers, i.e. with escaped characters
+    changed: Tuple[str, ...]
+    """ Sections present in both, but with different content """
+
+    added: Tuple[str, ...]
+    """ Sections only present in the new serialization """
+
+    removed: Tuple[str, ...]
+    """ Sections only present in the existing file """
+
+    written: bool
+    """ Whether the file was (re)written """
+
+
+def write_if_changed(
+    chunks: Iterable[str],
+    path: Union[os.PathLike, str],
+    observer: Optional[WriterObserver] = None,
+) -> SectionChanges:
+    """Write chunks to path unless the file already holds the same sections."""
+    path = Path(path)
+    existing = _hash_file_sections(path) if path.exists() else []
+    existing_hashes = dict(existing)
+
+    new: List[Tuple[str, bytes]] = []
+    changed: List[str] = []
+    added: List[str] = []
+
+    # the new serialization is produced only once, it is kept in memory or a
+    # local temporary file until it is known whether it has to be written
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_SIZE) as spool:
+        for chunk in chunks:
+            content = chunk.encode("utf-8")
+            spool.write(content)
+
+            name, content_hash = _header_name(content), _section_hash(content)
+            new.append((name, content_hash))
+            if name not in existing_hashes:
+                added.append(name)
+            elif existing_hashes[name] != content_hash:
+                changed.append(name)
+
+        new_names = {name for name, _ in new}
+        removed = [name for name, _ in existing if name not in new_names]
+
+        written = new != existing
+        if written:
+            # replacing the file is the only write to the output
+            size = spool.tell()
+            spool.seek(0)
+            start = time.perf_counter()
+            _replace_file(path, spool)
+            if observer is not None:
+                observer.output_written(size, start, time.perf_counter() - start)
+
+    return SectionChanges(tuple(changed), tuple(added), tuple(removed), written)
+
+
+def _replace_file(
+    path: Path, content: Union[IO[bytes], tempfile.SpooledTemporaryFile]
+) -> None:
+    """Atomically replace the file at path with the content."""
+    if not path.exists():
+        with open(path, "wb") as file:
+            shutil.copyfileobj(content, file)
+        return
+
+    # the temporary file is placed next to the target, renaming is only
+    # atomic within a file system
+    temporary = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with temporary:
+            shutil.copyfileobj(content, temporary)
+        shutil.copymode(path, temporary.name)
+        os.replace(temporary.name, path)
+    except BaseException:
+        os.unlink(temporary.name)
+        raise
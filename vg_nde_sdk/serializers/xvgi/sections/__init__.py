@@ -1,13 +1,57 @@
 """Section serializers."""
 
-from .base import SectionSerializerBase
-from .component_serializer import *  # noqa
-from .manufacturer_serializer import *  # noqa
-from .mesh_holder_serializer import *  # noqa
-from .mesh_serializer import *  # noqa
-from .reconstruction_holder_serializer import *  # noqa
-from .reconstruction_roi_serializer import *  # noqa
-from .reconstruction_serializer import *  # noqa
-from .scan_serializer import *  # noqa
-from .volume_holder_serializer import *  # noqa
-from .volume_serializer import *  # noqa
+from typing import TYPE_CHECKING
+
+from vg_nde_sdk._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .base import SectionSerializerBase, register_formatter
+    from .cache import SectionCache
+    from .component_serializer import ComponentInfoSectionSerializer
+    from .manufacturer_serializer import ManufacturerInfoSectionSerializer
+    from .mesh_holder_serializer import MeshHolderSerializer
+    from .mesh_serializer import MeshSectionSerializer
+    from .paths import PathEncoder
+    from .reconstruction_holder_serializer import ReconstructionHolderSerializer
+    from .reconstruction_roi_serializer import ReconstructionROISerializer
+    from .reconstruction_serializer import ReconstructionSectionSerializer
+    from .scan_serializer import ScanInfoSectionSerializer
+    from .volume_holder_serializer import VolumeHolderSerializer
+    from .volume_serializer import VolumeSectionSerializer
+
+# serializer modules are imported on first access of one of their names
+__getattr__, __dir__, __all__ = lazy_attributes(
+    __name__,
+    {
+        ".base": ["SectionSerializerBase", "register_formatter"],
+        ".cache": ["SectionCache"],
+        ".component_serializer": ["ComponentInfoSectionSerializer"],
+        ".manufacturer_serializer": ["ManufacturerInfoSectionSerializer"],
+        ".mesh_holder_serializer": ["MeshHolderSerializer"],
+        ".mesh_serializer": ["MeshSectionSerializer"],
+        ".paths": ["PathEncoder"],
+        ".reconstruction_holder_serializer": ["ReconstructionHolderSerializer"],
+        ".reconstruction_roi_serializer": ["ReconstructionROISerializer"],
+        ".reconstruction_serializer": ["ReconstructionSectionSerializer"],
+        ".scan_serializer": ["ScanInfoSectionSerializer"],
+        ".volume_holder_serializer": ["VolumeHolderSerializer"],
+        ".volume_serializer": ["VolumeSectionSerializer"],
+    },
+    submodules=[
+        "base",
+        "cache",
+        "component_serializer",
+        "formatting",
+        "manufacturer_serializer",
+        "mesh_holder_serializer",
+        "mesh_serializer",
+        "parallel",
+        "paths",
+        "reconstruction_holder_serializer",
+        "reconstruction_roi_serializer",
+        "reconstruction_serializer",
+        "scan_serializer",
+        "volume_holder_serializer",
+        "volume_serializer",
+    ],
+)
@@ -1,18 +1,43 @@
 """Base section serializer."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, fields, is_dataclass
 from enum import Enum
+from functools import lru_cache, singledispatch
+from itertools import chain
+from operator import attrgetter
 from os import PathLike
-from pathlib import PurePath, PureWindowsPath
-from typing import Mapping, Optional
+from pathlib import PurePath
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+)
 
-from vg_nde_sdk.sections import Vector2f, Vector2i, Vector3f, Vector3i, Vectorf
+from vg_nde_sdk.sections import (
+    CompactVectorf,
+    Vector2f,
+    Vector2i,
+    Vector3f,
+    Vector3i,
+    Vectorf,
+)
+from vg_nde_sdk.sections.fields import field_values
 from vg_nde_sdk.serializers import AbstractSectionSerializer
 
+from .cache import SectionCache, make_cache_key
+from .formatting import format_floats
 
-def _escape_key(s: str) -> str:
-    """Mapping used to escape characters in keys."""
-    escape_map = {
+_ESCAPE_TABLE = str.maketrans(
+    {
         ";": "\\;",
         "[": "\\[",
         "]": "\\]",
@@ -23,21 +48,211 @@ def _escape_key(s: str) -> str:
         "_": "\\_",
         "\\": "\\\\",
     }
-    return s.translate(str.maketrans(escape_map))  # type: ignore
+)
+
+
+def escape_key(s: str) -> str:
+    """Mapping used to escape characters in keys."""
+    return s.translate(_ESCAPE_TABLE)
+
+
+def _format_none(_: None) -> str:
+    return ""
+
+
+def _format_pure_path(v: PurePath) -> str:
+    return v.as_posix()
+
+
+def _format_path(v: PathLike) -> str:
+    return PurePath(v).as_posix()
+
+
+def _format_int_vector(v: Sequence[int]) -> str:
+    return "  ".join(f"{i}" for i in v)
+
+
+def _format_enum(v: Enum) -> str:
+    return str(v).replace(".", "_")
+
+
+def _make_enum_formatter(enum_type: Type[Enum]) -> Callable[[Enum], str]:
+    # every member is turned into its token exactly once
+    tokens = {member: _format_enum(member) for member in enum_type}
+    return tokens.__getitem__
+
+
+@singledispatch
+def _registered_formatter(v: object) -> str:
+    return format(v)
+
+
+_registered_formatter.register(type(None), _format_none)
+_registered_formatter.register(PurePath, _format_pure_path)
+_registered_formatter.register(PathLike, _format_path)
+_registered_formatter.register(Enum, _format_enum)
+for _float_vector in (Vector3f, Vector2f, Vectorf, CompactVectorf):
+    _registered_formatter.register(_float_vector, format_floats)
+for _int_vector in (Vector3i, Vector2i):
+    _registered_formatter.register(_int_vector, _format_int_vector)
+
+_numpy_registered = False
+""" Whether the formatters of numpy types have been registered """
+
+
+def _register_numpy_formatters() -> None:
+    """Register the numpy formatters, once numpy values show up."""
+    global _numpy_registered
+    _numpy_registered = True
+
+    # numpy has been imported by whoever created the value
+    numpy = sys.modules["numpy"]
+    # scalars are written like the python values they stand for, floats
+    # with the shortest representation at their own precision
+    formatters = {
+        numpy.ndarray: _format_numpy_array,
+        numpy.bool_: _format_numpy_scalar,
+        numpy.integer: _format_numpy_scalar,
+        numpy.floating: _format_numpy_floating,
+    }
+    for value_type, formatter in formatters.items():
+        # formatters registered before for these types are kept
+        if value_type not in _registered_formatter.registry:
+            _registered_formatter.register(value_type, formatter)
+    # formatters resolved before, e.g. for subclasses of numpy types, may
+    # be the fallback
+    _formatters.clear()
+
+
+def _format_numpy_scalar(v: object) -> str:
+    return format_value(cast(Any, v).item())
+
+
+def _format_numpy_floating(v: object) -> str:
+    # e.g. 0.1 for float32, which converted to a python float is written as
+    # 0.10000000149011612
+    return str(v)
+
+
+def _format_numpy_array(array: object) -> str:
+    v = cast(Any, array)
+    if v.ndim == 0:
+        return format_value(v[()])
+    if v.ndim == 1 and v.dtype.kind == "f":
+        return format_floats(v)
+    if v.ndim == 1 and v.dtype.kind in "iu":
+        return _format_int_vector(v.tolist())
+    if v.ndim == 1:
+        # the representation of numpy wraps long arrays over several lines
+        return format(v.tolist())
+    raise ValueError(
+        f"Cannot write an array of shape {v.shape} as a value, "
+        "only 1-D arrays are supported"
+    )
+
 
+def register_formatter(value_type: type, formatter: Callable[[Any], str]):
+    """Format values of value_type and its subclasses with formatter."""
+    # formatters are resolved once per type, so register them before
+    # serializing values of the type, and before filling any section cache
+    _registered_formatter.register(value_type, formatter)
+    _formatters.clear()
 
-def _map_infinite_float(nr: float) -> float:
-    if nr == float("inf"):
-        return 3.402823e38
-    if nr == float("-inf"):
-        return 1.175494e-38
-    return nr
+
+def _resolve_formatter(value_type: type) -> Callable[[Any], str]:
+    """Select the formatter for values of the given type."""
+    if not _numpy_registered and any(
+        base.__module__.partition(".")[0] == "numpy" for base in value_type.__mro__
+    ):
+        _register_numpy_formatters()
+
+    formatter = _registered_formatter.dispatch(value_type)
+    if formatter is _format_enum:
+        return _make_enum_formatter(value_type)
+    return formatter
+
+
+_formatters: Dict[type, Callable[[Any], str]] = {}
+""" Formatters resolved so far, by value type """
+
+
+def format_value(v: object) -> str:
+    """Format a single value."""
+    try:
+        formatter = _formatters[type(v)]
+    except KeyError:
+        formatter = _formatters[type(v)] = _resolve_formatter(type(v))
+    return formatter(v)
+
+
+@dataclass(frozen=True)
+class SectionPlan:
+    """Precompiled serialization of one section type."""
+
+    getter: Callable[[object], Tuple[object, ...]]
+    """ Fetches the values of all serialized attributes at once """
+
+    template: str
+    """ %-template of all value lines, with one slot per attribute """
+
+
+@lru_cache(maxsize=None)
+def compile_plan(
+    section_type: type,
+    attr_renaming: Tuple[Tuple[str, str], ...],
+    exclude: Tuple[str, ...],
+) -> SectionPlan:
+    """Compile the serialization plan for a section type."""
+    renaming = dict(attr_renaming)
+    attributes = tuple(
+        f.name for f in fields(section_type) if f.name not in exclude  # type: ignore
+    )
+    template = "".join(
+        f"\t{escape_key(renaming.get(a, a))} = ".replace("%", "%%") + "%s\n"
+        for a in attributes
+    )
+
+    if not attributes:
+        getter: Callable[[object], Tuple[object, ...]] = lambda _: ()  # noqa: E731
+    elif len(attributes) == 1:
+        single = attrgetter(attributes[0])
+        getter = lambda section: (single(section),)  # noqa: E731
+    else:
+        getter = attrgetter(*attributes)
+
+    return SectionPlan(getter, template)
+
+
+def _definition_depth(cls: type, name: str) -> int:
+    """Position in the MRO of cls of the class defining the attribute name."""
+    return next(i for i, c in enumerate(cls.__mro__) if name in vars(c))
+
+
+def _serialize_fields(
+    self: AbstractSectionSerializer, section_name: str, section: object
+) -> Iterator[str]:
+    """Serialize a section object through serialize."""
+    yield self.serialize(section_name, field_values(section))
 
 
 @dataclass
 class SectionSerializerBase(AbstractSectionSerializer):
     """Base section serializer."""
 
+    def __init_subclass__(cls, **kwargs: Any):  # noqa: ANN401
+        """Serialize objects through the mapping methods a subclass overrides."""
+        super().__init_subclass__(**kwargs)
+        # serializing objects bypasses serialize and iter_serialize, so
+        # subclasses overriding them, e.g. custom serializers registered with
+        # the writer, serialize objects through their overrides instead
+        object_depth = _definition_depth(cls, "iter_serialize_object")
+        if _definition_depth(cls, "serialize") < object_depth:
+            cls.iter_serialize_object = _serialize_fields  # type: ignore
+        elif _definition_depth(cls, "iter_serialize") < object_depth:
+            cls.iter_serialize_object = (  # type: ignore
+                AbstractSectionSerializer.iter_serialize_object
+            )
+
     def serialize(
         self,
         name: str,
@@ -46,6 +261,14 @@ class SectionSerializerBase(AbstractSectionSerializer):
         """Serialize section."""
         return self.serialize_with_renaming_meta(name, data)
 
+    def iter_serialize_object(
+        self,
+        section_name: str,
+        section: object,
+    ) -> Iterator[str]:
+        """Serialize the provided section object chunk-wise."""
+        yield self.serialize_object(section_name, section)
+
     def serialize_with_renaming_meta(
         self,
         name: str,
@@ -58,40 +281,73 @@ class SectionSerializerBase(AbstractSectionSerializer):
         metadata = metadata or {}
 
         # write the section out
-        result = f"[{_escape_key(name)}]\n"
+        lines = [f"[{escape_key(name)}]\n"]
         for k, v in data.items():
             # process the key
-            escaped_key = _escape_key(attr_renaming.get(k, k))
+            escaped_key = escape_key(attr_renaming.get(k, k))
 
             # process the value
-            if v is None:
-                v = ""
-
-            elif isinstance(v, PureWindowsPath):
-                v = v.as_posix()
+            lines.append(f"\t{escaped_key} = {format_value(v)}\n")
 
-            elif isinstance(v, PathLike):
-                v = PurePath(v).as_posix()
+        # append metadata
+        for tag, desc in metadata.items():
+            lines.append(f"\t{escape_key(tag)} = {desc}\n")
 
-            elif isinstance(v, Enum):
-                v = str(v).replace(".", "_")
+        lines.append("\n")
 
-            elif (
-                isinstance(v, Vector3f)
-                or isinstance(v, Vector2f)
-                or isinstance(v, Vectorf)
-            ):
-                v = "  ".join(f"{_map_infinite_float(f):.7f}" for f in v)
+        return "".join(lines)
 
-            elif isinstance(v, Vector3i) or isinstance(v, Vector2i):
-                v = "  ".join(f"{i}" for i in v)
+    def serialize_object(
+        self,
+        name: str,
+        section: object,
+        attr_renaming: Optional[Mapping[str, str]] = None,
+        metadata: Optional[Mapping[str, str]] = None,
+        exclude: Collection[str] = (),
+        cache: Optional[SectionCache] = None,
+    ) -> str:
+        """Serialize a section dataclass, skipping the excluded attributes."""
+        if not is_dataclass(section):
+            data = {k: v for k, v in field_values(section).items() if k not in exclude}
+            return self.serialize_with_renaming_meta(
+                name, data, attr_renaming, metadata
+            )
 
-            result += f"\t{escaped_key} = {v}\n"
+        section_type: type = type(section)
+        plan_key = (
+            tuple(attr_renaming.items()) if attr_renaming else (),
+            tuple(exclude),
+        )
+        plan = compile_plan(section_type, *plan_key)
+        values = plan.getter(section)
 
-        # append metadata
-        for tag, desc in metadata.items():
-            result += f"\t{_escape_key(tag)} = {desc}\n"
+        header = f"[{escape_key(name)}]\n"
+        if cache is None:
+            return header + self._serialize_body(plan, values, metadata)
 
-        result += "\n"
+        # the body does not depend on the section name, so it can be shared
+        # between all sections with the same content
+        # plans are kept for good, so their ids identify type and layout
+        key = make_cache_key(
+            id(plan),
+            values + tuple(chain(*metadata.items())) if metadata else values,
+        )
+        body = cache.get(key)
+        if body is None:
+            body = self._serialize_body(plan, values, metadata)
+            cache.put(key, body)
+        return header + body
 
-        return result
+    @staticmethod
+    def _serialize_body(
+        plan: SectionPlan,
+        values: Tuple[object, ...],
+        metadata: Optional[Mapping[str, str]],
+    ) -> str:
+        """Serialize the value and metadata lines of a section."""
+        body = plan.template % tuple(map(format_value, values))
+        if metadata:
+            body += "".join(
+                f"\t{escape_key(tag)} = {desc}\n" for tag, desc in metadata.items()
+            )
+        return body + "\n"
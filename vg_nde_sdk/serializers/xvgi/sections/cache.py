@@ -0,0 +1,111 @@
+"""Cache for serialized section bodies."""
+
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Dict, Hashable, Optional, Tuple, cast
+
+_EXACT_KEY_TYPES = frozenset((str, int, bool, type(None)))
+
+_exact_type_combinations: Dict[Tuple[type, ...], bool] = {}
+""" Whether combinations of value types can be used in keys as they are """
+
+
+def _is_exact(value_types: Tuple[type, ...]) -> bool:
+    try:
+        return _exact_type_combinations[value_types]
+    except KeyError:
+        exact = all(t in _EXACT_KEY_TYPES or issubclass(t, Enum) for t in value_types)
+        _exact_type_combinations[value_types] = exact
+        return exact
+
+
+def _key_value(value: object) -> Hashable:
+    """Key standing for a value which is not used in keys as it is."""
+    if hasattr(value, "dtype") and hasattr(value, "tobytes"):
+        # numpy abbreviates the repr of large arrays
+        array = cast(Any, value)
+        return array.dtype.str, array.shape, array.tobytes()
+    return repr(value)
+
+
+def make_cache_key(layout: Hashable, values: Tuple[object, ...]) -> Hashable:
+    """Cache key of a section from its layout and values."""
+    # values comparing equal must only share a key if they are formatted the
+    # same, which rules out 1 == 1.0 == True, -0.0 == 0.0 or case-insensitive
+    # windows paths, so only values of exact types are used as they are and
+    # all others go by their repr or, for numpy values, their bytes
+    value_types = tuple(map(type, values))
+    if not _is_exact(value_types):
+        values = tuple(map(_key_value, values))
+    return layout, value_types, values
+
+
+class SectionCache:
+    """LRU cache for the bodies of serialized sections.
+
+    Sections with the same type and field values serialize to the same lines,
+    only the section name differs. The cache therefore stores the body below
+    the section header, keyed by the section content.
+
+    The cache can be shared between threads, the counters are approximate then.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Construct a cache holding at most maxsize section bodies."""
+        self.maxsize = maxsize
+        """ Maximum number of cached bodies """
+
+        self.hits = 0
+        """ Number of lookups answered from the cache """
+
+        self.misses = 0
+        """ Number of lookups not found in the cache """
+
+        self._bodies: "OrderedDict[Hashable, str]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Look up a body, counting the hit or miss."""
+        body = self._bodies.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        try:
+            self._bodies.move_to_end(key)
+        except KeyError:
+            # evicted by another thread in the meantime
+            pass
+        return body
+
+    def put(self, key: Hashable, body: str):
+        """Store a body, evicting the least recently used one if full."""
+        self._bodies[key] = body
+        self._bodies.move_to_end(key)
+        while len(self._bodies) > self.maxsize:
+            try:
+                self._bodies.popitem(last=False)
+            except KeyError:
+                # emptied by another thread in the meantime
+                break
+
+    def clear(self):
+        """Remove all bodies and reset the counters."""
+        self._bodies.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached bodies."""
+        return len(self._bodies)
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return (
+            f"SectionCache(maxsize={self.maxsize}, size={len(self)}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    def __reduce__(self) -> Tuple[type, Tuple[int]]:
+        """Pickle support, e.g. for process pools, as a new empty cache."""
+        return SectionCache, (self.maxsize,)
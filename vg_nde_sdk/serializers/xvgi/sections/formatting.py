@@ -0,0 +1,52 @@
+"""Bulk value formatting."""
+
+import sys
+from typing import Iterable, List, Sequence, Union
+
+_INF = float("inf")
+_NEG_INF = float("-inf")
+
+_INF_REPLACEMENT = 3.402823e38
+_NEG_INF_REPLACEMENT = 1.175494e-38
+
+
+def _map_infinite_float(nr: float) -> float:
+    if nr == _INF:
+        return _INF_REPLACEMENT
+    if nr == _NEG_INF:
+        return _NEG_INF_REPLACEMENT
+    return nr
+
+
+def _finite_numpy_values(values: object) -> List[float]:
+    """Convert a 1-D numpy array to a list with infinite values mapped."""
+    numpy = sys.modules["numpy"]
+
+    infinite = numpy.isinf(values)
+    if not infinite.any():
+        return values.tolist()  # type: ignore
+
+    # map in double precision, so the replacement values are the same as the
+    # ones used for python floats
+    mapped = numpy.array(values, dtype=numpy.float64)
+    mapped[infinite & (mapped > 0)] = _INF_REPLACEMENT
+    mapped[infinite & (mapped < 0)] = _NEG_INF_REPLACEMENT
+    return mapped.tolist()
+
+
+def format_floats(values: Union[Sequence[float], Iterable[float]]) -> str:
+    """Format floats the way float vectors are written to XVGI files."""
+    # a numpy array can only be passed in if numpy has already been imported,
+    # so there is no need to import it here
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        values = _finite_numpy_values(values)
+    else:
+        if not isinstance(values, (list, tuple)):
+            values = values.tolist() if hasattr(values, "tolist") else list(values)
+        # membership tests run in C, the slow path is only taken if needed
+        if _INF in values or _NEG_INF in values:
+            values = [_map_infinite_float(f) for f in values]
+
+    # a single formatting operation for the whole vector
+    return "  ".join(["%.7f"] * len(values)) % tuple(values)
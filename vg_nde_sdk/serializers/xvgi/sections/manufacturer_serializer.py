@@ -1,9 +1,12 @@
 """Manufacturer info serializers."""
 
 from dataclasses import dataclass, field
-from typing import Mapping, cast
+from typing import Iterator, Mapping, Optional, cast
+
+from vg_nde_sdk.sections import ManufacturerInfoSection
 
 from .base import SectionSerializerBase
+from .cache import SectionCache
 
 
 @dataclass
@@ -17,6 +20,9 @@ class ManufacturerInfoSectionSerializer(SectionSerializerBase):
         }
     )
 
+    cache: Optional[SectionCache] = None
+    """ Cache for the serialized section bodies, if any """
+
     def serialize(
         self,
         section_name: str,
@@ -34,3 +40,20 @@ class ManufacturerInfoSectionSerializer(SectionSerializerBase):
         )
 
         return result
+
+    def iter_serialize_object(
+        self,
+        section_name: str,
+        section: object,
+    ) -> Iterator[str]:
+        """Serialize the provided section object chunk-wise."""
+        section = cast(ManufacturerInfoSection, section)
+
+        yield super().serialize_object(
+            section_name,
+            section,
+            self.attribute_renaming,
+            section.Metadata,
+            exclude=("Metadata",),
+            cache=self.cache,
+        )
@@ -1,9 +1,12 @@
 """Mesh holder serializer."""
 
 from dataclasses import dataclass
-from typing import Mapping, Sequence, cast
+from typing import Iterator, Mapping, Optional, Sequence, cast
+
+from vg_nde_sdk.sections import MeshSectionHolder
 
 from .base import SectionSerializerBase
+from .cache import SectionCache
 from .mesh_serializer import MeshSectionSerializer
 
 
@@ -13,17 +16,35 @@ class MeshHolderSerializer(SectionSerializerBase):
 
     current_mesh_index: int = 0
 
+    section_cache: Optional[SectionCache] = None
+    """ Cache handed to the serializers of the meta info sections """
+
     def serialize(
         self,
         section_name: str,
         section_data: Mapping[str, object],
     ) -> str:
         """Serialize the provided section."""
-        mesh_serializer = MeshSectionSerializer()
+        return "".join(self.iter_serialize(section_name, section_data))
+
+    def iter_serialize(
+        self,
+        section_name: str,
+        section_data: Mapping[str, object],
+    ) -> Iterator[str]:
+        """Serialize the provided section chunk-wise."""
+        # other keys are ignored, a holder only writes the sections it holds
         meshes = cast(Sequence, section_data.get("meshes", ()))
-        result = ""
-        for mesh in meshes:
+        yield from self.iter_serialize_object(section_name, MeshSectionHolder(meshes))
+
+    def iter_serialize_object(
+        self,
+        section_name: str,
+        section: object,
+    ) -> Iterator[str]:
+        """Serialize the provided section object chunk-wise."""
+        mesh_serializer = MeshSectionSerializer(section_cache=self.section_cache)
+        for mesh in cast(MeshSectionHolder, section).meshes:
             name = f"MeshSection{self.current_mesh_index}"
             self.current_mesh_index += 1
-            result += mesh_serializer.serialize(name, vars(mesh))
-        return result
+            yield from mesh_serializer.iter_serialize_object(name, mesh)
@@ -1,11 +1,12 @@
 """Mesh serializers."""
 
 from dataclasses import dataclass, field
-from typing import Mapping, cast
+from typing import Iterator, Mapping, Optional, cast
 
-from vg_nde_sdk.sections.mesh import MeshMetaInfoContainer
+from vg_nde_sdk.sections.mesh import MeshMetaInfoContainer, MeshSection
 
 from .base import SectionSerializerBase
+from .cache import SectionCache
 from .component_serializer import ComponentInfoSectionSerializer
 
 
@@ -15,23 +16,49 @@ class MeshSectionSerializer(SectionSerializerBase):
 
     attribute_renaming: Mapping[str, str] = field(default_factory=lambda: {})
 
+    section_cache: Optional[SectionCache] = None
+    """ Cache handed to the serializers of the meta info sections """
+
     def serialize(
         self,
         section_name: str,
         section_data: Mapping[str, object],
     ) -> str:
         """Serialize the provided section."""
-        section_data = dict(section_data)
-
-        result = super().serialize(section_name, section_data)
+        return "".join(self.iter_serialize(section_name, section_data))
 
-        metaData = cast(
+    def iter_serialize(
+        self,
+        section_name: str,
+        section_data: Mapping[str, object],
+    ) -> Iterator[str]:
+        """Serialize the provided section chunk-wise."""
+        # only the given keys are written, missing meta info is written empty
+        meta_info = cast(
             MeshMetaInfoContainer,
-            section_data.pop("MetaInfo", MeshMetaInfoContainer()),
+            section_data.get("MetaInfo", MeshMetaInfoContainer()),
         )
 
-        result += ComponentInfoSectionSerializer().serialize(
-            f"{section_name}_ComponentInfoSection", vars(metaData.ComponentInfo)
-        )
+        yield super().serialize(section_name, section_data)
+        yield from self._iter_meta_info(section_name, meta_info)
 
-        return result
+    def iter_serialize_object(
+        self,
+        section_name: str,
+        section: object,
+    ) -> Iterator[str]:
+        """Serialize the provided section object chunk-wise."""
+        mesh = cast(MeshSection, section)
+
+        yield super().serialize_object(section_name, mesh)
+        yield from self._iter_meta_info(section_name, mesh.MetaInfo)
+
+    def _iter_meta_info(
+        self, section_name: str, meta_info: MeshMetaInfoContainer
+    ) -> Iterator[str]:
+        """Serialize the meta info sections."""
+        yield from ComponentInfoSectionSerializer(
+            cache=self.section_cache
+        ).iter_serialize_object(
+            f"{section_name}_ComponentInfoSection", meta_info.ComponentInfo
+        )
@@ -0,0 +1,36 @@
+"""Concurrent serialization of independent sections."""
+
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import Deque, Iterable, Iterator, List, Tuple
+
+from vg_nde_sdk.serializers import AbstractSectionSerializer
+
+
+def _serialize_chunks(
+    serializer: AbstractSectionSerializer, section_name: str, section: object
+) -> List[str]:
+    """Serialize a section into its list of chunks."""
+    # module level, so it can be sent to process pools
+    return list(serializer.iter_serialize_object(section_name, section))
+
+
+def iter_serialize_concurrently(
+    executor: Executor,
+    serializer: AbstractSectionSerializer,
+    named_sections: Iterable[Tuple[str, object]],
+    window: int,
+) -> Iterator[str]:
+    """Serialize named sections on an executor, yielding chunks in order."""
+    # at most `window` sections are in flight, which bounds the memory held by
+    # finished but not yet written sections
+    pending: Deque["Future[List[str]]"] = deque()
+    for section_name, section in named_sections:
+        pending.append(
+            executor.submit(_serialize_chunks, serializer, section_name, section)
+        )
+        if len(pending) >= window:
+            yield from pending.popleft().result()
+
+    while pending:
+        yield from pending.popleft().result()
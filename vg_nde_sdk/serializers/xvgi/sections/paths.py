@@ -0,0 +1,117 @@
+"""Path formatting."""
+
+import os
+from pathlib import PurePath, PureWindowsPath
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Type, Union
+
+from vg_nde_sdk.sections import DirectoryFileNames, NumberedFileNames
+
+from .base import format_value
+
+
+class PathEncoder:
+    """Formats paths as POSIX strings, caching the forms of their directories.
+
+    Paths in the same directory only differ in their last component, so
+    parsing the directory once and appending the file names gives the same
+    result as ``PurePath(path).as_posix()`` at a fraction of the cost.
+    ``str`` and ``bytes`` paths are parsed with the given flavor without
+    creating path objects.
+    """
+
+    __slots__ = ("flavor", "maxsize", "_windows", "_directories")
+
+    def __init__(self, flavor: Type[PurePath] = PurePath, maxsize: int = 4096):
+        """Construct an encoder parsing plain string paths with flavor."""
+        self.flavor = type(flavor())
+        """ Path class used to parse ``str`` and ``bytes`` paths """
+
+        self.maxsize = maxsize
+        """ Number of directories cached before the cache is emptied """
+
+        self._windows = issubclass(self.flavor, PureWindowsPath)
+        self._directories: Dict[str, Optional[str]] = {}
+
+    def encode(self, path: Union[str, bytes, "os.PathLike[str]"]) -> str:
+        """POSIX form of a path."""
+        if isinstance(path, PurePath):
+            # already parsed
+            return path.as_posix()
+        if not isinstance(path, str):
+            path = os.fsdecode(path)
+
+        # the last separator, followed by the file name
+        split = path.rfind("/")
+        if self._windows:
+            split = max(split, path.rfind("\\"))
+        split += 1
+        name = path[split:]
+        if split == 0 or name in ("", ".") or (self._windows and ":" in name):
+            return self.flavor(path).as_posix()
+
+        posix_directory = self._cached_directory(path[:split])
+        if posix_directory is None:
+            return self.flavor(path).as_posix()
+        return posix_directory + name
+
+    def encode_all(
+        self, paths: Iterable[Union[str, bytes, "os.PathLike[str]"]]
+    ) -> Iterator[str]:
+        """POSIX forms of many paths."""
+        return map(self.encode, paths)
+
+    def encode_numbered(self, pattern: str, indices: Iterable[int]) -> Iterator[str]:
+        """POSIX forms of the paths generated by a printf-style pattern."""
+        split = pattern.rfind("/")
+        if self._windows:
+            split = max(split, pattern.rfind("\\"))
+        split += 1
+        name = pattern[split:]
+        try:
+            directory: Optional[str] = pattern[:split] % ()
+        except (TypeError, ValueError):
+            # the number is part of the directory
+            directory = None
+
+        # numbers never contain separators, so if only the file name is
+        # numbered all paths share one directory
+        if directory is not None and not (self._windows and ":" in name):
+            posix_directory = self._cached_directory(directory)
+            if posix_directory is not None:
+                return (posix_directory + name % i for i in indices)
+        return self.encode_all(pattern % i for i in indices)
+
+    def _cached_directory(self, directory: str) -> Optional[str]:
+        """POSIX form of a directory, parsed only on first use."""
+        try:
+            return self._directories[directory]
+        except KeyError:
+            if len(self._directories) >= self.maxsize:
+                self._directories.clear()
+            posix = self._directories[directory] = self._encode_directory(directory)
+            return posix
+
+    def _encode_directory(self, directory: str) -> Optional[str]:
+        """POSIX form of a directory, ready to have a file name appended."""
+        posix = self.flavor(directory).as_posix()
+        if posix == ".":
+            posix = ""
+        elif not posix.endswith("/"):
+            posix += "/"
+
+        # e.g. the share of a windows UNC path is not a file name, so some
+        # directories cannot have names appended
+        if self.flavor(directory + "_").as_posix() != posix + "_":
+            return None
+        return posix
+
+
+def encode_file_names(file_names: Sequence[object]) -> Iterator[str]:
+    """Formatted file names, without creating path objects for compact ones."""
+    if isinstance(file_names, NumberedFileNames):
+        return PathEncoder().encode_numbered(file_names.pattern, file_names.indices)
+    if isinstance(file_names, DirectoryFileNames):
+        # plain names are appended to the directory as they are
+        prefix = (file_names.directory / "_").as_posix()[:-1]
+        return (prefix + name for name in file_names.names)
+    return map(format_value, file_names)
@@ -1,9 +1,14 @@
 """Reconstruction holder serializer."""
 
+from concurrent.futures import Executor
 from dataclasses import dataclass
-from typing import Mapping, Sequence, cast
+from typing import Iterator, Mapping, Optional, Sequence, Tuple, cast
+
+from vg_nde_sdk.sections import ReconstructionSection, ReconstructionSectionHolder
 
 from .base import SectionSerializerBase
+from .cache import SectionCache
+from .parallel import iter_serialize_concurrently
 from .reconstruction_serializer import ReconstructionSectionSerializer
 
 
@@ -13,17 +18,64 @@ class ReconstructionHolderSerializer(SectionSerializerBase):
 
     current_reconstruction_index: int = 0
 
+    executor: Optional[Executor] = None
+    """ Executor serializing the reconstructions concurrently, if any """
+
+    executor_window: int = 64
+    """ Maximum number of reconstructions submitted to the executor at once """
+
+    section_cache: Optional[SectionCache] = None
+    """ Cache handed to the serializers of the ROI sections """
+
     def serialize(
         self,
         section_name: str,
         section_data: Mapping[str, object],
     ) -> str:
         """Serialize the provided section."""
-        reconstruction_serializer = ReconstructionSectionSerializer()
+        return "".join(self.iter_serialize(section_name, section_data))
+
+    def iter_serialize(
+        self,
+        section_name: str,
+        section_data: Mapping[str, object],
+    ) -> Iterator[str]:
+        """Serialize the provided section chunk-wise."""
+        # other keys are ignored, a holder only writes the sections it holds
         reconstructions = cast(Sequence, section_data.get("reconstructions", ()))
-        result = ""
-        for reco in reconstructions:
+        yield from self.iter_serialize_object(
+            section_name, ReconstructionSectionHolder(reconstructions)
+        )
+
+    def iter_serialize_object(
+        self,
+        section_name: str,
+        section: object,
+    ) -> Iterator[str]:
+        """Serialize the provided section object chunk-wise."""
+        reconstruction_serializer = ReconstructionSectionSerializer(
+            section_cache=self.section_cache
+        )
+        named_reconstructions = self._iter_named_reconstructions(
+            cast(ReconstructionSectionHolder, section)
+        )
+        if self.executor is not None:
+            yield from iter_serialize_concurrently(
+                self.executor,
+                reconstruction_serializer,
+                named_reconstructions,
+                self.executor_window,
+            )
+            return
+
+        for name, reco in named_reconstructions:
+            yield from reconstruction_serializer.iter_serialize_object(name, reco)
+
+    def _iter_named_reconstructions(
+        self, holder: ReconstructionSectionHolder
+    ) -> Iterator[Tuple[str, ReconstructionSection]]:
+        """Number the reconstructions, the only state shared between them."""
+        for reco in holder.reconstructions:
             name = f"ReconstructionSection{self.current_reconstruction_index}"
             self.current_reconstruction_index += 1
-            result += reconstruction_serializer.serialize(name, vars(reco))
-        return result
+            yield name, reco
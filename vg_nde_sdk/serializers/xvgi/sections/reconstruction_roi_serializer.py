@@ -1,15 +1,19 @@
 """Reconstrution ROI serializer."""
 
 from dataclasses import dataclass
-from typing import Mapping
+from typing import Iterator, Mapping, Optional
 
 from .base import SectionSerializerBase
+from .cache import SectionCache
 
 
 @dataclass
 class ReconstructionROISerializer(SectionSerializerBase):
     """Serializer for reconstruction ROI section."""
 
+    cache: Optional[SectionCache] = None
+    """ Cache for the serialized section bodies, if any """
+
     def serialize(
         self,
         section_name: str,
@@ -24,3 +28,11 @@ class ReconstructionROISerializer(SectionSerializerBase):
             {},
         )
         return result
+
+    def iter_serialize_object(
+        self,
+        section_name: str,
+        section: object,
+    ) -> Iterator[str]:
+        """Serialize the provided section object chunk-wise."""
+        yield super().serialize_object(section_name, section, cache=self.cache)
@@ -1,68 +1,108 @@
 """Reconstruction descriptor serializer."""
 
 from dataclasses import dataclass
-from typing import Mapping, Sequence, cast
+from typing import Iterable, Iterator, Mapping, Optional, cast
 
 from vg_nde_sdk.sections import (
+    ProjectionTable,
     ReconstructionProjectionFileSection,
     ReconstructionROISection,
+    ReconstructionSection,
 )
-from vg_nde_sdk.sections.volume import VolumeMetaInfoContainer
 
-from .base import SectionSerializerBase
-from .component_serializer import ComponentInfoSectionSerializer
-from .manufacturer_serializer import ManufacturerInfoSectionSerializer
+from .base import SectionSerializerBase, compile_plan, escape_key, format_value
+from .cache import SectionCache
+from .paths import encode_file_names
 from .reconstruction_roi_serializer import ReconstructionROISerializer
-from .scan_serializer import ScanInfoSectionSerializer
 
 
 @dataclass
 class ReconstructionSectionSerializer(SectionSerializerBase):
     """Serializer for reconstruction section."""
 
+    section_cache: Optional[SectionCache] = None
+    """ Cache handed to the serializers of the ROI sections """
+
     def serialize(
         self,
         section_name: str,
         section_data: Mapping[str, object],
     ) -> str:
         """Serialize the provided section."""
-        roi_serializer = ReconstructionROISerializer()
+        return "".join(self.iter_serialize(section_name, section_data))
 
+    def iter_serialize(
+        self,
+        section_name: str,
+        section_data: Mapping[str, object],
+    ) -> Iterator[str]:
+        """Serialize the provided section chunk-wise."""
+        # only the given keys are written
         section_data = dict(section_data)
         rois = cast(
-            Sequence[ReconstructionROISection], section_data.pop("AxisAlignedRois")
-        )
-        projections = cast(
-            Sequence[ReconstructionProjectionFileSection],
-            section_data.pop("ProjectionFiles"),
+            Iterable[ReconstructionROISection], section_data.pop("AxisAlignedRois", ())
         )
+        projections = cast(Iterable[object], section_data.pop("ProjectionFiles", ()))
+
+        yield super().serialize_with_renaming_meta(section_name, section_data, {}, {})
+        yield from self._iter_held(section_name, rois, projections)
+
+    def iter_serialize_object(
+        self,
+        section_name: str,
+        section: object,
+    ) -> Iterator[str]:
+        """Serialize the provided section object chunk-wise."""
+        reconstruction = cast(ReconstructionSection, section)
 
-        result = super().serialize_with_renaming_meta(
+        yield super().serialize_object(
             section_name,
-            section_data,
-            {},
-            {},
+            reconstruction,
+            exclude=("AxisAlignedRois", "ProjectionFiles"),
+        )
+        yield from self._iter_held(
+            section_name, reconstruction.AxisAlignedRois, reconstruction.ProjectionFiles
         )
 
+    def _iter_held(
+        self,
+        section_name: str,
+        rois: Iterable[ReconstructionROISection],
+        projections: Iterable[object],
+    ) -> Iterator[str]:
+        """Serialize the ROI and projection sections."""
+        roi_serializer = ReconstructionROISerializer(cache=self.section_cache)
+
         # ROIs
         for i, r in enumerate(rois):
             roi_section_name = f"{section_name}_AxisAlignedRoiListSection_{i}"
-            result += roi_serializer.serialize(roi_section_name, vars(r))
+            yield from roi_serializer.iter_serialize_object(roi_section_name, r)
 
         # Projections
+        if isinstance(projections, ProjectionTable):
+            yield from self._iter_projection_table(section_name, projections)
+            return
+
         for i, p in enumerate(projections):
             projection_section_name = f"{section_name}_ProjectionFilesSection_{i}"
-            result += super().serialize(projection_section_name, vars(p))
+            yield super().serialize_object(projection_section_name, p)
 
-        metaData = cast(VolumeMetaInfoContainer, section_data.pop("VolumeMetaInfo"))
-        ManufacturerInfoSectionSerializer().serialize(
-            f"{section_name}_ManufacturerInfoSection", vars(metaData.ManufacturerInfo)
-        )
-        ScanInfoSectionSerializer().serialize(
-            f"{section_name}_ScanInfoSection", vars(metaData.ScanInfo)
-        )
-        ComponentInfoSectionSerializer().serialize(
-            f"{section_name}_ComponentInfoSection", vars(metaData.ComponentInfo)
-        )
+    def _iter_projection_table(
+        self, section_name: str, projections: ProjectionTable
+    ) -> Iterator[str]:
+        """Serialize the columns of a projection table into section blocks."""
+        # same text as serializing one ReconstructionProjectionFileSection per
+        # projection, with the block template built only once
+        header = escape_key(f"{section_name}_ProjectionFilesSection_")
+        plan = compile_plan(ReconstructionProjectionFileSection, (), ())
+        template = f"[{header.replace('%', '%%')}%d]\n{plan.template}\n"
 
-        return result
+        options = ("False", "True")
+        # compatibility with Python 3.9
+        rows = zip(  # noqa: B905
+            encode_file_names(projections.file_names),
+            map(format_value, projections.angle_values()),
+            projections.iter_options(),
+        )
+        for i, (file_name, angle, option) in enumerate(rows):
+            yield template % (i, file_name, angle, options[option])
@@ -1,9 +1,14 @@
 """Volume holder serializer."""
 
+from concurrent.futures import Executor
 from dataclasses import dataclass
-from typing import Mapping, Sequence, cast
+from typing import Iterator, Mapping, Optional, Sequence, Tuple, cast
+
+from vg_nde_sdk.sections import VolumeSection, VolumeSectionHolder
 
 from .base import SectionSerializerBase
+from .cache import SectionCache
+from .parallel import iter_serialize_concurrently
 from .volume_serializer import VolumeSectionSerializer
 
 
@@ -13,17 +18,57 @@ class VolumeHolderSerializer(SectionSerializerBase):
 
     current_volume_index: int = 0
 
+    executor: Optional[Executor] = None
+    """ Executor serializing the volumes concurrently, if any """
+
+    executor_window: int = 64
+    """ Maximum number of volumes submitted to the executor at once """
+
+    section_cache: Optional[SectionCache] = None
+    """ Cache handed to the serializers of the meta info sections """
+
     def serialize(
         self,
         section_name: str,
         section_data: Mapping[str, object],
     ) -> str:
         """Serialize the provided section."""
-        volume_serializer = VolumeSectionSerializer()
+        return "".join(self.iter_serialize(section_name, section_data))
+
+    def iter_serialize(
+        self,
+        section_name: str,
+        section_data: Mapping[str, object],
+    ) -> Iterator[str]:
+        """Serialize the provided section chunk-wise."""
+        # other keys are ignored, a holder only writes the sections it holds
         volumes = cast(Sequence, section_data.get("volumes", ()))
-        result = ""
-        for volume in volumes:
+        yield from self.iter_serialize_object(
+            section_name, VolumeSectionHolder(volumes)
+        )
+
+    def iter_serialize_object(
+        self,
+        section_name: str,
+        section: object,
+    ) -> Iterator[str]:
+        """Serialize the provided section object chunk-wise."""
+        volume_serializer = VolumeSectionSerializer(section_cache=self.section_cache)
+        named_volumes = self._iter_named_volumes(cast(VolumeSectionHolder, section))
+        if self.executor is not None:
+            yield from iter_serialize_concurrently(
+                self.executor, volume_serializer, named_volumes, self.executor_window
+            )
+            return
+
+        for name, volume in named_volumes:
+            yield from volume_serializer.iter_serialize_object(name, volume)
+
+    def _iter_named_volumes(
+        self, holder: VolumeSectionHolder
+    ) -> Iterator[Tuple[str, VolumeSection]]:
+        """Number the volumes, the only state shared between them."""
+        for volume in holder.volumes:
             name = f"VolumeSection{self.current_volume_index}"
             self.current_volume_index += 1
-            result += volume_serializer.serialize(name, vars(volume))
-        return result
+            yield name, volume
@@ -1,13 +1,19 @@
 """Volume serializers."""
 
-from dataclasses import dataclass, field
-from typing import Mapping, Sequence, cast
+from dataclasses import dataclass, field, fields
+from typing import Iterable, Iterator, Mapping, Optional, cast
 
-from vg_nde_sdk.sections.volume import VolumeFileSection, VolumeMetaInfoContainer
+from vg_nde_sdk.sections import (
+    VolumeFileSequence,
+    VolumeMetaInfoContainer,
+    VolumeSection,
+)
 
-from .base import SectionSerializerBase
+from .base import SectionSerializerBase, compile_plan, escape_key, format_value
+from .cache import SectionCache
 from .component_serializer import ComponentInfoSectionSerializer
 from .manufacturer_serializer import ManufacturerInfoSectionSerializer
+from .paths import encode_file_names
 from .scan_serializer import ScanInfoSectionSerializer
 
 
@@ -17,41 +23,113 @@ class VolumeSectionSerializer(SectionSerializerBase):
 
     attribute_renaming: Mapping[str, str] = field(default_factory=lambda: {})
 
+    section_cache: Optional[SectionCache] = None
+    """ Cache handed to the serializers of the meta info sections """
+
     def serialize(
         self,
         section_name: str,
         section_data: Mapping[str, object],
     ) -> str:
         """Serialize the provided section."""
-        section_data = dict(section_data)
-
-        projections = cast(
-            Sequence[VolumeFileSection], section_data.pop("VolumeProjections", ())
-        )
+        return "".join(self.iter_serialize(section_name, section_data))
 
-        metaData = cast(
+    def iter_serialize(
+        self,
+        section_name: str,
+        section_data: Mapping[str, object],
+    ) -> Iterator[str]:
+        """Serialize the provided section chunk-wise."""
+        # only the given keys are written, missing meta info is written empty
+        section_data = dict(section_data)
+        projections = cast(Iterable[object], section_data.pop("VolumeProjections", ()))
+        meta_info = cast(
             VolumeMetaInfoContainer,
             section_data.pop("VolumeMetaInfo", VolumeMetaInfoContainer()),
         )
 
-        result = super().serialize_with_renaming_meta(
+        yield super().serialize_with_renaming_meta(
             section_name, section_data, self.attribute_renaming, {}
         )
+        yield from self._iter_projections(section_name, projections)
+        yield from self._iter_meta_info(section_name, meta_info)
 
-        for i, p in enumerate(projections):
-            file_section_name = f"{section_name}_FileSection{i}"
-            result += super().serialize_with_renaming_meta(
-                file_section_name, vars(p), self.attribute_renaming, {}
-            )
+    def iter_serialize_object(
+        self,
+        section_name: str,
+        section: object,
+    ) -> Iterator[str]:
+        """Serialize the provided section object chunk-wise."""
+        volume = cast(VolumeSection, section)
 
-        result += ManufacturerInfoSectionSerializer().serialize(
-            f"{section_name}_ManufacturerInfoSection", vars(metaData.ManufacturerInfo)
+        yield super().serialize_object(
+            section_name,
+            volume,
+            self.attribute_renaming,
+            exclude=("VolumeMetaInfo", "VolumeProjections"),
         )
-        result += ScanInfoSectionSerializer().serialize(
-            f"{section_name}_ScanInfoSection", vars(metaData.ScanInfo)
+
+        yield from self._iter_projections(section_name, volume.VolumeProjections)
+        yield from self._iter_meta_info(section_name, volume.VolumeMetaInfo)
+
+    def _iter_projections(
+        self, section_name: str, projections: Iterable[object]
+    ) -> Iterator[str]:
+        """Serialize the volume file sections."""
+        if isinstance(projections, VolumeFileSequence):
+            yield from self._iter_file_sequence(section_name, projections)
+        else:
+            # generators are only expanded here, while writing
+            yield from self._iter_file_sections(section_name, projections)
+
+    def _iter_meta_info(
+        self, section_name: str, metaData: VolumeMetaInfoContainer
+    ) -> Iterator[str]:
+        """Serialize the meta info sections."""
+        yield from ManufacturerInfoSectionSerializer(
+            cache=self.section_cache
+        ).iter_serialize_object(
+            f"{section_name}_ManufacturerInfoSection", metaData.ManufacturerInfo
         )
-        result += ComponentInfoSectionSerializer().serialize(
-            f"{section_name}_ComponentInfoSection", vars(metaData.ComponentInfo)
+        yield from ScanInfoSectionSerializer(
+            cache=self.section_cache
+        ).iter_serialize_object(f"{section_name}_ScanInfoSection", metaData.ScanInfo)
+        yield from ComponentInfoSectionSerializer(
+            cache=self.section_cache
+        ).iter_serialize_object(
+            f"{section_name}_ComponentInfoSection", metaData.ComponentInfo
         )
 
-        return result
+    def _iter_file_sections(
+        self, section_name: str, projections: Iterable[object]
+    ) -> Iterator[str]:
+        """Serialize volume file sections one by one."""
+        for i, p in enumerate(projections):
+            file_section_name = f"{section_name}_FileSection{i}"
+            yield super().serialize_object(
+                file_section_name, p, self.attribute_renaming
+            )
+
+    def _iter_file_sequence(
+        self, section_name: str, projections: VolumeFileSequence
+    ) -> Iterator[str]:
+        """Serialize a volume file sequence, formatting the template only once."""
+        template = projections.template
+        template_type: type = type(template)
+        plan = compile_plan(template_type, tuple(self.attribute_renaming.items()), ())
+        values = list(map(format_value, plan.getter(template)))
+
+        # split the formatted template block at the file name, which is the
+        # only value differing between the files
+        field_names = [f.name for f in fields(template)]
+        values[field_names.index("FileName")] = "\0"
+        body = plan.template % tuple(values)
+        if body.count("\0") != 1:
+            yield from self._iter_file_sections(section_name, projections)
+            return
+        before, after = body.split("\0")
+
+        names = encode_file_names(projections.file_names)
+        header = f"[{escape_key(f'{section_name}_FileSection')}"
+        for i, name in enumerate(names):
+            yield f"{header}{i}]\n{before}{name}{after}\n"
@@ -0,0 +1,252 @@
+"""Push-style XVGI writer."""
+
+from collections import deque
+from dataclasses import replace
+from os import PathLike
+from types import TracebackType
+from typing import (
+    BinaryIO,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+    cast,
+)
+
+from vg_nde_sdk.projects import ProjectDescription
+from vg_nde_sdk.sections import (
+    MeshSection,
+    MeshSectionHolder,
+    ReconstructionProjectionFileSection,
+    ReconstructionSection,
+    ReconstructionSectionHolder,
+    VolumeFileSection,
+    VolumeSection,
+    VolumeSectionHolder,
+)
+
+from .instrumentation import observe_chunks
+from .writer import DEFAULT_BUFFER_SIZE, INDEX_ATTRIBUTES, XVGIWriter
+
+_HOLDER_TYPES: Dict[str, type] = {
+    "VolumeSection": VolumeSectionHolder,
+    "MeshSection": MeshSectionHolder,
+    "ReconstructionSection": ReconstructionSectionHolder,
+}
+""" Holder type of each numbered section type """
+
+
+class _PushedSections:
+    """Sections handed to a running serialization one at a time."""
+
+    __slots__ = ("pending", "closed")
+
+    def __init__(self, sections: Iterable[object] = ()):
+        self.pending: Deque[object] = deque(sections)
+        self.closed = False
+
+    def __iter__(self) -> "_PushedSections":
+        return self
+
+    def __next__(self) -> object:
+        if self.pending:
+            return self.pending.popleft()
+        if self.closed:
+            raise StopIteration
+        raise RuntimeError("The serializer asked for a section not yet added")
+
+
+class XVGIStreamWriter:
+    """Writes volume files and projections to an XVGI file as they arrive.
+
+    Volumes and reconstructions are begun with their settings, their files
+    are added one by one and written out in large batches. Their trailing
+    sections are written when the next section is begun or the writer is
+    closed. At most ``max_sections`` sections are held in memory.
+
+    If the writer validates projects, every section is validated as it is
+    begun or added, before anything of it is written. Rules on all files of a
+    section, e.g. that all or none have a position list, only cover the files
+    the section held when it was begun.
+    """
+
+    def __init__(
+        self,
+        file: Union[BinaryIO, PathLike, str],
+        writer: Optional[XVGIWriter] = None,
+        project_description: Optional[ProjectDescription] = None,
+        max_sections: int = 1024,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        """Construct a stream writer, first writing out the given project."""
+        self.writer = writer if writer is not None else XVGIWriter()
+        """ Writer providing the section serializers """
+
+        self.max_sections = max_sections
+        """ Number of sections collected before they are written """
+
+        self.buffer_size = buffer_size
+        """ Approximate number of characters collected before they are written """
+
+        if isinstance(file, (str, PathLike)):
+            self._file: BinaryIO = open(file, "wb")
+            self._owns_file = True
+        else:
+            self._file = file
+            self._owns_file = False
+
+        self._batch: List[str] = []
+        self._batch_length = 0
+        self._chunks: Optional[Iterator[str]] = None
+        self._pushed: Optional[_PushedSections] = None
+        self._open_type: Optional[str] = None
+        self._closed = False
+
+        # sections added later continue the numbering of the project
+        project_description = project_description or ProjectDescription()
+        self._next_indices = {
+            "VolumeSection": len(project_description.volumes.volumes),
+            "MeshSection": len(project_description.meshes.meshes),
+            "ReconstructionSection": len(
+                project_description.reconstructions.reconstructions
+            ),
+        }
+        for chunk in self.writer.iter_chunks(project_description):
+            self._add_chunk(chunk)
+
+    def __enter__(self) -> "XVGIStreamWriter":
+        """Enter the context, closing the writer on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ):
+        """Close the writer."""
+        self.close()
+
+    def begin_volume(self, volume: VolumeSection):
+        """Begin a volume; its files are added with ``add_volume_file``."""
+        # files already held by the volume come first
+        self._begin("VolumeSection", volume, "VolumeProjections")
+
+    def add_volume_file(self, volume_file: VolumeFileSection):
+        """Add a file to the volume begun last."""
+        self._push("VolumeSection", volume_file)
+
+    def begin_reconstruction(self, reconstruction: ReconstructionSection):
+        """Begin a reconstruction; projections are added with ``add_projection``."""
+        # projections already held by the reconstruction come first
+        self._begin("ReconstructionSection", reconstruction, "ProjectionFiles")
+
+    def add_projection(self, projection: ReconstructionProjectionFileSection):
+        """Add a projection to the reconstruction begun last."""
+        self._push("ReconstructionSection", projection)
+
+    def add_mesh(self, mesh: MeshSection):
+        """Write a mesh."""
+        self._check_open()
+        self.writer.check_valid(mesh)
+        self._finish()
+        for chunk in self._serialize("MeshSection", mesh):
+            self._add_chunk(chunk)
+
+    def flush(self):
+        """Write out all sections collected so far."""
+        if self._batch:
+            self.writer.write_output(self._file, "".join(self._batch).encode("utf-8"))
+            self._batch.clear()
+            self._batch_length = 0
+
+    def close(self):
+        """Write the trailing sections and everything collected so far."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._finish()
+            self.flush()
+        finally:
+            if self._owns_file:
+                self._file.close()
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("The stream writer is closed")
+
+    def _begin(self, section_type: str, section: object, files_attribute: str) -> None:
+        """Start serializing a section whose files are added later."""
+        self._check_open()
+        self.writer.check_valid(section)
+        self._finish()
+        pushed = _PushedSections(getattr(section, files_attribute))
+        self._chunks = self._serialize(
+            section_type, replace(section, **{files_attribute: pushed})  # type: ignore
+        )
+        self._pushed = pushed
+        self._open_type = section_type
+
+        # the section header, and the files it already held
+        self._add_chunk(next(self._chunks))
+        self._pull_pending()
+
+    def _push(self, section_type: str, section: object) -> None:
+        """Hand a file to the open section and write it."""
+        self._check_open()
+        if self._open_type != section_type:
+            raise ValueError(f"Begin a {section_type} before adding its files")
+        self.writer.check_valid(section)
+        cast(_PushedSections, self._pushed).pending.append(section)
+        self._pull_pending()
+
+    def _pull_pending(self) -> None:
+        """Serialize until the open section has used up all pushed files."""
+        chunks = cast(Iterator[str], self._chunks)
+        pushed = cast(_PushedSections, self._pushed)
+        while pushed.pending:
+            self._add_chunk(next(chunks))
+
+    def _finish(self) -> None:
+        """Write the trailing sections of the open section, if any."""
+        if self._chunks is None:
+            return
+        cast(_PushedSections, self._pushed).closed = True
+        for chunk in self._chunks:
+            self._add_chunk(chunk)
+        self._chunks = self._pushed = self._open_type = None
+
+    def _serialize(self, section_type: str, section: object) -> Iterator[str]:
+        """Serialize a section, numbered after the ones written before."""
+        holder = _HOLDER_TYPES[section_type]([section])
+        holder_name = type(holder).__name__
+        serializer = self.writer.make_serializer(holder_name)
+        # sections are serialized as they are added, never ahead of time
+        if hasattr(serializer, "executor"):
+            serializer.executor = None
+        setattr(
+            serializer,
+            INDEX_ATTRIBUTES[section_type],
+            self._next_indices[section_type],
+        )
+        self._next_indices[section_type] += 1
+
+        chunks = serializer.iter_serialize_object(holder_name, holder)
+        if self.writer.observer is not None:
+            chunks = observe_chunks(chunks, self.writer.observer)
+        return chunks
+
+    def _add_chunk(self, chunk: str) -> None:
+        """Collect a chunk, writing the collected ones once enough are there."""
+        self._batch.append(chunk)
+        self._batch_length += len(chunk)
+        if (
+            len(self._batch) >= self.max_sections
+            or self._batch_length >= self.buffer_size
+        ):
+            self.flush()
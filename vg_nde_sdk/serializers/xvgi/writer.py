@@ -1,16 +1,117 @@
 """XVGI format serializer."""
 
+import pickle  # noqa: S403
+import re
+import time
+from collections import Counter
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
-from typing import Callable, Mapping, TextIO
+from functools import partial
+from itertools import islice
+from os import PathLike
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TextIO,
+    Union,
+)
 
 from vg_nde_sdk.projects import ProjectDescription
-from vg_nde_sdk.serializers.xvgi import (
+from vg_nde_sdk.sections import (
+    MeshSection,
+    MeshSectionHolder,
+    ReconstructionSectionHolder,
+    VolumeSection,
+    VolumeSectionHolder,
+)
+from vg_nde_sdk.sections.fields import field_values
+from vg_nde_sdk.serializers.xvgi.fingerprint import field_fingerprint, text_fingerprint
+from vg_nde_sdk.serializers.xvgi.instrumentation import (
+    WriterObserver,
+    _encoded_size,
+    observe_chunks,
+)
+from vg_nde_sdk.serializers.xvgi.prepared import PreparedProject, prepare_project
+from vg_nde_sdk.serializers.xvgi.rewrite import SectionChanges, write_if_changed
+from vg_nde_sdk.serializers.xvgi.sections.base import SectionSerializerBase
+from vg_nde_sdk.serializers.xvgi.sections.cache import SectionCache
+from vg_nde_sdk.serializers.xvgi.sections.mesh_holder_serializer import (
     MeshHolderSerializer,
-    ReconstructionHolderSerializer,
-    SectionSerializerBase,
+)
+from vg_nde_sdk.serializers.xvgi.sections.volume_holder_serializer import (
     VolumeHolderSerializer,
 )
 
+if TYPE_CHECKING:
+    from vg_nde_sdk.sections import ReconstructionSection
+
+DEFAULT_BUFFER_SIZE = 1 << 20
+""" Approximate number of characters encoded and written at once """
+
+
+INDEX_ATTRIBUTES = {
+    "VolumeSection": "current_volume_index",
+    "MeshSection": "current_mesh_index",
+    "ReconstructionSection": "current_reconstruction_index",
+}
+""" Holder serializer attributes numbering the sections, by section type """
+
+_TOP_LEVEL_HEADER = re.compile(
+    rb"\[(VolumeSection|MeshSection|ReconstructionSection)(\d+)\]\s*$"
+)
+
+
+def _scan_next_indices(file: BinaryIO) -> Dict[str, int]:
+    """Find the next free index of each numbered section type in a file."""
+    next_indices: Dict[str, int] = Counter()
+    for line in file:
+        # only section headers are parsed
+        if not line.startswith(b"["):
+            continue
+        match = _TOP_LEVEL_HEADER.match(line)
+        if match:
+            section_type = match.group(1).decode("ascii")
+            next_indices[section_type] = max(
+                next_indices[section_type], int(match.group(2)) + 1
+            )
+    return next_indices
+
+
+def _next_batch(chunks: Iterator[str], batch_size: int) -> List[str]:
+    """Take up to batch_size chunks."""
+    return list(islice(chunks, batch_size))
+
+
+def _write_batch(
+    chunks: Iterator[str], batch_size: int, write: Callable[[bytes], None]
+) -> bool:
+    """Write up to batch_size chunks, returning whether any were left."""
+    batch = _next_batch(chunks, batch_size)
+    if batch:
+        write("".join(batch).encode("utf-8"))
+    return bool(batch)
+
+
+def _make_reconstruction_holder_serializer() -> SectionSerializerBase:
+    """Create a reconstruction holder serializer, importing it on first use."""
+    # the reconstruction sections and serializers are the largest modules,
+    # projects without reconstructions never import them
+    from vg_nde_sdk.serializers.xvgi.sections.reconstruction_holder_serializer import (
+        ReconstructionHolderSerializer,
+    )
+
+    return ReconstructionHolderSerializer()
+
 
 @dataclass
 class XVGIWriter:
@@ -20,24 +121,99 @@ class XVGIWriter:
         default_factory=lambda: {
             "MeshSectionHolder": MeshHolderSerializer,
             "VolumeSectionHolder": VolumeHolderSerializer,
-            "ReconstructionSectionHolder": ReconstructionHolderSerializer,
+            "ReconstructionSectionHolder": _make_reconstruction_holder_serializer,
         }
     )
     """ Maps sections to their according serializer class """
 
-    def dumps(self, project_description: ProjectDescription) -> str:
-        """Write out the XVGI serialization."""
-        result = ""
+    executor: Optional[Executor] = None
+    """
+    Executor serializing independent volumes and reconstructions concurrently.
+
+    Both thread and process pools can be used; for process pools the project
+    must be picklable. The output is the same as without an executor.
+    """
+
+    section_cache: Optional[SectionCache] = None
+    """
+    Cache for the bodies of meta info and ROI sections.
+
+    Sharing one cache between writers avoids serializing the same meta info
+    again for every project.
+    """
+
+    observer: Optional[WriterObserver] = None
+    """
+    Observer receiving the size and serialization time of every section, and
+    the size and time of every write to the output.
+    """
+
+    validate: bool = False
+    """
+    Whether to validate projects before writing them.
+
+    Projects with values not meeting the requirements of their sections, such
+    as volume files without a size, raise a ``ValidationError`` listing all
+    violations, before anything is written. Stream writers validate every
+    section as it is begun or added.
+    """
 
-        for section in vars(project_description).values():
+    def iter_chunks(self, project_description: ProjectDescription) -> Iterator[str]:
+        """Generate the XVGI serialization chunk by chunk."""
+        self.check_valid(project_description)
+        chunks = self._iter_sections(project_description)
+        if self.observer is None:
+            return chunks
+        return observe_chunks(chunks, self.observer)
+
+    def _iter_sections(self, project_description: ProjectDescription) -> Iterator[str]:
+        """Generate the XVGI serialization section by section."""
+        # Each chunk is one complete section block. Only the section currently
+        # being serialized is held in memory, which keeps the memory footprint
+        # independent of the number of sections in the project.
+        for section in field_values(project_description).values():
             section_name = type(section).__name__
-            serializer_cls = self.section_serializers.get(
-                section_name, SectionSerializerBase
-            )
-            serializer = serializer_cls()
-            result += serializer.serialize(section_name, vars(section))
+            serializer = self.make_serializer(section_name)
+            yield from serializer.iter_serialize_object(section_name, section)
+
+    def write_output(self, file: IO, data: Union[str, bytes]) -> None:
+        """Write data into file, reporting the write to the observer."""
+        if self.observer is None:
+            file.write(data)
+            return
+
+        start = time.perf_counter()
+        file.write(data)
+        duration = time.perf_counter() - start
+        size = len(data) if isinstance(data, bytes) else _encoded_size(data)
+        self.observer.output_written(size, start, duration)
+
+    def check_valid(self, obj: object) -> None:
+        """Raise for violations in obj, if validation is enabled."""
+        if not self.validate:
+            return
 
-        return result
+        from vg_nde_sdk.projects.validation import ValidationError, validate
+
+        violations = validate(obj)
+        if violations:
+            raise ValidationError(violations)
+
+    def make_serializer(self, section_name: str) -> SectionSerializerBase:
+        """Create the serializer for a top level section."""
+        serializer_cls = self.section_serializers.get(
+            section_name, SectionSerializerBase
+        )
+        serializer = serializer_cls()
+        if self.executor is not None and hasattr(serializer, "executor"):
+            serializer.executor = self.executor
+        if self.section_cache is not None and hasattr(serializer, "section_cache"):
+            serializer.section_cache = self.section_cache
+        return serializer
+
+    def dumps(self, project_description: ProjectDescription) -> str:
+        """Write out the XVGI serialization."""
+        return "".join(self.iter_chunks(project_description))
 
     def dump(
         self,
@@ -45,4 +221,187 @@ class XVGIWriter:
         file: TextIO,
     ):
         """Write out the XVGI serialization into a provided file."""
-        file.write(self.dumps(project_description))
+        for chunk in self.iter_chunks(project_description):
+            self.write_output(file, chunk)
+
+    def fingerprint(
+        self,
+        project_description: ProjectDescription,
+        fast: bool = False,
+    ) -> str:
+        """Digest of the XVGI serialization, for use as a cache key."""
+        # the digest is computed while serializing, without keeping the output
+        if not fast:
+            return text_fingerprint(self.iter_chunks(project_description))
+
+        # the fast digest is computed from the field values and the writer
+        # setup instead of the text; it differs from the text digest, and
+        # projects may get different digests for the same output, e.g. when
+        # holding the same volume files in a list or a file sequence, or
+        # sections sharing fewer of their values
+        from vg_nde_sdk import __version__
+
+        salt = ";".join(
+            [__version__]
+            + [
+                f"{name}={serializer.__module__}.{serializer.__qualname__}"
+                for name, serializer in self.section_serializers.items()
+            ]
+        )
+        try:
+            return field_fingerprint(project_description, salt.encode("utf-8"))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # e.g. generators of volume files, which are consumed here then
+            return text_fingerprint(self.iter_chunks(project_description))
+
+    def prepare(
+        self,
+        project_description: ProjectDescription,
+        slots: Mapping[str, str],
+    ) -> PreparedProject:
+        """Serialize a project once, leaving named slots for changing values."""
+        # the slots map names to dotted paths of the values, such as
+        # "reconstructions.reconstructions.0.ObjectNameInScene"
+        return prepare_project(self.dumps, project_description, slots)
+
+    def dump_bytes(
+        self,
+        project_description: ProjectDescription,
+        file: BinaryIO,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        """Write out the XVGI serialization UTF-8 encoded into a binary file."""
+        self._dump_chunks(self.iter_chunks(project_description), file, buffer_size)
+
+    def _dump_chunks(
+        self, chunks: Iterator[str], file: BinaryIO, buffer_size: int
+    ) -> None:
+        """Write chunks UTF-8 encoded into a binary file."""
+        # chunks are collected until about buffer_size characters are reached,
+        # then encoded and written with a single call
+        batch: List[str] = []
+        batch_length = 0
+        for chunk in chunks:
+            batch.append(chunk)
+            batch_length += len(chunk)
+            if batch_length >= buffer_size:
+                self.write_output(file, "".join(batch).encode("utf-8"))
+                batch.clear()
+                batch_length = 0
+        if batch:
+            self.write_output(file, "".join(batch).encode("utf-8"))
+
+    def write_path(
+        self,
+        project_description: ProjectDescription,
+        path: Union[PathLike, str],
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        """Write out the XVGI serialization into a UTF-8 file at path."""
+        # invalid projects raise before the file is opened
+        chunks = self.iter_chunks(project_description)
+        with open(path, "wb") as file:
+            self._dump_chunks(chunks, file, buffer_size)
+
+    def write_if_changed(
+        self,
+        project_description: ProjectDescription,
+        path: Union[PathLike, str],
+    ) -> SectionChanges:
+        """Write out the XVGI serialization only if it differs from the file."""
+        # an unchanged file is not touched at all and keeps its modification
+        # time, a changed one is replaced atomically
+        return write_if_changed(
+            self.iter_chunks(project_description), path, self.observer
+        )
+
+    def append(
+        self,
+        path: Union[PathLike, str],
+        sections: Iterable[Union[VolumeSection, MeshSection, "ReconstructionSection"]],
+    ):
+        """Append volume, mesh or reconstruction sections to an XVGI file."""
+        grouped: Dict[str, List[Any]] = {name: [] for name in INDEX_ATTRIBUTES}
+        for section in sections:
+            section_type = type(section).__name__
+            if section_type not in grouped:
+                raise ValueError(f"Cannot append sections of type {section_type}")
+            grouped[section_type].append(section)
+
+        holders = {
+            "VolumeSection": VolumeSectionHolder(grouped["VolumeSection"]),
+            "MeshSection": MeshSectionHolder(grouped["MeshSection"]),
+            "ReconstructionSection": ReconstructionSectionHolder(
+                grouped["ReconstructionSection"]
+            ),
+        }
+        for holder in holders.values():
+            self.check_valid(holder)
+
+        with open(path, "rb+") as file:
+            # the existing content is only read, new sections continue the
+            # numbering of the existing ones
+            next_indices = _scan_next_indices(file)
+            file.seek(0, 2)
+            if file.tell() > 0:
+                file.seek(-1, 2)
+                if file.read(1) != b"\n":
+                    self.write_output(file, b"\n")
+
+            for section_type, holder in holders.items():
+                holder_name = type(holder).__name__
+                serializer = self.make_serializer(holder_name)
+                setattr(
+                    serializer,
+                    INDEX_ATTRIBUTES[section_type],
+                    next_indices[section_type],
+                )
+                chunks = serializer.iter_serialize_object(holder_name, holder)
+                if self.observer is not None:
+                    chunks = observe_chunks(chunks, self.observer)
+                text = "".join(chunks)
+                if text:
+                    self.write_output(file, text.encode("utf-8"))
+
+    async def aiter_chunks(
+        self,
+        project_description: ProjectDescription,
+        batch_size: int = 64,
+    ) -> AsyncIterator[str]:
+        """Generate the XVGI serialization chunk by chunk without blocking."""
+        # the chunks are serialized in batches on the default executor of the
+        # event loop, the next batch is only serialized when the consumer asks
+        # for it
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        chunks = self.iter_chunks(project_description)
+        while True:
+            batch = await loop.run_in_executor(None, _next_batch, chunks, batch_size)
+            if not batch:
+                return
+            for chunk in batch:
+                yield chunk
+
+    async def adump(
+        self,
+        project_description: ProjectDescription,
+        path: Union[PathLike, str],
+        batch_size: int = 64,
+    ):
+        """Write out the XVGI serialization into a UTF-8 file without blocking."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        chunks = self.iter_chunks(project_description)
+        file: BinaryIO = await loop.run_in_executor(None, open, path, "wb")
+        try:
+            # serializing and writing a batch happen together on the executor,
+            # so a slow disk holds back serialization
+            write = partial(self.write_output, file)
+            while await loop.run_in_executor(
+                None, _write_batch, chunks, batch_size, write
+            ):
+                pass
+        finally:
+            await loop.run_in_executor(None, file.close)